@@ -0,0 +1,82 @@
+"""
+Micro-Benchmark für die Bewegung der Autos.
+
+Vergleicht die bisherige Schleife aus CarManager.update_cars (jedes Auto
+einzeln bewegen, list.remove beim Verlassen des Bereichs) mit dem
+vektorisierten Schritt aus modules/car_simulation.py. Verlassen Autos den
+Bereich, wird jeweils direkt ein neues gespawnt, die Anzahl bleibt konstant.
+
+Start aus dem Projektverzeichnis:
+    python -m benchmarks.car_simulation_benchmark
+"""
+import random
+import timeit
+from types import SimpleNamespace
+
+from modules.car_simulation import CarSimulation
+
+LEVEL_WIDTH = 12
+DESPAWN_DISTANCE = LEVEL_WIDTH * 3
+FRAME_DT = 1 / 60
+REPEATS = 50
+
+
+def random_car_state(lane):
+    direction = random.choice((-1, 1))
+    return random.uniform(-DESPAWN_DISTANCE, DESPAWN_DISTANCE), float(lane), direction, random.uniform(1.5, 5)
+
+
+def legacy_update(cars):
+    """Bisheriges Verfahren aus CarManager.update_cars."""
+    for car in cars[:]:
+        car.x += car.direction * car.speed * FRAME_DT
+        if abs(car.x) > DESPAWN_DISTANCE:
+            cars.remove(car)
+            x, z, direction, speed = random_car_state(car.z)
+            cars.append(SimpleNamespace(x=-direction * DESPAWN_DISTANCE, z=z, direction=direction, speed=speed))
+
+
+def simulation_update(simulation, sync_entities):
+    culled_slots = simulation.step(FRAME_DT, DESPAWN_DISTANCE)
+    for slot in culled_slots.tolist():
+        car = simulation.entities[slot]
+        simulation.remove(slot)
+        x, z, direction, speed = random_car_state(car.z)
+        simulation.add(car, -direction * DESPAWN_DISTANCE, z, direction, speed)
+
+    if sync_entities:
+        live_slots = simulation.live_slots()
+        entities = simulation.entities
+        for slot, x in zip(live_slots.tolist(), simulation.x[live_slots].tolist()):
+            entities[slot].x = x
+
+
+def build_cars(car_count):
+    cars = []
+    simulation = CarSimulation()
+    for index in range(car_count):
+        x, z, direction, speed = random_car_state(index % 60)
+        cars.append(SimpleNamespace(x=x, z=z, direction=direction, speed=speed))
+        simulation.add(SimpleNamespace(x=x, z=z), x, z, direction, speed)
+    return cars, simulation
+
+
+def time_per_frame(function):
+    return min(timeit.repeat(function, number=REPEATS, repeat=5)) / REPEATS * 1e6
+
+
+def main():
+    random.seed(1)
+    print(f"{'Autos':>6} | {'Schleife alt':>13} {'NumPy-Schritt':>14} {'+ Entity-Sync':>14}")
+    for car_count in (50, 200, 1000, 5000, 20000):
+        cars, simulation = build_cars(car_count)
+
+        legacy = time_per_frame(lambda: legacy_update(cars))
+        step_only = time_per_frame(lambda: simulation_update(simulation, False))
+        with_sync = time_per_frame(lambda: simulation_update(simulation, True))
+
+        print(f"{car_count:>6} | {legacy:>10.1f} µs {step_only:>11.1f} µs {with_sync:>11.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Micro-Benchmark für das Aufräumen alter Welt-Objekte.
+
+Vergleicht den bisherigen Vollscan (Liste kopieren, jedes Objekt prüfen,
+list.remove) mit den Z-sortierten Buckets aus modules/z_ordered_buckets.py.
+
+Start aus dem Projektverzeichnis:
+    python -m benchmarks.cleanup_benchmark
+"""
+import timeit
+from types import SimpleNamespace
+
+from modules.z_ordered_buckets import ZOrderedBuckets
+
+OBJECTS_PER_LANE = 30
+REPEATS = 200
+
+
+def legacy_cleanup(objects, threshold):
+    """Bisheriges Verfahren aus WorldGenerator.cleanup_old_objects."""
+    removed = 0
+    for obj in objects[:]:
+        if obj.z < threshold:
+            objects.remove(obj)
+            removed += 1
+    return removed
+
+
+def build_world(lane_count):
+    objects = [
+        SimpleNamespace(z=float(lane))
+        for lane in range(lane_count)
+        for _ in range(OBJECTS_PER_LANE)
+    ]
+    buckets = ZOrderedBuckets()
+    for obj in objects:
+        buckets.append(obj, obj.z)
+    return objects, buckets
+
+
+def advance_one_lane(objects, buckets, state):
+    """Wie ein Schritt des Spielers: vorne kommt eine Lane hinzu, hinten fällt eine weg."""
+    new_lane = state['next_lane']
+    state['next_lane'] += 1
+    for _ in range(OBJECTS_PER_LANE):
+        obj = SimpleNamespace(z=float(new_lane))
+        if objects is not None:
+            objects.append(obj)
+        else:
+            buckets.append(obj, obj.z)
+    threshold = float(new_lane - state['lane_count'] + 1)
+    if objects is not None:
+        return legacy_cleanup(objects, threshold)
+    return len(buckets.pop_behind(threshold))
+
+
+def time_per_call(function):
+    return min(timeit.repeat(function, number=REPEATS, repeat=5)) / REPEATS * 1e6
+
+
+def main():
+    print(f"{'Lanes':>6} {'Objekte':>8} | {'Leerlauf alt':>13} {'Leerlauf neu':>13} | {'1 Lane alt':>11} {'1 Lane neu':>11}")
+    for lane_count in (50, 150, 500, 1500):
+        objects, buckets = build_world(lane_count)
+
+        # Leerlauf: nichts ist hinter der Schwelle
+        idle_legacy = time_per_call(lambda: legacy_cleanup(objects, -1.0))
+        idle_buckets = time_per_call(lambda: buckets.pop_behind(-1.0))
+
+        # Echter Cleanup: pro Aufruf kommt eine Lane hinzu und genau eine fällt hinter die Schwelle
+        legacy_state = {'next_lane': lane_count, 'lane_count': lane_count}
+        bucket_state = {'next_lane': lane_count, 'lane_count': lane_count}
+        one_lane_legacy = time_per_call(lambda: advance_one_lane(objects, None, legacy_state))
+        one_lane_buckets = time_per_call(lambda: advance_one_lane(None, buckets, bucket_state))
+
+        print(
+            f"{lane_count:>6} {len(objects):>8} | "
+            f"{idle_legacy:>10.2f} µs {idle_buckets:>10.2f} µs | "
+            f"{one_lane_legacy:>8.2f} µs {one_lane_buckets:>8.2f} µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
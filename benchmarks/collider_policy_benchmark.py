@@ -0,0 +1,76 @@
+"""
+Benchmark für die Collider-Richtlinie.
+
+Baut dieselbe Welt einmal wie bisher (jedes Tile und jeder Baum bekommt
+sofort einen Box-Collider) und einmal mit der Standard-Richtlinie aus
+modules/collider_policy.py (Tiles ohne Collider, Bäume erst bei der ersten
+Abfrage). Gezählt werden die gebauten Collider pro Lane und die Zeit für
+den Aufbau einer Lane. Benötigt Ursina, läuft ohne Fenster.
+
+Start aus dem Projektverzeichnis:
+    python -m benchmarks.collider_policy_benchmark
+"""
+from pathlib import Path
+
+from ursina import *
+
+application.asset_folder = Path(__file__).resolve().parent.parent
+app = Ursina(window_type='none')
+
+from modules.game_settings import GameSettings
+from modules.model_metadata_cache import ModelMetadataCache
+from modules.world_generator import WorldGenerator
+
+LANE_COUNT = 60
+WORLD_SEED = 11
+EAGER_POLICY = {"tile": "eager", "tree": "eager", "car": "eager"}
+
+
+def build_world(settings, metadata_cache):
+    world_generator = WorldGenerator(settings, metadata_cache)
+    world_generator.initialize_model_bounds()
+    setup_times = []
+    for index in range(LANE_COUNT):
+        world_generator.create_lane(index)
+        setup_times.append(world_generator.last_lane_setup_ms)
+    return world_generator, setup_times
+
+
+def count_colliders(world_generator):
+    entities = list(world_generator.tiles) + list(world_generator.trees)
+    return sum(1 for entity in entities if entity.collider is not None)
+
+
+def run(label, settings, metadata_cache):
+    world_generator, setup_times = build_world(settings, metadata_cache)
+    colliders = count_colliders(world_generator)
+    setup_times.sort()
+    print(
+        f"{label:<22} Collider {colliders:5d} ({colliders / LANE_COUNT:5.1f} pro Lane)   "
+        f"Aufbau pro Lane: Mittel {sum(setup_times) / LANE_COUNT:6.2f} ms, "
+        f"Median {setup_times[LANE_COUNT // 2]:6.2f} ms"
+    )
+    world_generator.reset()
+
+
+def main():
+    settings_manager = GameSettings()
+    metadata_cache = ModelMetadataCache()
+    # Ohne Zusammenfassen und Instancing: jedes Tile und jeder Baum ist eine eigene Entity wie bisher
+    base_settings = dict(
+        settings_manager.game_settings,
+        world_seed=WORLD_SEED,
+        merge_static_geometry=False,
+        instanced_rendering=False
+    )
+
+    # Modelle einmal laden, damit beide Läufe mit warmem Cache starten
+    build_world(dict(base_settings, collider_policy=EAGER_POLICY), metadata_cache)[0].reset()
+
+    print(f"{LANE_COUNT} Lanes, Seed {WORLD_SEED}")
+    run("Alle sofort (bisher)", dict(base_settings, collider_policy=EAGER_POLICY), metadata_cache)
+    run("Richtlinie (Standard)", dict(base_settings, collider_policy={}), metadata_cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark für den Rundenverlauf.
+
+Schreibt eine große Anzahl zufälliger Runden über RunHistory in eine
+temporäre Datenbank (wie bei den automatisierten Dauertests) und misst
+danach die Bestenlisten-, Einstellungs- und Zeitraum-Abfragen.
+
+Start aus dem Projektverzeichnis:
+    python -m benchmarks.run_history_benchmark [Anzahl Runden]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+from modules.run_history import RunHistory
+
+RUN_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+SETTINGS_HASHES = [f"{index:016x}" for index in range(8)]
+DEATH_CAUSES = ("car", "restart", "quit")
+REPEATS = 200
+
+
+def measure(label, query):
+    query()
+    seconds = timeit.timeit(query, number=REPEATS) / REPEATS
+    print(f"  {label:<28} {seconds * 1e3:8.3f} ms")
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    history = RunHistory(os.path.join(directory, "run_history.db"), batch_size=4096, flush_interval=0.5)
+
+    now = time.time()
+    started = time.perf_counter()
+    record_seconds = 0.0
+    for index in range(RUN_COUNT):
+        finished_at = now - (RUN_COUNT - index) * 60.0
+        record_started = time.perf_counter()
+        history.record_run(
+            random.expovariate(1 / 40.0),
+            random.uniform(5, 300),
+            random.getrandbits(63),
+            random.choice(SETTINGS_HASHES),
+            random.choice(DEATH_CAUSES),
+            finished_at
+        )
+        record_seconds += time.perf_counter() - record_started
+    history.close()
+    total_seconds = time.perf_counter() - started
+
+    print(f"{RUN_COUNT} Runden")
+    print(f"  record_run pro Runde         {record_seconds / RUN_COUNT * 1e6:8.3f} µs")
+    print(f"  gesamt inkl. Schreiben       {total_seconds:8.3f} s")
+
+    history = RunHistory(os.path.join(directory, "run_history.db"))
+    print(f"  gespeichert                  {history.run_count()}")
+    measure("Top 10", lambda: history.top_runs(10))
+    measure("Top 10 je Einstellungen", lambda: history.top_runs(10, SETTINGS_HASHES[3]))
+    measure("Letzter Tag", lambda: history.runs_between(now - 86400, now))
+    measure("Bester Score", lambda: history.best_score(SETTINGS_HASHES[5]))
+    history.close()
+
+
+if __name__ == "__main__":
+    main()
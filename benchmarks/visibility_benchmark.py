@@ -0,0 +1,162 @@
+"""
+Benchmark für die Sichtbarkeitsprüfung.
+
+Vergleicht die bisherige Prüfung aus VisibilityManager.update (jede Entity
+einzeln gegen das Kamera-Viereck, alle 0,1 Sekunden) mit dem Abgleich pro
+Gruppe aus modules/bucket_visibility.py (X-Abschnitt pro Zeile, jeden
+Frame, unveränderte Buckets werden übersprungen). Die Welt besteht aus
+Lanes mit Tiles und Bäumen, der Spieler läuft gleichmäßig vorwärts, vorne
+kommen neue Lanes hinzu, hinten fallen alte weg. Simuliert werden 60 Frames
+pro Sekunde. Die Entities
+sind einfache Objekte, gemessen wird also nur der Python-Aufwand der
+Prüfung, nicht das Umschalten in Panda3D. Die Anzahl der Umschaltungen und
+der am Ende eingeblendeten Entities wird daher mit ausgegeben.
+
+Start aus dem Projektverzeichnis:
+    python -m benchmarks.visibility_benchmark
+"""
+import math
+import random
+import time
+from types import SimpleNamespace
+
+from modules.bucket_visibility import BucketVisibility, FootprintRows
+from modules.z_ordered_buckets import ZOrderedBuckets
+
+LANE_LENGTH = 2.7
+LANE_COUNT = 100
+LANES_BEHIND = 10
+TILES_PER_LANE = 15
+FRAME_DT = 1 / 60
+UPDATE_INTERVAL = 0.1
+SECONDS_PER_LANE = 0.3
+FRAMES = 1800
+MARGIN = 3.0
+
+
+class CountingEntity(SimpleNamespace):
+    """Zählt, wie oft enabled tatsächlich umgeschaltet wird."""
+    toggles = 0
+
+    def __setattr__(self, name, value):
+        if name == 'enabled':
+            CountingEntity.toggles += 1
+        super().__setattr__(name, value)
+
+
+def build_lane(tiles, trees, lane):
+    """Neue Entities sind wie frisch aus dem Pool eingeblendet."""
+    z = lane * LANE_LENGTH
+    for column in range(TILES_PER_LANE):
+        tiles.append(CountingEntity(x=(column - TILES_PER_LANE // 2) * 2.0, z=z, enabled=True), z)
+    if random.random() < 0.5:
+        for _ in range(random.randint(3, 6)):
+            trees.append(CountingEntity(x=random.randint(-12, 12), z=z, enabled=True), z)
+
+
+def advance_world(tiles, trees, next_lane, player_z):
+    """Baut Lanes vor dem Spieler und entfernt die hinter ihm, wie der WorldGenerator."""
+    while next_lane * LANE_LENGTH < player_z + (LANE_COUNT - LANES_BEHIND) * LANE_LENGTH:
+        build_lane(tiles, trees, next_lane)
+        next_lane += 1
+    threshold = player_z - LANES_BEHIND * LANE_LENGTH
+    tiles.pop_behind(threshold)
+    trees.pop_behind(threshold)
+    return next_lane
+
+
+def footprint_at(player_z):
+    """Bodenbereich der schräg von hinten blickenden Kamera (Trapez, schmaler als eine Lane)."""
+    return [(-6, player_z - 8), (6, player_z - 8), (16, player_z + 30), (-16, player_z + 30)]
+
+
+def footprint_edges(footprint):
+    """Bisheriges Verfahren aus VisibilityManager.get_footprint_edges."""
+    area = sum(
+        footprint[i][0] * footprint[i - 3][1] - footprint[i - 3][0] * footprint[i][1]
+        for i in range(4)
+    )
+    orientation = 1 if area > 0 else -1
+    edges = []
+    for i in range(4):
+        start_x, start_z = footprint[i]
+        end_x, end_z = footprint[(i + 1) % 4]
+        normal_x = -(end_z - start_z) * orientation
+        normal_z = (end_x - start_x) * orientation
+        length = math.hypot(normal_x, normal_z)
+        normal_x /= length
+        normal_z /= length
+        edges.append((normal_x, normal_z, normal_x * start_x + normal_z * start_z))
+    return edges
+
+
+def legacy_update(categories, footprint, footprint_changed):
+    """Bisheriges Verfahren aus VisibilityManager.update."""
+    if not footprint_changed:
+        return
+    edges = footprint_edges(footprint)
+    for buckets, extent in categories:
+        margin = MARGIN + extent
+        for entity in buckets:
+            x, z = entity.x, entity.z
+            is_visible = all(
+                normal_x * x + normal_z * z >= offset - margin
+                for normal_x, normal_z, offset in edges
+            )
+            if entity.enabled != is_visible:
+                entity.enabled = is_visible
+
+
+def bucket_update(categories, footprint, footprint_changed):
+    """Wie VisibilityManager.update mit dem Zähler der ZOrderedBuckets als Stand der Quelle."""
+    if footprint_changed:
+        bucket_update.footprint_rows = FootprintRows(footprint)
+    footprint_rows = bucket_update.footprint_rows
+    for buckets, extent, bucket_visibility in categories:
+        if not footprint_changed and buckets.version == bucket_visibility.source_version:
+            continue
+        bucket_visibility.source_version = buckets.version
+        margin = MARGIN + extent
+        bucket_visibility.update(buckets.buckets, lambda z: footprint_rows.span(z, margin))
+
+
+def run(label, update, make_categories):
+    random.seed(1)
+    tiles, trees = ZOrderedBuckets(), ZOrderedBuckets()
+    next_lane = advance_world(tiles, trees, 0, 0.0)
+    categories = make_categories(tiles, trees)
+    CountingEntity.toggles = 0
+    durations = []
+    time_since_update = UPDATE_INTERVAL
+    footprint = None
+    for frame in range(FRAMES):
+        player_z = frame * FRAME_DT / SECONDS_PER_LANE * LANE_LENGTH
+        next_lane = advance_world(tiles, trees, next_lane, player_z)
+        time_since_update += FRAME_DT
+        started = time.perf_counter()
+        footprint_changed = time_since_update >= UPDATE_INTERVAL
+        if footprint_changed:
+            time_since_update = 0.0
+            footprint = footprint_at(player_z)
+        update(categories, footprint, footprint_changed)
+        durations.append(time.perf_counter() - started)
+    enabled = sum(entity.enabled for entity in tiles) + sum(entity.enabled for entity in trees)
+    print(
+        f"{label:<26} pro Frame Mittel {sum(durations) / len(durations) * 1e3:6.3f} ms   "
+        f"Max {max(durations) * 1e3:6.3f} ms   Umschaltungen {CountingEntity.toggles:5d}   "
+        f"eingeblendet {enabled} von {len(tiles) + len(trees)}"
+    )
+
+
+def main():
+    print(f"{LANE_COUNT} Lanes, {LANE_COUNT * TILES_PER_LANE} Tiles, {FRAMES} Frames")
+    run("Pro Entity (bisher)", legacy_update, lambda tiles, trees: [(tiles, 4.0), (trees, 1.0)])
+    run(
+        "Pro Gruppe mit X-Abschnitt",
+        bucket_update,
+        lambda tiles, trees: [(tiles, 4.0, BucketVisibility()), (trees, 1.0, BucketVisibility())]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,13 +11,30 @@ app = Ursina()
 from modules.game_settings import GameSettings
 from modules.highscore_manager import HighscoreManager
 from modules.world_generator import WorldGenerator
+from modules.world_build_scheduler import WorldBuildScheduler
 from modules.car_manager import CarManager
 from modules.ui_manager import UIManager
 from modules.player import Player
+from modules.model_metadata_cache import ModelMetadataCache
+from modules.game_logging import setup_logging
+from modules.visibility_manager import VisibilityManager
+from modules.fixed_timestep import FixedTimestep, apply_render_fps_limit
+from modules.input_buffer import InputBuffer
+from modules.tween_scheduler import TweenScheduler
+from modules.run_history import RunHistory, settings_hash
 
 # Initialisiere Manager (keine Entities)
 settings_manager = GameSettings()
-highscore_manager = HighscoreManager()
+log_handler = setup_logging(settings_manager.game_settings)
+highscore_manager = HighscoreManager(
+    save_interval=settings_manager.game_settings.get("highscore_save_interval", 2.0)
+)
+model_metadata_cache = ModelMetadataCache()
+run_history = RunHistory(
+    settings_manager.game_settings.get("run_history_file", "assets/run_history.db"),
+    settings_manager.game_settings.get("run_history_batch_size", 256),
+    settings_manager.game_settings.get("run_history_flush_interval", 1.0)
+)
 
 # Einstellungen aus JSON
 tile_size = settings_manager.game_settings["tile_size"]
@@ -26,12 +43,24 @@ max_x_tiles = level_width // 2
 start_z = 0
 min_car_speed = settings_manager.game_settings["min_car_speed"]
 max_car_speed = settings_manager.game_settings["max_car_speed"]
-car_spawn_chance = settings_manager.game_settings["car_spawn_chance"]
 game_paused = False
 is_game_over = False
 move_cooldown = settings_manager.game_settings["move_cooldown"]
 last_move_time = 0
 
+# Rundenverlauf: Beginn der Runde und Regeln, unter denen sie gespielt wird
+run_settings_hash = settings_hash(settings_manager.game_settings)
+run_start_time = time.time()
+run_recorded = False
+
+# Tasten aus dem Cooldown werden gepuffert statt verworfen
+MOVE_KEYS = ('w', 'a', 's', 'd')
+input_buffer = InputBuffer(settings_manager.game_settings)
+
+# Spiellogik in festen Ticks, Bildrate davon unabhängig
+simulation_clock = FixedTimestep(settings_manager.game_settings)
+apply_render_fps_limit(settings_manager.display_settings.get("render_fps_limit"))
+
 # Fenster konfigurieren
 window.fullscreen = True
 window.borderless = settings_manager.display_settings.get("window_borderless", False)
@@ -52,10 +81,29 @@ mouse.visible = False
 mouse.enabled = False
 
 # JETZT erst die Spielkomponenten initialisieren (nach Ursina)
-world_generator = WorldGenerator(settings_manager.game_settings)
-car_manager = CarManager(settings_manager.game_settings, settings_manager.car_settings)
+world_generator = WorldGenerator(settings_manager.game_settings, model_metadata_cache)
+world_build_scheduler = WorldBuildScheduler(world_generator, settings_manager.game_settings)
+car_manager = CarManager(settings_manager.game_settings, settings_manager.car_settings, model_metadata_cache)
 ui_manager = UIManager(highscore_manager)
-player = Player(start_position=(0, 1.0, start_z))
+# Alle Animationen laufen über einen gemeinsamen Tween-Scheduler
+tween_scheduler = TweenScheduler(settings_manager.game_settings)
+player = Player(
+    start_position=(0, 1.0, start_z),
+    metadata_cache=model_metadata_cache,
+    tween_scheduler=tween_scheduler
+)
+
+# Sichtbarkeit: Objekte außerhalb des Kamerabilds ausblenden
+visibility_manager = VisibilityManager(settings_manager.game_settings)
+visibility_manager.register(
+    'tiles', lambda: world_generator.tiles.buckets, extent=4.0,
+    version=lambda: world_generator.tiles.version
+)
+visibility_manager.register(
+    'trees', world_generator.get_rendered_tree_buckets, extent=1.0,
+    version=lambda: world_generator.trees.version
+)
+visibility_manager.register('cars', car_manager.get_rendered_car_lanes, extent=2.0, moving=True)
 
 # Highscore-UI Variablen
 current_score = 0
@@ -108,6 +156,7 @@ def show_pause(game_over=False):
     global game_paused, selected_index, is_game_over
     game_paused = True
     is_game_over = game_over
+    highscore_manager.flush()
     
     if game_over:
         pause_title.text = "GAME OVER"
@@ -118,6 +167,7 @@ def show_pause(game_over=False):
     
     pause_overlay.enabled = True
     pause_menu.enabled = True
+    input_buffer.clear()
     selected_index = 0
     update_button_highlight()
 
@@ -129,9 +179,27 @@ def hide_pause():
     pause_menu.enabled = False
     pause_overlay.enabled = False
 
+def record_run(death_cause):
+    global run_recorded
+    if run_recorded:
+        return
+    run_history.record_run(
+        current_score,
+        time.time() - run_start_time,
+        world_generator.lane_layouts.seed,
+        run_settings_hash,
+        death_cause
+    )
+    run_recorded = True
+
 def restart_game():
-    global is_game_over, game_paused, current_score, highscore
+    global is_game_over, game_paused, current_score, highscore, run_start_time, run_recorded
     
+    # Abgebrochene Runde festhalten, bevor Seed und Score zurückgesetzt werden
+    record_run('restart')
+    run_start_time = time.time()
+    run_recorded = False
+
     pause_overlay.enabled = False
     pause_menu.enabled = False
     is_game_over = False
@@ -150,6 +218,7 @@ def restart_game():
     highscore_text.text = f"Highscore: {highscore:.1f} m"
 
     # Player reset
+    tween_scheduler.clear()
     player.position = (0, 0.5, start_z)
     player.rotation_y = 180
     player.scale = player.base_scale
@@ -157,28 +226,19 @@ def restart_game():
 
     # Aufräumen
     car_manager.cleanup()
+    simulation_clock.reset()
+    input_buffer.clear()
     
     # Welt zurücksetzen
-    for tile in world_generator.tiles:
-        destroy(tile)
-    world_generator.tiles.clear()
-    
-    for tree in world_generator.trees:
-        destroy(tree)
-    world_generator.trees.clear()
-    
-    world_generator.lanes.clear()
-    world_generator.occupied_tile_positions.clear()
+    world_generator.reset()
+    visibility_manager.reset()
 
     # Neue Welt erstellen
-    world_generator.create_backward_lanes(5)
-    for i in range(15):
-        world_generator.create_lane(start_z + i)
-    world_generator.extend_level(5)
+    world_build_scheduler.start(start_z)
 
 # Input-Funktion
 def input(key):
-    global selected_index, last_move_time
+    global selected_index
 
     if game_paused:
         if key == 'up arrow':
@@ -191,6 +251,7 @@ def input(key):
             if selected_index == 0:
                 restart_game()
             elif selected_index == 1:
+                record_run('quit')
                 application.quit()
         elif key == 'escape':
             hide_pause()
@@ -199,59 +260,58 @@ def input(key):
     if game_paused or is_game_over:
         return
 
-    if time.time() - last_move_time < move_cooldown:
-        return
-
     if key == 'escape':
         show_pause()
         return
 
-    moved = False
-    old_position = player.position
-    
+    # Bewegungstasten puffern, ausgeführt wird sofort oder sobald der Cooldown es erlaubt
+    if key in MOVE_KEYS:
+        input_buffer.push(key, time.time())
+        dispatch_buffered_input()
+
+def dispatch_buffered_input():
+    if game_paused or is_game_over:
+        return
+
+    now = time.time()
+    while now - last_move_time >= move_cooldown:
+        buffered_input = input_buffer.pop(now)
+        if buffered_input is None:
+            return
+        key, pressed_at = buffered_input
+        if try_move(key):
+            input_buffer.record_dispatch(pressed_at, now)
+
+def try_move(key):
+    global last_move_time
+
+    # Zielfeld und Blickrichtung zur Taste bestimmen
     if key == 'w':
-        player.z += tile_size
-        player.face_direction(0)
-        player.hop()
-        world_generator.extend_level(1)
-        moved = True
+        offset_x, offset_z, heading = 0, tile_size, 0
     elif key == 's' and player.z - tile_size >= start_z:
-        player.z -= tile_size
-        player.face_direction(180)
-        player.hop()
-        moved = True
+        offset_x, offset_z, heading = 0, -tile_size, 180
     elif key == 'a' and player.x - tile_size >= -max_x_tiles:
-        player.x -= tile_size
-        player.face_direction(-90)
-        player.hop()
-        moved = True
+        offset_x, offset_z, heading = -tile_size, 0, -90
     elif key == 'd' and player.x + tile_size <= max_x_tiles:
-        player.x += tile_size
-        player.face_direction(90)
-        player.hop()
-        moved = True
-
-    if moved:
-        # Kollisionsprüfung mit Bäumen
-        collision_occurred = False
-        for tree in world_generator.trees:
-            if abs(tree.x) <= max_x_tiles + 0.5:
-                if distance(player.position, tree.position) < 1.5:
-                    if player.intersects(tree).hit:
-                        collision_occurred = True
-                        break
-        
-        if collision_occurred:
-            player.position = old_position
-            player.color = color.red
-            invoke(setattr, player, 'color', color.white, delay=0.2)
-        else:
-            last_move_time = time.time()
+        offset_x, offset_z, heading = tile_size, 0, 90
+    else:
+        return False
+
+    # Baum auf dem Zielfeld: Bewegung gar nicht erst starten
+    if world_generator.is_position_blocked(player.x + offset_x, player.z + offset_z, player.get_footprint()):
+        player.flash_color(color.red)
+        return False
+
+    player.x += offset_x
+    player.z += offset_z
+    player.face_direction(heading)
+    player.hop()
+    last_move_time = time.time()
+    return True
 
 # Update-Funktion
 def update():
-    global current_score, highscore
-
+    world_build_scheduler.update(player.z)
     world_generator.cleanup_old_objects(player.z)
 
     if not game_paused:
@@ -260,6 +320,25 @@ def update():
         camera.rotation_x = 60
         camera.rotation_y = -45
 
+    tween_scheduler.update(time.dt)
+
+    # Spiellogik in festen Ticks, unabhängig von der Bildrate
+    for _ in range(simulation_clock.advance(time.dt)):
+        game_tick(simulation_clock.tick_dt)
+
+    # Autos zwischen den letzten beiden Ticks darstellen
+    car_manager.sync_car_visuals(simulation_clock.alpha)
+
+    # Zuletzt, damit neu gebaute Tiles und gespawnte Autos noch in diesem Frame stimmen
+    visibility_manager.update()
+
+# Ein Tick der Spiellogik
+def game_tick(dt):
+    global current_score, highscore
+
+    # Gepufferte Bewegungen, deren Cooldown abgelaufen ist
+    dispatch_buffered_input()
+
     # Score-Logik
     distance_traveled = player.z - start_z
     
@@ -281,25 +360,20 @@ def update():
             highscore_manager.save_highscore(highscore)
 
     # Autos bewegen
-    car_manager.update_cars()
+    car_manager.update_cars(dt)
 
-    # Auto-Spawning
-    if random.random() < car_spawn_chance:
-        road_lane_indices = [l['index'] for l in world_generator.lanes if l['type'] == 'road']
-        if road_lane_indices:
-            car_manager.spawn_car(random.choice(road_lane_indices), world_generator.lanes)
+    # Auto-Spawning nach Zeitplan der Lanes
+    car_manager.update_spawns(world_generator.lanes, dt)
 
     # Auto-Kollision
-    if car_manager.check_collision_with_player(player):
+    if car_manager.check_collision_with_player(player, world_build_scheduler.lane_index_at(player.z)):
         player.color = color.black
+        record_run('car')
         show_pause(game_over=True)
         
 # Start - WICHTIG: Model-Bounds initialisieren BEVOR create_backward_lanes aufgerufen wird
 world_generator.initialize_model_bounds()
-world_generator.create_backward_lanes(5)
-for i in range(15):
-    world_generator.create_lane(start_z + i)
-world_generator.extend_level(5)
+world_build_scheduler.start(start_z)
 
 print("✅ Spiel gestartet - Bewegung mit W,A,S,D möglich")
 
@@ -0,0 +1,181 @@
+from bisect import bisect_left, bisect_right
+
+
+class FootprintRows:
+    """
+    Sichtbarer Bodenbereich (konvexes Viereck), geschnitten mit Zeilen
+    konstanter Z-Position.
+    """
+
+    def __init__(self, footprint):
+        """
+        Args:
+            footprint (list): Eckpunkte (x, z) des Bodenbereichs in Umlaufreihenfolge
+        """
+        footprint_z = [point[1] for point in footprint]
+        self.min_z = min(footprint_z)
+        self.max_z = max(footprint_z)
+        # Kanten als (untere z, obere z, x bei unterer z, dx/dz), waagerechte Kanten als Punkte
+        self.edges = []
+        self.flat_points = []
+        for index in range(len(footprint)):
+            start_x, start_z = footprint[index - 1]
+            end_x, end_z = footprint[index]
+            if start_z == end_z:
+                self.flat_points.extend(((start_x, start_z), (end_x, end_z)))
+                continue
+            if start_z > end_z:
+                start_x, start_z, end_x, end_z = end_x, end_z, start_x, start_z
+            self.edges.append((start_z, end_z, start_x, (end_x - start_x) / (end_z - start_z)))
+
+    def span(self, z, margin):
+        """
+        Liefert den sichtbaren X-Abschnitt einer Zeile.
+
+        Args:
+            z (float): Z-Position der Zeile
+            margin (float): Zusätzlicher Rand in X und Z
+
+        Returns:
+            tuple: (min_x, max_x), None falls die Zeile nicht sichtbar ist
+        """
+        if z < self.min_z - margin or z > self.max_z + margin:
+            return None
+        # Zeilen im Rand bekommen den Abschnitt der nächstgelegenen Kante
+        z = min(max(z, self.min_z), self.max_z)
+        row_x = [point_x for point_x, point_z in self.flat_points if point_z == z]
+        for low_z, high_z, low_x, slope in self.edges:
+            if low_z <= z <= high_z:
+                row_x.append(low_x + (z - low_z) * slope)
+        return min(row_x) - margin, max(row_x) + margin
+
+
+class GroupState:
+    """Zustand einer Gruppe: Entities nach X sortiert und der sichtbare Indexbereich."""
+    __slots__ = ('entities', 'signature', 'sorted_x', 'sorted_entities', 'first_visible', 'end_visible')
+
+    def __init__(self, entities, signature):
+        # Die Referenz hält die Gruppe am Leben, ihre id() kann also nicht neu vergeben werden
+        self.entities = entities
+        self.signature = signature
+        ordered = sorted(entities, key=lambda entity: entity.x)
+        self.sorted_x = [entity.x for entity in ordered]
+        self.sorted_entities = ordered
+        self.first_visible = 0
+        self.end_visible = 0
+
+    def visible_range(self, span):
+        """Indexbereich der Entities innerhalb des Abschnitts (min_x, max_x)."""
+        if span is None:
+            return 0, 0
+        return bisect_left(self.sorted_x, span[0]), bisect_right(self.sorted_x, span[1])
+
+
+def group_signature(entities):
+    """Ändert sich, sobald Entities hinzukommen, wegfallen oder ausgetauscht werden."""
+    if not entities:
+        return 0, None, None
+    return len(entities), id(entities[0]), id(entities[-1])
+
+
+class BucketVisibility:
+    """
+    Sichtbarkeit einer Kategorie von Entities, geschaltet pro Gruppe statt
+    pro Entity. Eine Gruppe (z.B. ein Bucket aus ZOrderedBuckets oder die
+    Autos einer Lane) liegt auf einer Zeile z, die gegen den sichtbaren
+    Bodenbereich geschnitten wird. Unbewegte Gruppen sind nach X sortiert,
+    sichtbar ist ein zusammenhängender Indexbereich, umgeschaltet werden nur
+    die Entities, die ihn betreten oder verlassen. Bewegte Gruppen (Autos)
+    sind klein und werden pro Entity geprüft.
+    """
+
+    def __init__(self, moving=False):
+        """
+        Args:
+            moving (bool): True, wenn sich die Entities einer Gruppe in X bewegen
+        """
+        self.moving = moving
+        # id(Gruppe) -> GroupState
+        self.group_states = {}
+        # Stand der Quelle beim letzten Abgleich, siehe VisibilityManager.register
+        self.source_version = None
+
+    def update(self, groups, row_span):
+        """
+        Prüft alle Gruppen gegen den sichtbaren Bereich.
+
+        Args:
+            groups (iterable): Paare (z, Entities)
+            row_span (callable): Liefert zu einer Zeile z den sichtbaren Abschnitt (min_x, max_x) oder None
+
+        Returns:
+            tuple: (sichtbare Entities, Entities gesamt)
+        """
+        if self.moving:
+            return self.update_moving(groups, row_span)
+
+        previous_states = self.group_states
+        group_states = {}
+        visible = 0
+        total = 0
+        for z, entities in groups:
+            span = row_span(z)
+            signature = group_signature(entities)
+            state = previous_states.get(id(entities))
+            if state is None or state.signature != signature:
+                # Neue oder veränderte Gruppe: alle Entities, auch frisch aus dem Pool geholte, setzen
+                state = GroupState(entities, signature)
+                first_visible, end_visible = state.visible_range(span)
+                changed_range = range(len(state.sorted_entities))
+            else:
+                first_visible, end_visible = state.visible_range(span)
+                if first_visible == state.first_visible and end_visible == state.end_visible:
+                    changed_range = ()
+                else:
+                    changed_range = range(
+                        min(first_visible, state.first_visible),
+                        max(end_visible, state.end_visible)
+                    )
+            for index in changed_range:
+                is_visible = first_visible <= index < end_visible
+                entity = state.sorted_entities[index]
+                if entity.enabled != is_visible:
+                    entity.enabled = is_visible
+            state.first_visible = first_visible
+            state.end_visible = end_visible
+            group_states[id(entities)] = state
+            visible += end_visible - first_visible
+            total += signature[0]
+        self.group_states = group_states
+        return visible, total
+
+    def update_moving(self, groups, row_span):
+        """Prüft jede Entity einzeln gegen den Abschnitt ihrer Zeile."""
+        visible = 0
+        total = 0
+        for z, entities in groups:
+            span = row_span(z)
+            for entity in entities:
+                is_visible = span is not None and span[0] <= entity.x <= span[1]
+                if entity.enabled != is_visible:
+                    entity.enabled = is_visible
+                visible += is_visible
+                total += 1
+        return visible, total
+
+    def show_all(self, groups):
+        """
+        Blendet alle Entities der Gruppen wieder ein.
+
+        Args:
+            groups (iterable): Paare (z, Entities)
+        """
+        for _, entities in groups:
+            for entity in entities:
+                entity.enabled = True
+        self.reset()
+
+    def reset(self):
+        """Vergisst alle Gruppen, z.B. nach dem Zurücksetzen der Welt."""
+        self.group_states = {}
+        self.source_version = None
@@ -1,16 +1,33 @@
 from ursina import *
 import random
-import time
+from collections import deque
+from modules.entity_pool import EntityPool
+from modules.instanced_renderer import InstancedBatch
+from modules.collider_policy import ColliderPolicy
+from modules.car_simulation import CarSimulation, np
+from modules.collision_box import world_box_extents, entity_world_box
+from modules.model_metadata_cache import ModelMetadataCache
+from modules.car_spawn_scheduler import CarSpawnScheduler
+from modules.game_logging import get_logger
+
+logger = get_logger("car_manager")
 
 class CarManager:
     """
     Verwaltet das Spawnen, Bewegen und Entfernen von Autos.
     """
     
-    def __init__(self, settings, car_settings):
+    def __init__(self, settings, car_settings, metadata_cache=None):
         self.settings = settings
         self.car_settings = car_settings
-        self.cars = []
+        self.metadata_cache = metadata_cache or ModelMetadataCache()
+        # Autos pro Lane, vorderstes (am weitesten gefahrenes) Auto zuerst.
+        # Alle Autos einer Lane fahren gleich schnell, die Reihenfolge bleibt also erhalten.
+        self.lane_cars = {}
+        self.car_count = 0
+        
+        # Bewegung aller Autos als NumPy-Arrays (ohne NumPy wird jedes Auto einzeln bewegt)
+        self.simulation = CarSimulation() if np is not None else None
         self.lane_last_spawn = {}
         self.car_lane_speed = {}
         
@@ -21,7 +38,73 @@ class CarManager:
         ]
         
         self.min_spawn_distance = 4
+        # Mindestabstand zweier Autos einer Lane in Sekunden Fahrzeit
+        self.min_car_gap_seconds = 2.5
+        
+        # Zeitplan der Spawns pro Straßen-Lane, läuft in Spielzeit
+        self.spawn_scheduler = CarSpawnScheduler(settings)
+        self.spawn_clock = 0.0
         self.level_width = settings["level_width"]
+        
+        # Hardware-Instancing: ein Batch pro Auto-Modell, Autos sind dann nur noch Kollisions-Entities
+        self.instanced_rendering = settings.get("instanced_rendering", False)
+        self.max_instances_per_batch = settings.get("max_instances_per_batch", 4096)
+        self.car_batches = {}
+        
+        # Auto-Collider werden erst bei der ersten Kollisionsabfrage gebaut
+        self.collider_policy = ColliderPolicy(settings)
+        
+        # Kollisions-Box pro (Modell, Drehung) in Welt-Achsen, für den Intervall-Test
+        self.car_box_extents = {}
+        
+        # Vorgefertigte Autos pro Modell, Spawnen und Entfernen schaltet sie nur um
+        self.car_pool = EntityPool(settings.get("car_pool_max_size", 64))
+        car_pool_warmup = settings.get("car_pool_warmup", 8)
+        for model_path in self.car_models_small:
+            self.car_pool.warm_up(model_path, lambda: self.create_car(model_path), car_pool_warmup)
+    
+    def update_spawns(self, lanes, dt):
+        """
+        Spawnt Autos in allen Lanes, deren geplanter Spawn fällig ist, und plant
+        den nächsten Spawn dieser Lanes ein. Lanes, die nicht mehr existieren,
+        fallen dabei aus dem Zeitplan.
+        
+        Args:
+            lanes (LaneTable): Lane-Tabelle der Welt
+            dt (float): Länge des Logik-Ticks
+        """
+        self.spawn_clock += dt
+        self.spawn_scheduler.add_new_lanes(lanes.road_lane_indices, self.spawn_clock)
+        
+        for lane_index in self.spawn_scheduler.pop_due(self.spawn_clock):
+            if lane_index not in lanes:
+                self.car_lane_speed.pop(lane_index, None)
+                self.lane_last_spawn.pop(('car', lane_index), None)
+                continue
+            self.spawn_car(lane_index, lanes)
+            interval = self.spawn_scheduler.draw_interval(self.min_spawn_interval(lane_index))
+            self.spawn_scheduler.schedule(lane_index, self.spawn_clock + interval)
+    
+    def min_spawn_interval(self, lane_index):
+        """
+        Kleinster Abstand zweier Spawns einer Lane, bei dem spawn_car kein Auto ablehnt.
+        
+        Args:
+            lane_index (int): Index der Lane
+            
+        Returns:
+            float: Abstand in Sekunden
+        """
+        lane_speed = self.car_lane_speed.get(lane_index)
+        if not lane_speed:
+            return self.min_car_gap_seconds
+        return max(self.min_car_gap_seconds, self.min_spawn_distance / lane_speed)
+    
+    def car_x(self, car):
+        """X-Position eines Autos im letzten Logik-Tick, unabhängig von der Darstellung."""
+        if self.simulation is not None:
+            return float(self.simulation.x[car.sim_slot])
+        return car.logic_x
     
     def spawn_car(self, lane_index, lanes):
         """
@@ -29,29 +112,27 @@ class CarManager:
         
         Args:
             lane_index (int): Index der Lane
-            lanes (list): Liste aller Lanes
+            lanes (LaneTable): Lane-Tabelle der Welt
         """
-        lane = next(
-            (lane for lane in lanes 
-             if lane['index'] == lane_index and lane['type'] == 'road'), 
-            None
-        )
-        if not lane:
+        lane = lanes.get(lane_index)
+        if lane is None or lane.lane_type != 'road':
             return
         
-        current_time = time.time()
-        last_spawn = self.lane_last_spawn.get(('car', lane_index), 0)
+        current_time = self.spawn_clock
+        last_spawn = self.lane_last_spawn.get(('car', lane_index))
         default_lane_speed = 3.0
         lane_speed = self.car_lane_speed.get(lane_index, default_lane_speed)
         
-        if current_time - last_spawn < (self.min_spawn_distance / lane_speed):
+        # Der erste Spawn einer Lane hat keinen Vorgänger, auf den er Abstand halten müsste
+        if last_spawn is not None and current_time - last_spawn < (self.min_spawn_distance / lane_speed):
             return
         
-        lane_z_position = lane['z']
-        direction = lane['direction']
+        lane_z_position = lane.z
+        direction = lane.direction
         
         if lane_index not in self.car_lane_speed:
-            self.car_lane_speed[lane_index] = random.uniform(
+            # Geschwindigkeit aus dem Lane-Layout, sonst zufällig
+            self.car_lane_speed[lane_index] = lane.speed or random.uniform(
                 self.settings["min_car_speed"], 
                 self.settings["max_car_speed"]
             )
@@ -60,63 +141,331 @@ class CarManager:
         spawn_offset = self.level_width * 1.5
         start_x = -spawn_offset if direction == 1 else spawn_offset
         
-        min_car_distance = lane_speed * 2.5
+        min_car_distance = lane_speed * self.min_car_gap_seconds
         
-        # Prüfe Abstand zu anderen Autos in derselben Lane
-        for other_car in self.cars:
-            if abs(other_car.z - lane_z_position) < 0.2:
-                if abs(other_car.x - start_x) < min_car_distance:
-                    return
+        # Nur das zuletzt gespawnte Auto der Lane kann zu nah am Startpunkt sein
+        lane_cars = self.lane_cars.get(lane_index)
+        if lane_cars and abs(self.car_x(lane_cars[-1]) - start_x) < min_car_distance:
+            return
         
         # Wähle zufälliges Auto-Modell
         model_path = random.choice(self.car_models_small)
+        
+        # Voller Instanz-Buffer: Spawn auslassen, bevor ein Auto aus dem Pool geholt wird
+        if self.instanced_rendering and self.get_car_batch(model_path).is_full:
+            logger.debug("🚗 Instanz-Buffer für %s voll, Spawn in Lane %d ausgelassen", model_path, lane_index)
+            return
+        
+        car = self.car_pool.acquire(
+            model_path,
+            lambda: self.create_car(model_path),
+            (start_x, 0.9, lane_z_position)
+        )
+        car.rotation = (0, -90, 0) if direction == 1 else (0, 90, 0)
+        car.y -= car.scale_y * 0.25
+        self.assign_collision_box(car, model_path)
+        
+        if self.instanced_rendering:
+            car.instance_batch = self.get_car_batch(model_path)
+            car.instance_handle = car.instance_batch.add(car.position, car.rotation_y, car.scale)
+        else:
+            car.instance_handle = None
+        car.direction = direction
+        car.speed = lane_speed
+        car.lane_index = lane_index
+        if self.simulation is not None:
+            car.sim_slot = self.simulation.add(car, start_x, lane_z_position, direction, lane_speed)
+        else:
+            car.logic_x = car.previous_x = start_x
+        if lane_cars is None:
+            lane_cars = self.lane_cars[lane_index] = deque()
+        lane_cars.append(car)
+        self.car_count += 1
+        self.lane_last_spawn[('car', lane_index)] = current_time
+    
+    def create_car(self, model_path):
+        """
+        Erstellt ein neues Auto für den Pool. Mit Instancing ist das Auto nur
+        eine unsichtbare Kollisions-Entity, gezeichnet wird es vom Batch.
+        
+        Args:
+            model_path (str): Pfad zum Auto-Modell
+            
+        Returns:
+            Entity: Das deaktivierbare Auto
+        """
         model_name = model_path.split('/')[-1]
         car_config = self.car_settings.get(
             model_name, 
             {"scale": [1.5, 1.5, 1.5], "collider_scale": [1, 1, 1]}
         )
         
-        car = Entity(
-            model=model_path,
-            position=(start_x, 0.9, lane_z_position),
-            scale=tuple(car_config["scale"]),
-            rotation=(0, -90, 0) if direction == 1 else (0, 90, 0),
-            collider='box'
+        if not self.instanced_rendering:
+            car = Entity(model=model_path, scale=tuple(car_config["scale"]))
+            self.collider_policy.apply(car, 'car')
+            return car
+        
+        batch = self.get_car_batch(model_path)
+        
+        def add_car_collider(proxy):
+            proxy.collider = BoxCollider(proxy, center=batch.local_center, size=batch.local_size)
+        
+        car = Entity(scale=tuple(car_config["scale"]))
+        self.collider_policy.apply(car, 'car', add_car_collider)
+        return car
+    
+    def get_car_batch(self, model_path):
+        """
+        Liefert den Instanz-Batch eines Auto-Modells und erstellt ihn beim ersten Zugriff.
+        
+        Args:
+            model_path (str): Pfad zum Auto-Modell
+            
+        Returns:
+            InstancedBatch: Der Batch des Modells
+        """
+        batch = self.car_batches.get(model_path)
+        if batch is None:
+            batch = InstancedBatch(model_path, self.max_instances_per_batch, eternal=True)
+            self.car_batches[model_path] = batch
+        return batch
+    
+    def remove_car(self, car):
+        """
+        Entfernt ein Auto aus der Szene.
+        
+        Args:
+            car (Entity): Das zu entfernende Auto
+        """
+        if car.instance_handle is not None:
+            car.instance_batch.remove(car.instance_handle)
+            car.instance_handle = None
+        if self.simulation is not None:
+            self.simulation.remove(car.sim_slot)
+        self.car_pool.release(car)
+    
+    def get_lane_cars(self, lane_index):
+        """
+        Liefert die Autos einer Lane, vorderstes Auto zuerst.
+        
+        Args:
+            lane_index (int): Index der Lane
+            
+        Returns:
+            deque: Autos der Lane (leer, falls keine vorhanden)
+        """
+        return self.lane_cars.get(lane_index, ())
+    
+    def iter_cars(self):
+        """Durchläuft alle aktiven Autos aller Lanes."""
+        for lane_cars in self.lane_cars.values():
+            yield from lane_cars
+    
+    def get_car_box_extents(self, model_path, scale, rotation_y):
+        """
+        Liefert die Box, die der BoxCollider eines Autos in Welt-Achsen belegt.
+        
+        Args:
+            model_path (str): Pfad zum Auto-Modell
+            scale (Vec3): Skalierung des Autos
+            rotation_y (float): Drehung des Autos um die Hochachse
+            
+        Returns:
+            tuple: (offset, half_size) relativ zur Position des Autos
+        """
+        key = (model_path, tuple(scale), rotation_y)
+        extents = self.car_box_extents.get(key)
+        if extents is None:
+            if self.instanced_rendering:
+                batch = self.get_car_batch(model_path)
+                center, size = batch.local_center, batch.local_size
+            else:
+                center, size = self.metadata_cache.get_bounds(model_path)
+            extents = world_box_extents(center, size, scale, rotation_y)
+            self.car_box_extents[key] = extents
+        return extents
+    
+    def assign_collision_box(self, car, model_path):
+        """
+        Legt die Kollisions-Box eines gespawnten Autos fest. Da sich Autos nur
+        entlang X bewegen, sind Y- und Z-Intervall fest und nur X wird verschoben.
+        
+        Args:
+            car (Entity): Das Auto an seiner Startposition
+            model_path (str): Pfad zum Auto-Modell
+        """
+        offset, half_size = self.get_car_box_extents(model_path, car.scale, car.rotation_y)
+        car.collision_box = (
+            offset[0],
+            half_size[0],
+            car.y + offset[1] - half_size[1],
+            car.y + offset[1] + half_size[1],
+            car.z + offset[2] - half_size[2],
+            car.z + offset[2] + half_size[2]
         )
+    
+    def get_rendered_car_lanes(self):
+        """
+        Liefert die Autos, die als eigene Entity gezeichnet werden, gruppiert nach Lane.
         
-        car.y -= car.scale_y * 0.25
-        car.direction = direction
-        car.speed = lane_speed
-        self.cars.append(car)
-        self.lane_last_spawn[('car', lane_index)] = current_time
+        Returns:
+            iterable: Paare (z, Autos der Lane), leer beim Instancing
+        """
+        if self.instanced_rendering:
+            return ()
+        return ((lane_cars[0].z, lane_cars) for lane_cars in self.lane_cars.values() if lane_cars)
+    
+    def update_cars(self, dt):
+        """
+        Bewegt alle Autos um einen Logik-Tick und entfernt solche, die außerhalb
+        des Bereichs sind. Die Darstellung folgt erst in sync_car_visuals.
+        
+        Args:
+            dt (float): Länge des Logik-Ticks
+        """
+        despawn_distance = self.level_width * 3
+        if self.simulation is not None:
+            self.update_simulated_cars(dt, despawn_distance)
+            return
+        
+        for lane_index, lane_cars in list(self.lane_cars.items()):
+            for car in lane_cars:
+                car.previous_x = car.logic_x
+                car.logic_x += car.direction * car.speed * dt
+            
+            # Nur die vordersten Autos können den Bereich verlassen haben
+            while lane_cars and abs(lane_cars[0].logic_x) > despawn_distance:
+                self.remove_car(lane_cars.popleft())
+                self.car_count -= 1
+            if not lane_cars:
+                del self.lane_cars[lane_index]
+    
+    def update_simulated_cars(self, dt, despawn_distance):
+        """
+        Bewegt alle Autos in einem NumPy-Schritt.
+        
+        Args:
+            dt (float): Länge des Logik-Ticks
+            despawn_distance (float): Maximaler Abstand zur Mitte
+        """
+        simulation = self.simulation
+        culled_slots = simulation.step(dt, despawn_distance)
+        
+        for slot in culled_slots.tolist():
+            car = simulation.entities[slot]
+            lane_cars = self.lane_cars[car.lane_index]
+            if lane_cars[0] is car:
+                lane_cars.popleft()
+            else:
+                lane_cars.remove(car)
+            if not lane_cars:
+                del self.lane_cars[car.lane_index]
+            self.remove_car(car)
+            self.car_count -= 1
     
-    def update_cars(self):
-        """Bewegt alle Autos und entfernt solche, die außerhalb des Bereichs sind."""
-        for car in self.cars[:]:
-            car.x += car.direction * car.speed * time.dt
-            if abs(car.x) > self.level_width * 3:
-                destroy(car)
-                self.cars.remove(car)
+    def sync_car_visuals(self, alpha):
+        """
+        Überträgt die Positionen zwischen den letzten beiden Logik-Ticks auf
+        die Darstellung. Kollisions-Entities beim Instancing werden nicht
+        nachgezogen, die Kollision rechnet mit den Logik-Positionen.
+        
+        Args:
+            alpha (float): Anteil des nächsten Ticks, der bereits vergangen ist (0..1)
+        """
+        if self.simulation is not None:
+            live_slots = self.simulation.live_slots()
+            entities = self.simulation.entities
+            rendered_x = self.simulation.interpolated_x(live_slots, alpha).tolist()
+            cars = zip((entities[slot] for slot in live_slots.tolist()), rendered_x)
+        else:
+            cars = (
+                (car, car.previous_x + (car.logic_x - car.previous_x) * alpha)
+                for car in self.iter_cars()
+            )
+        
+        for car, x in cars:
+            if car.instance_handle is None:
+                car.x = x
+            else:
+                car.instance_batch.set_x_of(car.instance_handle, x)
+    
+    def check_collision_with_player(self, player, lane_index=None):
+        """
+        Prüft Kollisionen zwischen Autos und dem Spieler. Mit bekannter Lane
+        des Spielers werden nur die Autos dieser und der Nachbar-Lanes als
+        Intervalle verglichen, ohne Collider und Kollisions-Traversal.
+        
+        Args:
+            player (Entity): Der Spieler
+            lane_index (int): Lane des Spielers (optional)
+            
+        Returns:
+            bool: True bei Kollision, sonst False
+        """
+        if lane_index is not None:
+            return self.check_lane_collision(player, lane_index)
+        
+        for lane_cars in self.lane_cars.values():
+            # Nur Autos in Lanes nahe dem Spieler brauchen einen Collider
+            if abs(lane_cars[0].z - player.z) > 2:
+                continue
+            for car in lane_cars:
+                car.x = self.car_x(car)
+                if self.collider_policy.ensure_collider(car) and player.intersects(car).hit:
+                    return True
+        return False
     
-    def check_collision_with_player(self, player):
+    def check_lane_collision(self, player, lane_index):
         """
-        Prüft Kollisionen zwischen Autos und dem Spieler.
+        Vergleicht die Kollisions-Box des Spielers mit den Intervallen der Autos
+        in seiner Lane. Die Nachbar-Lanes werden mitgeprüft, falls ein Auto
+        über den Rand seiner Lane hinausragt.
         
         Args:
             player (Entity): Der Spieler
+            lane_index (int): Lane des Spielers
             
         Returns:
             bool: True bei Kollision, sonst False
         """
-        for car in self.cars:
-            if player.intersects(car).hit:
-                return True
+        (min_x, min_y, min_z), (max_x, max_y, max_z) = entity_world_box(player)
+        
+        for index in (lane_index, lane_index - 1, lane_index + 1):
+            lane_cars = self.lane_cars.get(index)
+            if not lane_cars:
+                continue
+            for car in lane_cars:
+                offset_x, half_x, car_min_y, car_max_y, car_min_z, car_max_z = car.collision_box
+                if car_max_z < min_z or car_min_z > max_z or car_max_y < min_y or car_min_y > max_y:
+                    continue
+                center_x = self.car_x(car) + offset_x
+                if center_x + half_x >= min_x and center_x - half_x <= max_x:
+                    return True
         return False
     
+    def get_stats(self):
+        """
+        Liefert Statistiken zu aktiven Autos, Pool und Collidern.
+        
+        Returns:
+            dict: Aktive Autos, Pool-Statistiken und Collider-Zähler
+        """
+        return {
+            'active_cars': self.car_count,
+            'active_lanes': len(self.lane_cars),
+            'scheduled_lanes': len(self.spawn_scheduler),
+            'pool': self.car_pool.get_stats(),
+            'colliders': self.collider_policy.get_stats()
+        }
+    
     def cleanup(self):
         """Entfernt alle Autos."""
-        for car in self.cars:
-            destroy(car)
-        self.cars.clear()
+        for car in self.iter_cars():
+            self.remove_car(car)
+        self.lane_cars.clear()
+        self.car_count = 0
+        if self.simulation is not None:
+            self.simulation.clear()
         self.lane_last_spawn.clear()
-        self.car_lane_speed.clear()
\ No newline at end of file
+        self.car_lane_speed.clear()
+        self.spawn_scheduler.clear()
\ No newline at end of file
@@ -0,0 +1,149 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional, ohne wird jedes Auto einzeln bewegt
+    np = None
+
+
+class CarSimulation:
+    """
+    Bewegungszustand aller Autos als Struct-of-Arrays: X-Position, Lane-Z,
+    Richtung, Geschwindigkeit und Lebendig-Flag liegen in NumPy-Arrays.
+    Ein Frame bewegt alle Autos in einem Schritt und findet die Autos, die den
+    Bereich verlassen haben, mit einer einzigen Maske. Jedes Auto belegt einen
+    festen Slot, frei gewordene Slots werden wiederverwendet.
+    """
+
+    def __init__(self, capacity=256):
+        """
+        Args:
+            capacity (int): Anfängliche Anzahl Slots, wächst bei Bedarf
+        """
+        self.capacity = 0
+        self.x = np.zeros(0)
+        self.previous_x = np.zeros(0)
+        self.z = np.zeros(0)
+        self.direction = np.zeros(0)
+        self.speed = np.zeros(0)
+        self.alive = np.zeros(0, dtype=bool)
+        self.entities = []
+        self.free_slots = []
+        self.alive_count = 0
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        """
+        Vergrößert alle Arrays auf die neue Kapazität.
+
+        Args:
+            capacity (int): Neue Anzahl Slots
+        """
+        extra = capacity - self.capacity
+        if extra <= 0:
+            return
+        self.x = np.concatenate([self.x, np.zeros(extra)])
+        self.previous_x = np.concatenate([self.previous_x, np.zeros(extra)])
+        self.z = np.concatenate([self.z, np.zeros(extra)])
+        self.direction = np.concatenate([self.direction, np.zeros(extra)])
+        self.speed = np.concatenate([self.speed, np.zeros(extra)])
+        self.alive = np.concatenate([self.alive, np.zeros(extra, dtype=bool)])
+        self.entities.extend([None] * extra)
+        # Niedrige Slots zuerst vergeben, damit die belegten Slots dicht beieinander liegen
+        self.free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def add(self, entity, x, z, direction, speed):
+        """
+        Nimmt ein Auto in die Simulation auf.
+
+        Args:
+            entity (Entity): Entity des Autos
+            x (float): Start-X-Position
+            z (float): Z-Position der Lane
+            direction (int): Fahrtrichtung (1 oder -1)
+            speed (float): Geschwindigkeit
+
+        Returns:
+            int: Slot des Autos
+        """
+        if not self.free_slots:
+            self.grow(self.capacity * 2)
+        slot = self.free_slots.pop()
+        self.x[slot] = x
+        self.previous_x[slot] = x
+        self.z[slot] = z
+        self.direction[slot] = direction
+        self.speed[slot] = speed
+        self.alive[slot] = True
+        self.entities[slot] = entity
+        self.alive_count += 1
+        return slot
+
+    def remove(self, slot):
+        """
+        Entfernt ein Auto aus der Simulation und gibt seinen Slot frei.
+        Gilt auch für Autos, die step() bereits aussortiert hat.
+
+        Args:
+            slot (int): Slot des Autos
+        """
+        if self.entities[slot] is None:
+            return
+        self.alive[slot] = False
+        # Tote Slots bewegen sich im Schritt nicht mit
+        self.speed[slot] = 0.0
+        self.entities[slot] = None
+        self.free_slots.append(slot)
+        self.alive_count -= 1
+
+    def step(self, dt, despawn_distance):
+        """
+        Bewegt alle Autos und markiert die, die den Bereich verlassen haben.
+        Die markierten Autos bewegen sich nicht mehr, ihre Slots werden erst
+        mit remove() freigegeben.
+
+        Args:
+            dt (float): Zeit seit dem letzten Frame
+            despawn_distance (float): Maximaler Abstand zur Mitte
+
+        Returns:
+            np.ndarray: Slots der Autos außerhalb des Bereichs
+        """
+        np.copyto(self.previous_x, self.x)
+        self.x += self.direction * self.speed * dt
+        culled = self.alive & (np.abs(self.x) > despawn_distance)
+        culled_slots = np.flatnonzero(culled)
+        if len(culled_slots):
+            self.alive[culled_slots] = False
+            self.speed[culled_slots] = 0.0
+        return culled_slots
+
+    def live_slots(self):
+        """
+        Liefert die Slots aller lebendigen Autos.
+
+        Returns:
+            np.ndarray: Belegte Slots
+        """
+        return np.flatnonzero(self.alive)
+
+    def interpolated_x(self, slots, alpha):
+        """
+        Liefert die Darstellungs-Positionen zwischen den letzten beiden Schritten.
+
+        Args:
+            slots (np.ndarray): Slots der Autos
+            alpha (float): Anteil des nächsten Schritts (0..1)
+
+        Returns:
+            np.ndarray: Interpolierte X-Positionen
+        """
+        previous_x = self.previous_x[slots]
+        return previous_x + (self.x[slots] - previous_x) * alpha
+
+    def clear(self):
+        """Entfernt alle Autos, die Kapazität bleibt erhalten."""
+        self.alive[:] = False
+        self.speed[:] = 0.0
+        self.entities = [None] * self.capacity
+        self.free_slots = list(range(self.capacity - 1, -1, -1))
+        self.alive_count = 0
@@ -0,0 +1,93 @@
+import heapq
+import random
+
+
+class CarSpawnScheduler:
+    """
+    Zeitplan für das Spawnen von Autos: jede Straßen-Lane hat ihren nächsten
+    Spawn-Zeitpunkt in einer Prioritäts-Warteschlange. Pro Frame werden nur
+    die fälligen Lanes entnommen, die Verkehrsdichte hängt damit nicht von
+    der Bildrate ab.
+    """
+
+    DISTRIBUTIONS = ('exponential', 'uniform', 'fixed')
+
+    def __init__(self, settings):
+        self.distribution = settings.get("car_spawn_distribution", "exponential")
+        if self.distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unbekannte Spawn-Verteilung: {self.distribution}")
+        self.mean_interval = settings.get("car_spawn_mean_interval", 4.0)
+
+        # Heap aus (Zeitpunkt, Lane-Index)
+        self.spawn_queue = []
+        self.highest_scheduled_index = None
+
+    def draw_interval(self, min_interval=0.0):
+        """
+        Zieht den Abstand bis zum nächsten Spawn einer Lane.
+
+        Args:
+            min_interval (float): Kleinster erlaubter Abstand in Sekunden
+
+        Returns:
+            float: Abstand in Sekunden, im Mittel mean_interval
+        """
+        spread = self.mean_interval - min_interval
+        if spread <= 0 or self.distribution == 'fixed':
+            return max(self.mean_interval, min_interval)
+        if self.distribution == 'uniform':
+            return min_interval + random.uniform(0.0, 2 * spread)
+        return min_interval + random.expovariate(1.0 / spread)
+
+    def schedule(self, lane_index, due_time):
+        """
+        Plant den nächsten Spawn einer Lane ein.
+
+        Args:
+            lane_index (int): Index der Lane
+            due_time (float): Zeitpunkt des Spawns
+        """
+        heapq.heappush(self.spawn_queue, (due_time, lane_index))
+
+    def add_new_lanes(self, road_lane_indices, now):
+        """
+        Plant neu entstandene Straßen-Lanes ein. Lanes entstehen aufsteigend,
+        daher werden nur die Indizes über dem zuletzt eingeplanten betrachtet.
+        Der erste Spawn wird zufällig versetzt, damit nicht alle Lanes gleichzeitig starten.
+
+        Args:
+            road_lane_indices (deque): Aufsteigende Indizes aller Straßen-Lanes
+            now (float): Aktuelle Spielzeit
+        """
+        new_count = 0
+        for lane_index in reversed(road_lane_indices):
+            if self.highest_scheduled_index is not None and lane_index <= self.highest_scheduled_index:
+                break
+            self.schedule(lane_index, now + random.uniform(0.0, self.mean_interval))
+            new_count += 1
+        if new_count:
+            self.highest_scheduled_index = road_lane_indices[-1]
+
+    def pop_due(self, now):
+        """
+        Entnimmt alle Lanes, deren Spawn fällig ist. Sie müssen danach mit
+        schedule() neu eingeplant werden, sonst fallen sie aus dem Zeitplan.
+
+        Args:
+            now (float): Aktuelle Spielzeit
+
+        Returns:
+            list: Indizes der fälligen Lanes
+        """
+        due_lanes = []
+        while self.spawn_queue and self.spawn_queue[0][0] <= now:
+            due_lanes.append(heapq.heappop(self.spawn_queue)[1])
+        return due_lanes
+
+    def clear(self):
+        """Leert den Zeitplan."""
+        self.spawn_queue.clear()
+        self.highest_scheduled_index = None
+
+    def __len__(self):
+        return len(self.spawn_queue)
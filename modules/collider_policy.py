@@ -0,0 +1,73 @@
+class ColliderPolicy:
+    """
+    Legt pro Entity-Klasse fest, ob und wann ein Collider gebaut wird:
+    'eager' sofort beim Erstellen, 'lazy' erst bei der ersten Kollisionsabfrage,
+    'none' gar nicht.
+    """
+
+    DEFAULT_POLICY = {"tile": "none", "tree": "lazy", "car": "lazy"}
+
+    def __init__(self, settings):
+        self.policy = dict(self.DEFAULT_POLICY)
+        self.policy.update(settings.get("collider_policy", {}))
+
+        # Statistiken pro Entity-Klasse
+        self.colliders_built = {entity_class: 0 for entity_class in self.policy}
+        self.colliders_deferred = {entity_class: 0 for entity_class in self.policy}
+
+    def apply(self, entity, entity_class, add_collider=None):
+        """
+        Versieht eine neue Entity gemäß Richtlinie mit einem Collider.
+
+        Args:
+            entity (Entity): Die Entity
+            entity_class (str): Klasse der Entity ('tile', 'tree', 'car')
+            add_collider (callable): Baut den Collider für die Entity, Standard ist eine Box
+        """
+        add_collider = add_collider or add_box_collider
+        mode = self.policy.get(entity_class, "eager")
+
+        entity.collider_class = entity_class
+        entity.pending_collider = None
+        if mode == "eager":
+            add_collider(entity)
+            self.colliders_built[entity_class] = self.colliders_built.get(entity_class, 0) + 1
+        elif mode == "lazy":
+            entity.pending_collider = add_collider
+            self.colliders_deferred[entity_class] = self.colliders_deferred.get(entity_class, 0) + 1
+
+    def ensure_collider(self, entity):
+        """
+        Baut einen aufgeschobenen Collider, bevor die Entity abgefragt wird.
+
+        Args:
+            entity (Entity): Die abzufragende Entity
+
+        Returns:
+            bool: True falls die Entity einen Collider hat
+        """
+        add_collider = getattr(entity, 'pending_collider', None)
+        if add_collider is not None:
+            entity.pending_collider = None
+            add_collider(entity)
+            entity_class = entity.collider_class
+            self.colliders_built[entity_class] = self.colliders_built.get(entity_class, 0) + 1
+            self.colliders_deferred[entity_class] -= 1
+        return entity.collider is not None
+
+    def get_stats(self):
+        """
+        Liefert die Anzahl gebauter und noch aufgeschobener Collider.
+
+        Returns:
+            dict: Zähler pro Entity-Klasse
+        """
+        return {
+            'built': dict(self.colliders_built),
+            'deferred': dict(self.colliders_deferred)
+        }
+
+
+def add_box_collider(entity):
+    """Standard-Collider: Box um das Modell der Entity."""
+    entity.collider = 'box'
@@ -0,0 +1,55 @@
+import math
+
+
+def world_box_extents(center, size, scale, rotation_y):
+    """
+    Rechnet einen lokalen BoxCollider in eine achsenparallele Box in
+    Welt-Achsen um, relativ zur Position der Entity. Für Drehungen um
+    Vielfache von 90° (Autos und Spieler) ist das Ergebnis exakt.
+
+    Args:
+        center (Vec3): Mittelpunkt der Box im Modellraum
+        size (Vec3): Größe der Box im Modellraum
+        scale (Vec3): Skalierung der Entity
+        rotation_y (float): Drehung der Entity um die Hochachse
+
+    Returns:
+        tuple: (offset, half_size) als Tupel (x, y, z)
+    """
+    angle = math.radians(rotation_y)
+    cos_a = round(math.cos(angle), 9)
+    sin_a = round(math.sin(angle), 9)
+
+    center_x, center_y, center_z = (center[axis] * scale[axis] for axis in range(3))
+    half_x, half_y, half_z = (abs(size[axis] * scale[axis]) / 2 for axis in range(3))
+
+    # Ursina dreht bei positivem rotation_y von oben gesehen im Uhrzeigersinn
+    offset = (
+        center_x * cos_a + center_z * sin_a,
+        center_y,
+        -center_x * sin_a + center_z * cos_a
+    )
+    half_size = (
+        abs(half_x * cos_a) + abs(half_z * sin_a),
+        half_y,
+        abs(half_x * sin_a) + abs(half_z * cos_a)
+    )
+    return offset, half_size
+
+
+def entity_world_box(entity):
+    """
+    Liefert die Welt-Box einer Entity mit BoxCollider als Min-/Max-Ecken.
+
+    Args:
+        entity (Entity): Entity mit BoxCollider, direkt unter scene
+
+    Returns:
+        tuple: (min_corner, max_corner) als Tupel (x, y, z)
+    """
+    collider = entity.collider
+    offset, half_size = world_box_extents(collider.center, collider.size, entity.scale, entity.rotation_y)
+    position = entity.position
+    min_corner = tuple(position[axis] + offset[axis] - half_size[axis] for axis in range(3))
+    max_corner = tuple(position[axis] + offset[axis] + half_size[axis] for axis in range(3))
+    return min_corner, max_corner
@@ -0,0 +1,109 @@
+from ursina import *
+
+class EntityPool:
+    """
+    Hält nicht mehr benötigte Entities vor, damit sie wiederverwendet statt
+    zerstört und neu erstellt werden. Die Entities werden pro Schlüssel
+    (z.B. Modellpfad) in eigenen Freilisten verwaltet.
+    """
+
+    def __init__(self, max_size=512):
+        """
+        Args:
+            max_size (int): Maximale Anzahl freier Entities pro Schlüssel (High-Water-Mark)
+        """
+        self.max_size = max_size
+        self.free_entities = {}
+
+        # Unsichtbarer Elternknoten für zurückgegebene Entities
+        self.pool_root = Entity(enabled=False, eternal=True)
+
+        # Statistiken
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, key, factory, position=(0, 0, 0), parent=scene):
+        """
+        Liefert eine Entity für den Schlüssel, bevorzugt aus der Freiliste.
+
+        Args:
+            key: Schlüssel der Freiliste (z.B. Modellpfad)
+            factory (callable): Erstellt eine neue Entity, falls die Freiliste leer ist
+            position (tuple): Neue Position der Entity
+            parent (Entity): Neuer Elternknoten der Entity
+
+        Returns:
+            Entity: Die aktivierte Entity
+        """
+        free_list = self.free_entities.get(key)
+        if free_list:
+            entity = free_list.pop()
+            entity.parent = parent
+            entity.position = position
+            entity.enabled = True
+            self.hits += 1
+            return entity
+
+        self.misses += 1
+        entity = factory()
+        entity.pool_key = key
+        entity.parent = parent
+        entity.position = position
+        return entity
+
+    def warm_up(self, key, factory, count):
+        """
+        Erstellt Entities im Voraus und legt sie direkt in die Freiliste.
+
+        Args:
+            key: Schlüssel der Freiliste (z.B. Modellpfad)
+            factory (callable): Erstellt eine neue Entity
+            count (int): Gewünschte Anzahl freier Entities, höchstens max_size
+        """
+        free_list = self.free_entities.setdefault(key, [])
+        while len(free_list) < min(count, self.max_size):
+            entity = factory()
+            entity.pool_key = key
+            entity.enabled = False
+            entity.parent = self.pool_root
+            free_list.append(entity)
+
+    def release(self, entity):
+        """
+        Gibt eine Entity an den Pool zurück. Ist die Freiliste voll,
+        wird die Entity zerstört.
+
+        Args:
+            entity (Entity): Die nicht mehr benötigte Entity
+        """
+        free_list = self.free_entities.setdefault(entity.pool_key, [])
+        if len(free_list) >= self.max_size:
+            destroy(entity)
+            self.evictions += 1
+            return
+
+        entity.enabled = False
+        entity.parent = self.pool_root
+        free_list.append(entity)
+
+    def clear(self):
+        """Zerstört alle freien Entities im Pool."""
+        for free_list in self.free_entities.values():
+            for entity in free_list:
+                destroy(entity)
+        self.free_entities.clear()
+
+    def get_stats(self):
+        """
+        Liefert die Pool-Statistiken.
+
+        Returns:
+            dict: Treffer, Fehlgriffe, Verdrängungen und freie Entities pro Schlüssel
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'free': {key: len(free_list) for key, free_list in self.free_entities.items()}
+        }
@@ -0,0 +1,66 @@
+from panda3d.core import ClockObject
+
+
+class FixedTimestep:
+    """
+    Zerlegt die variable Frame-Zeit in Spiellogik-Ticks fester Länge.
+    Die Restzeit bleibt im Akkumulator und ergibt den Interpolationsfaktor,
+    mit dem zwischen den letzten beiden Ticks gezeichnet wird.
+    """
+
+    def __init__(self, settings):
+        self.tick_rate = settings.get("simulation_tick_rate", 60)
+        self.tick_dt = 1.0 / self.tick_rate
+        # Obergrenze, damit ein sehr langer Frame keine Tick-Lawine auslöst
+        self.max_ticks_per_frame = settings.get("max_ticks_per_frame", 8)
+
+        self.accumulator = 0.0
+
+        # Statistiken
+        self.tick_count = 0
+        self.dropped_time = 0.0
+
+    @property
+    def alpha(self):
+        """Anteil des nächsten Ticks, der bereits vergangen ist (0..1)."""
+        return self.accumulator / self.tick_dt
+
+    def advance(self, frame_dt):
+        """
+        Nimmt die Zeit eines Frames auf und liefert die Anzahl fälliger Ticks.
+
+        Args:
+            frame_dt (float): Dauer des letzten Frames in Sekunden
+
+        Returns:
+            int: Anzahl der Ticks, die jetzt ausgeführt werden müssen
+        """
+        self.accumulator += frame_dt
+        ticks = int(self.accumulator // self.tick_dt)
+        if ticks > self.max_ticks_per_frame:
+            # Überschüssige Zeit verwerfen, das Spiel läuft dann kurz langsamer
+            self.dropped_time += (ticks - self.max_ticks_per_frame) * self.tick_dt
+            ticks = self.max_ticks_per_frame
+            self.accumulator = self.accumulator % self.tick_dt + ticks * self.tick_dt
+        self.accumulator -= ticks * self.tick_dt
+        self.tick_count += ticks
+        return ticks
+
+    def reset(self):
+        """Verwirft die angesammelte Zeit, z.B. beim Neustart."""
+        self.accumulator = 0.0
+
+
+def apply_render_fps_limit(fps_limit):
+    """
+    Begrenzt die Bildrate unabhängig von der Spiellogik.
+
+    Args:
+        fps_limit (int): Maximale Bildrate, None oder 0 für unbegrenzt
+    """
+    clock = ClockObject.get_global_clock()
+    if fps_limit:
+        clock.set_mode(ClockObject.M_limited)
+        clock.set_frame_rate(fps_limit)
+    else:
+        clock.set_mode(ClockObject.M_normal)
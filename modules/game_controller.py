@@ -3,21 +3,43 @@ from modules.game_settings import GameSettings
 from modules.highscore_manager import HighscoreManager
 from modules.player import Player
 from modules.world_generator import WorldGenerator
+from modules.world_build_scheduler import WorldBuildScheduler
 from modules.car_manager import CarManager
 from modules.ui_manager import UIManager
+from modules.model_metadata_cache import ModelMetadataCache
+from modules.game_logging import get_logger, setup_logging
+from modules.visibility_manager import VisibilityManager
+from modules.fixed_timestep import FixedTimestep, apply_render_fps_limit
+from modules.input_buffer import InputBuffer
+from modules.tween_scheduler import TweenScheduler
+from modules.run_history import RunHistory, settings_hash
+
+logger = get_logger("game_controller")
 
 class GameController:
     """
     Hauptcontroller, der alle Spielkomponenten koordiniert.
     """
     
+    # Tasten, die gepuffert und als Bewegung ausgeführt werden
+    MOVE_KEYS = ('w', 'a', 's', 'd')
+    
     def __init__(self):
         # ZUERST Ursina initialisieren
         self.app = Ursina()
         
         # DANACH die anderen Komponenten initialisieren
         self.settings_manager = GameSettings()
-        self.highscore_manager = HighscoreManager()
+        self.log_handler = setup_logging(self.settings_manager.game_settings)
+        self.highscore_manager = HighscoreManager(
+            save_interval=self.settings_manager.game_settings.get("highscore_save_interval", 2.0)
+        )
+        self.model_metadata_cache = ModelMetadataCache()
+        self.run_history = RunHistory(
+            self.settings_manager.game_settings.get("run_history_file", "assets/run_history.db"),
+            self.settings_manager.game_settings.get("run_history_batch_size", 256),
+            self.settings_manager.game_settings.get("run_history_flush_interval", 1.0)
+        )
         
         # Spielzustand
         self.game_paused = False
@@ -28,30 +50,74 @@ class GameController:
         self.max_x_tiles = self.level_width // 2
         self.min_car_speed = self.settings_manager.game_settings["min_car_speed"]
         self.max_car_speed = self.settings_manager.game_settings["max_car_speed"]
-        self.car_spawn_chance = self.settings_manager.game_settings["car_spawn_chance"]
         self.move_cooldown = self.settings_manager.game_settings["move_cooldown"]
         self.last_move_time = 0
         
+        # Rundenverlauf: Beginn der Runde und Regeln, unter denen sie gespielt wird
+        self.run_settings_hash = settings_hash(self.settings_manager.game_settings)
+        self.run_start_time = time.time()
+        self.run_recorded = False
+        
+        # Tasten aus dem Cooldown werden gepuffert statt verworfen
+        self.input_buffer = InputBuffer(self.settings_manager.game_settings)
+        
+        # Spiellogik in festen Ticks, Bildrate davon unabhängig
+        self.simulation_clock = FixedTimestep(self.settings_manager.game_settings)
+        apply_render_fps_limit(self.settings_manager.display_settings.get("render_fps_limit"))
+        
         # Fenster und Kamera setup
         self.setup_window()
         self.setup_lighting()
         self.setup_camera()
         
         # JETZT erst die Spielkomponenten initialisieren (nach Ursina)
-        self.world_generator = WorldGenerator(self.settings_manager.game_settings)
+        self.world_generator = WorldGenerator(
+            self.settings_manager.game_settings,
+            self.model_metadata_cache
+        )
+        self.world_build_scheduler = WorldBuildScheduler(
+            self.world_generator,
+            self.settings_manager.game_settings
+        )
         self.car_manager = CarManager(
             self.settings_manager.game_settings, 
-            self.settings_manager.car_settings
+            self.settings_manager.car_settings,
+            self.model_metadata_cache
         )
         self.ui_manager = UIManager(self.highscore_manager)
-        self.player = Player(start_position=(0, 1.0, 0))
+        self.tween_scheduler = TweenScheduler(self.settings_manager.game_settings)
+        self.player = Player(
+            start_position=(0, 1.0, 0),
+            metadata_cache=self.model_metadata_cache,
+            tween_scheduler=self.tween_scheduler
+        )
+        self.visibility_manager = self.create_visibility_manager()
         
         self.create_initial_world()
         
         # WICHTIG: Ursina Input-Handler direkt überschreiben
         self.setup_ursina_handlers()
         
-        print("✅ Spiel erfolgreich initialisiert")
+        logger.info("✅ Spiel erfolgreich initialisiert")
+    
+    def create_visibility_manager(self):
+        """
+        Erstellt die Sichtbarkeitsprüfung für Tiles, Bäume und Autos.
+        
+        Returns:
+            VisibilityManager: Der eingerichtete Manager
+        """
+        visibility_manager = VisibilityManager(self.settings_manager.game_settings)
+        visibility_manager.register(
+            'tiles', lambda: self.world_generator.tiles.buckets, extent=4.0,
+            version=lambda: self.world_generator.tiles.version
+        )
+        visibility_manager.register(
+            'trees', self.world_generator.get_rendered_tree_buckets, extent=1.0,
+            version=lambda: self.world_generator.trees.version
+        )
+        visibility_manager.register('cars', self.car_manager.get_rendered_car_lanes, extent=2.0, moving=True)
+        return visibility_manager
     
     def setup_ursina_handlers(self):
         """Setzt die Input- und Update-Handler für Ursina direkt."""
@@ -94,15 +160,14 @@ class GameController:
     
     def create_initial_world(self):
         """Erstellt die initiale Spielwelt."""
-        print("🌍 Erstelle Spielwelt...")
+        logger.info("🌍 Erstelle Spielwelt...")
         self.world_generator.create_play_area_border()
-        self.world_generator.create_backward_lanes(5)
-        
-        for i in range(15):
-            self.world_generator.create_lane(self.start_z_position + i)
-        
-        self.world_generator.extend_level(5)
-        print(f"✅ Spielwelt erstellt: {len(self.world_generator.tiles)} Tiles, {len(self.world_generator.trees)} Bäume, {len(self.world_generator.lanes)} Lanes")
+        self.world_build_scheduler.start(self.start_z_position)
+        logger.info(
+            "✅ Spielwelt erstellt: %d Tiles, %d Bäume, %d Lanes, %d Lanes in Warteschlange",
+            len(self.world_generator.tiles), len(self.world_generator.trees),
+            len(self.world_generator.lanes), self.world_build_scheduler.queue_depth
+        )
     
     def handle_player_input(self, key):
         """
@@ -113,7 +178,7 @@ class GameController:
         """
         # Debug-Ausgabe um zu sehen, ob Tasten erkannt werden
         if key in ['w', 'a', 's', 'd', 'escape']:
-            print(f"🎮 Tastendruck erkannt: {key}")
+            logger.debug("🎮 Tastendruck erkannt: %s", key)
         
         # Pause-Menü Eingaben
         if self.ui_manager.game_paused:
@@ -121,6 +186,7 @@ class GameController:
             if should_restart:
                 self.restart_game()
             elif should_quit:
+                self.record_run('quit')
                 application.quit()
             return
         
@@ -128,127 +194,164 @@ class GameController:
         if self.ui_manager.game_paused or self.ui_manager.is_game_over:
             return
         
-        # Cooldown prüfen
-        if time.time() - self.last_move_time < self.move_cooldown:
-            return
-        
         if key == 'escape':
+            self.input_buffer.clear()
             self.ui_manager.show_pause_menu()
             return
         
-        old_position = self.player.position
-        moved = False
+        # Bewegungstasten puffern, ausgeführt wird sofort oder sobald der Cooldown es erlaubt
+        if key in self.MOVE_KEYS:
+            self.input_buffer.push(key, time.time())
+            self.dispatch_buffered_input()
+    
+    def dispatch_buffered_input(self):
+        """Führt gepufferte Bewegungen aus, solange der Cooldown es erlaubt."""
+        if self.ui_manager.game_paused or self.ui_manager.is_game_over:
+            return
+        
+        now = time.time()
+        while now - self.last_move_time >= self.move_cooldown:
+            buffered_input = self.input_buffer.pop(now)
+            if buffered_input is None:
+                return
+            key, pressed_at = buffered_input
+            if self.try_move_player(key):
+                self.input_buffer.record_dispatch(pressed_at, now)
+                logger.debug("⏱️ Bewegung %s nach %.1f ms", key, (now - pressed_at) * 1000.0)
+    
+    def try_move_player(self, key):
+        """
+        Bewegt den Spieler in Richtung der Taste, sofern das Zielfeld frei ist.
+        
+        Args:
+            key (str): Die Bewegungstaste
         
+        Returns:
+            bool: True falls sich der Spieler bewegt hat
+        """
+        # Zielfeld und Bewegung zur Taste bestimmen
         if key == 'w':
-            self.move_player_forward()
-            moved = True
+            offset, move = (0, self.tile_size), self.move_player_forward
         elif key == 's' and self.player.z - self.tile_size >= self.start_z_position:
-            self.move_player_backward()
-            moved = True
+            offset, move = (0, -self.tile_size), self.move_player_backward
         elif key == 'a' and self.player.x - self.tile_size >= -self.max_x_tiles:
-            self.move_player_left()
-            moved = True
+            offset, move = (-self.tile_size, 0), self.move_player_left
         elif key == 'd' and self.player.x + self.tile_size <= self.max_x_tiles:
-            self.move_player_right()
-            moved = True
-        
-        if moved:
-            self.handle_player_movement(old_position)
+            offset, move = (self.tile_size, 0), self.move_player_right
+        else:
+            return False
+        
+        # Baum auf dem Zielfeld: Bewegung gar nicht erst starten
+        target_x, target_z = self.player.x + offset[0], self.player.z + offset[1]
+        if self.world_generator.is_position_blocked(target_x, target_z, self.player.get_footprint()):
+            self.show_blocked_move()
+            return False
+        
+        move()
+        self.player.update_move_time()
+        self.last_move_time = time.time()
+        return True
     
     def move_player_forward(self):
         """Bewegt den Spieler vorwärts."""
         self.player.z += self.tile_size
         self.player.face_direction(0)
         self.player.hop()
-        self.world_generator.extend_level(1)
-        print(f"🎯 Spieler bewegt nach vorne: Z={self.player.z}")
+        logger.debug("🎯 Spieler bewegt nach vorne: Z=%s", self.player.z)
     
     def move_player_backward(self):
         """Bewegt den Spieler rückwärts."""
         self.player.z -= self.tile_size
         self.player.face_direction(180)
         self.player.hop()
-        print(f"🎯 Spieler bewegt nach hinten: Z={self.player.z}")
+        logger.debug("🎯 Spieler bewegt nach hinten: Z=%s", self.player.z)
     
     def move_player_left(self):
         """Bewegt den Spieler nach links."""
         self.player.x -= self.tile_size
         self.player.face_direction(-90)
         self.player.hop()
-        print(f"🎯 Spieler bewegt nach links: X={self.player.x}")
+        logger.debug("🎯 Spieler bewegt nach links: X=%s", self.player.x)
     
     def move_player_right(self):
         """Bewegt den Spieler nach rechts."""
         self.player.x += self.tile_size
         self.player.face_direction(90)
         self.player.hop()
-        print(f"🎯 Spieler bewegt nach rechts: X={self.player.x}")
-    
-    def handle_player_movement(self, old_position):
-        """
-        Verarbeitet die Spielerbewegung und Kollisionserkennung.
-        
-        Args:
-            old_position (Vec3): Die Position vor der Bewegung
-        """
-        collision_occurred = self.check_tree_collision()
-        
-        if collision_occurred:
-            # Bewegung rückgängig machen
-            self.player.position = old_position
-            # Visuelles Feedback
-            self.player.color = color.red
-            invoke(setattr, self.player, 'color', color.white, delay=0.2)
-            print("🚫 Bewegung blockiert: Kollision mit Baum")
-        else:
-            self.player.update_move_time()
-            self.last_move_time = time.time()
+        logger.debug("🎯 Spieler bewegt nach rechts: X=%s", self.player.x)
     
-    def check_tree_collision(self):
-        """
-        Prüft Kollisionen mit Bäumen.
-        
-        Returns:
-            bool: True bei Kollision, sonst False
-        """
-        for tree in self.world_generator.trees:
-            if abs(tree.x) <= self.max_x_tiles + 0.5:
-                if distance(self.player.position, tree.position) < 1.5:
-                    if self.player.intersects(tree).hit:
-                        return True
-        return False
+    def show_blocked_move(self):
+        """Zeigt an, dass ein Baum die Bewegung blockiert."""
+        self.player.flash_color(color.red)
+        logger.debug("🚫 Bewegung blockiert: Baum auf dem Zielfeld")
     
     def game_update(self):
         """Wird jeden Frame aufgerufen, um die Spielogik zu aktualisieren."""
         if not self.ui_manager.game_paused:
             self.update_camera()
+        self.tween_scheduler.update(time.dt)
+        
+        # Lanes vor dem Spieler im Rahmen des Frame-Budgets bauen
+        self.world_build_scheduler.update(self.player.z)
         
         # Aufräumen
         self.world_generator.cleanup_old_objects(self.player.z)
         
+        # Spiellogik in festen Ticks, unabhängig von der Bildrate
+        for _ in range(self.simulation_clock.advance(time.dt)):
+            self.game_tick(self.simulation_clock.tick_dt)
+        
+        # Autos zwischen den letzten beiden Ticks darstellen
+        self.car_manager.sync_car_visuals(self.simulation_clock.alpha)
+        
+        # Zuletzt, damit neu gebaute Tiles und gespawnte Autos noch in diesem Frame stimmen
+        self.visibility_manager.update()
+    
+    def game_tick(self, dt):
+        """
+        Führt einen Tick der Spiellogik mit fester Länge aus.
+        
+        Args:
+            dt (float): Länge des Ticks in Sekunden
+        """
+        # Gepufferte Bewegungen, deren Cooldown abgelaufen ist
+        self.dispatch_buffered_input()
+        
         # Score aktualisieren
         self.ui_manager.update_score(self.player.z, self.start_z_position)
         
         # Autos aktualisieren
-        self.car_manager.update_cars()
-        
-        # Auto-Spawning
-        if random.random() < self.car_spawn_chance:
-            road_lane_indices = [
-                lane['index'] for lane in self.world_generator.lanes 
-                if lane['type'] == 'road'
-            ]
-            if road_lane_indices:
-                self.car_manager.spawn_car(
-                    random.choice(road_lane_indices), 
-                    self.world_generator.lanes
-                )
+        self.car_manager.update_cars(dt)
+        
+        # Auto-Spawning nach Zeitplan der Lanes
+        self.car_manager.update_spawns(self.world_generator.lanes, dt)
         
         # Kollisionsprüfung mit Autos
-        if self.car_manager.check_collision_with_player(self.player):
+        player_lane = self.world_build_scheduler.lane_index_at(self.player.z)
+        if self.car_manager.check_collision_with_player(self.player, player_lane):
             self.player.color = color.black
+            self.record_run('car')
+            self.input_buffer.clear()
             self.ui_manager.show_pause_menu(game_over=True)
-            print("💥 Kollision mit Auto!")
+            logger.info("💥 Kollision mit Auto!")
+    
+    def record_run(self, death_cause):
+        """
+        Merkt die laufende Runde für den Rundenverlauf vor, höchstens einmal pro Runde.
+        
+        Args:
+            death_cause (str): Grund für das Ende, z.B. 'car', 'restart', 'quit'
+        """
+        if self.run_recorded:
+            return
+        self.run_history.record_run(
+            self.ui_manager.current_score,
+            time.time() - self.run_start_time,
+            self.world_generator.lane_layouts.seed,
+            self.run_settings_hash,
+            death_cause
+        )
+        self.run_recorded = True
     
     def update_camera(self):
         """Aktualisiert die Kameraposition, um dem Spieler zu folgen."""
@@ -263,13 +366,18 @@ class GameController:
     
     def restart_game(self):
         """Setzt das Spiel zurück und startet neu."""
-        print("🔄 Starte Spiel neu...")
+        logger.info("🔄 Starte Spiel neu...")
+        # Abgebrochene Runde festhalten, bevor Seed und Score zurückgesetzt werden
+        self.record_run('restart')
+        self.run_start_time = time.time()
+        self.run_recorded = False
         self.ui_manager.hide_pause_menu()
         self.ui_manager.is_game_over = False
         self.ui_manager.game_paused = False
         self.ui_manager.reset_score()
         
         # Spieler zurücksetzen
+        self.tween_scheduler.clear()
         self.player.position = (0, 0.5, self.start_z_position)
         self.player.rotation_y = 180
         self.player.scale = self.player.base_scale
@@ -277,20 +385,14 @@ class GameController:
         
         # Welt zurücksetzen
         self.car_manager.cleanup()
+        self.simulation_clock.reset()
         
-        for tile in self.world_generator.tiles:
-            destroy(tile)
-        self.world_generator.tiles.clear()
-        
-        for tree in self.world_generator.trees:
-            destroy(tree)
-        self.world_generator.trees.clear()
-        
-        self.world_generator.lanes.clear()
-        self.world_generator.occupied_tile_positions.clear()
+        self.world_generator.reset()
+        self.visibility_manager.reset()
         
-        # Cooldown zurücksetzen
+        # Cooldown und gepufferte Eingaben zurücksetzen
         self.last_move_time = 0
+        self.input_buffer.clear()
         
         # Neue Welt erstellen
         self.create_initial_world()
@@ -0,0 +1,159 @@
+import logging
+import sys
+import threading
+from collections import deque
+
+# Alle Logger des Spiels hängen unter diesem Namen, z.B. "chickenroad.world_generator"
+LOGGER_PREFIX = "chickenroad"
+
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+LOG_DATE_FORMAT = "%H:%M:%S"
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Nimmt Log-Einträge im Spiel-Thread nur entgegen und legt sie unformatiert
+    in einen Ringpuffer. Ein Hintergrund-Thread formatiert und schreibt sie
+    gesammelt, sodass ein langsames Terminal oder eine Pipe den Frame nicht
+    blockiert. Ist der Puffer voll, werden die ältesten Einträge verworfen.
+    """
+
+    def __init__(self, capacity=4096, stream=None, flush_interval=0.25):
+        """
+        Args:
+            capacity (int): Maximale Anzahl gepufferter Einträge
+            stream (file): Ziel der Ausgabe, Standard ist stdout
+            flush_interval (float): Sekunden zwischen zwei Schreibvorgängen
+        """
+        super().__init__()
+        self.records = deque(maxlen=max(1, capacity))
+        self.stream = stream or sys.stdout
+        self.flush_interval = flush_interval
+        self.write_lock = threading.Lock()
+
+        # Statistiken
+        self.dropped_records = 0
+        self.written_records = 0
+
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.writer_thread = threading.Thread(target=self.run_writer, name="LogWriter", daemon=True)
+        self.writer_thread.start()
+
+    def emit(self, record):
+        """Legt einen Eintrag ohne Formatierung im Ringpuffer ab."""
+        if len(self.records) == self.records.maxlen:
+            self.dropped_records += 1
+        self.records.append(record)
+        if record.levelno >= logging.WARNING:
+            self.wake_event.set()
+
+    def run_writer(self):
+        """Schreibt den Puffer in festen Abständen oder bei Warnungen sofort."""
+        while not self.stop_event.is_set():
+            self.wake_event.wait(self.flush_interval)
+            self.wake_event.clear()
+            self.write_pending()
+        self.write_pending()
+
+    def write_pending(self):
+        """Formatiert alle gepufferten Einträge und schreibt sie in einem Block."""
+        with self.write_lock:
+            lines = []
+            while self.records:
+                record = self.records.popleft()
+                try:
+                    lines.append(self.format(record))
+                except Exception:
+                    self.handleError(record)
+
+            if not lines:
+                return
+            try:
+                self.stream.write("\n".join(lines) + "\n")
+                self.stream.flush()
+                self.written_records += len(lines)
+            except Exception:
+                self.dropped_records += len(lines)
+
+    def flush(self):
+        """Schreibt alle gepufferten Einträge sofort."""
+        self.write_pending()
+
+    def close(self):
+        """Beendet den Hintergrund-Thread und schreibt den Rest des Puffers."""
+        self.stop_event.set()
+        self.wake_event.set()
+        if self.writer_thread.is_alive() and self.writer_thread is not threading.current_thread():
+            self.writer_thread.join(timeout=1.0)
+        self.write_pending()
+        if self.stream not in (sys.stdout, sys.stderr):
+            self.stream.close()
+        super().close()
+
+    def get_stats(self):
+        """
+        Liefert Statistiken zum Puffer.
+
+        Returns:
+            dict: Gepufferte, geschriebene und verworfene Einträge
+        """
+        return {
+            'buffered': len(self.records),
+            'written': self.written_records,
+            'dropped': self.dropped_records
+        }
+
+
+def get_logger(module_name):
+    """
+    Liefert den Logger eines Moduls. Meldungen werden mit %-Platzhaltern
+    übergeben (logger.debug("Lane %d", index)), damit deaktivierte Aufrufe
+    nichts formatieren.
+
+    Args:
+        module_name (str): Name des Moduls, z.B. 'world_generator'
+
+    Returns:
+        logging.Logger: Der Logger
+    """
+    return logging.getLogger(f"{LOGGER_PREFIX}.{module_name}")
+
+
+def setup_logging(settings):
+    """
+    Richtet das Logging nach den Einstellungen ein. Ohne debug_mode werden nur
+    Warnungen und Fehler ausgegeben, einzelne Module lassen sich über
+    log_levels gezielt lauter oder leiser stellen.
+
+    Args:
+        settings (dict): Spieleinstellungen
+
+    Returns:
+        RingBufferHandler: Der eingerichtete Handler
+    """
+    base_logger = logging.getLogger(LOGGER_PREFIX)
+    for handler in list(base_logger.handlers):
+        base_logger.removeHandler(handler)
+        handler.close()
+
+    if settings.get("debug_mode", False):
+        default_level = "DEBUG"
+    else:
+        default_level = settings.get("log_level", "WARNING")
+    base_logger.setLevel(default_level.upper())
+    base_logger.propagate = False
+
+    for module_name, level in settings.get("log_levels", {}).items():
+        get_logger(module_name).setLevel(level.upper())
+
+    log_file = settings.get("log_file")
+    stream = open(log_file, "a", encoding="utf-8") if log_file else sys.stdout
+    handler = RingBufferHandler(
+        settings.get("log_buffer_size", 4096),
+        stream,
+        settings.get("log_flush_interval", 0.25)
+    )
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+    base_logger.addHandler(handler)
+    return handler
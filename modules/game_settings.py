@@ -50,18 +50,54 @@ class GameSettings:
             "level_width": 12,
             "min_car_speed": 2,
             "max_car_speed": 5,
-            "car_spawn_chance": 0.18,
+            "car_spawn_mean_interval": 4.0,
+            "car_spawn_distribution": "exponential",
             "move_cooldown": 0.1,
+            "input_buffer_depth": 3,
+            "input_stale_timeout": 0.3,
             "tree_spawn_chance": 0.7,
             "min_trees_per_lane": 3,
             "max_trees_per_lane": 6,
             "tree_spawn_distance": 2.5,
-            "cleanup_distance": 120
+            "cleanup_distance": 120,
+            "tile_pool_max_size": 512,
+            "merge_static_geometry": False,
+            "lanes_per_chunk": 4,
+            "instanced_rendering": False,
+            "max_instances_per_batch": 4096,
+            "world_build_budget_ms": 4.0,
+            "world_lookahead_lanes": 20,
+            "world_min_ready_lanes": 5,
+            "world_seed": None,
+            "collider_policy": {
+                "tile": "none",
+                "tree": "lazy",
+                "car": "lazy"
+            },
+            "visibility_culling": True,
+            "visibility_update_interval": 0.1,
+            "visibility_margin": 3.0,
+            "simulation_tick_rate": 60,
+            "max_ticks_per_frame": 8,
+            "tween_capacity": 32,
+            "car_pool_warmup": 8,
+            "car_pool_max_size": 64,
+            "highscore_save_interval": 2.0,
+            "run_history_file": "assets/run_history.db",
+            "run_history_batch_size": 256,
+            "run_history_flush_interval": 1.0,
+            "debug_mode": False,
+            "log_level": "WARNING",
+            "log_levels": {},
+            "log_file": None,
+            "log_buffer_size": 4096,
+            "log_flush_interval": 0.25
         }
         self.display_settings = {
             "window_fullscreen": False,  # Vorerst deaktiviert wegen Fehler
             "window_borderless": False,
             "camera_fov": 80,
             "camera_near": 0.1,
-            "camera_far": 100.0
+            "camera_far": 100.0,
+            "render_fps_limit": None
         }
\ No newline at end of file
@@ -1,14 +1,46 @@
+import atexit
 import json
 import os
+import threading
+from modules.game_logging import get_logger
+
+logger = get_logger("highscore_manager")
 
 class HighscoreManager:
     """
     Verwaltet das Laden und Speichern des Highscores.
+    Neue Werte werden nur vorgemerkt, ein Hintergrund-Thread schreibt den
+    jeweils letzten Wert höchstens alle save_interval Sekunden, sodass die
+    Spielschleife nie auf die Festplatte wartet. Geschrieben wird in eine
+    temporäre Datei, die anschließend atomar umbenannt wird.
     """
     
-    def __init__(self, filename="assets/highscore.json"):
+    def __init__(self, filename="assets/highscore.json", save_interval=2.0):
+        """
+        Args:
+            filename (str): Pfad der Highscore-Datei
+            save_interval (float): Mindestabstand zwischen zwei Schreibvorgängen in Sekunden
+        """
         self.highscore_file = filename
+        self.save_interval = save_interval
         self.current_highscore = self.load_highscore()
+        
+        # Noch nicht geschriebener Wert, None falls nichts ansteht
+        self.pending_highscore = None
+        self.pending_lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        
+        # Statistiken
+        self.saves_requested = 0
+        self.saves_written = 0
+        self.save_errors = 0
+        
+        self.flush_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.writer_thread = threading.Thread(target=self.run_writer, name="HighscoreWriter", daemon=True)
+        self.writer_thread.start()
+        # Beim Beenden den letzten Stand sicher schreiben
+        atexit.register(self.close)
     
     def load_highscore(self):
         """
@@ -28,13 +60,73 @@ class HighscoreManager:
     
     def save_highscore(self, value):
         """
-        Speichert einen neuen Highscore.
+        Merkt einen neuen Highscore zum Speichern vor, ohne auf die Festplatte zuzugreifen.
         
         Args:
             value (float): Der neue Highscore-Wert
         """
-        with open(self.highscore_file, "w") as file:
-            json.dump({"highscore": value}, file)
+        self.current_highscore = value
+        with self.pending_lock:
+            self.pending_highscore = value
+        self.saves_requested += 1
+    
+    def run_writer(self):
+        """Schreibt vorgemerkte Werte in festen Abständen oder sofort bei flush()."""
+        while not self.stop_event.is_set():
+            self.flush_event.wait(self.save_interval)
+            self.flush_event.clear()
+            self.write_pending()
+    
+    def write_pending(self):
+        """Schreibt den zuletzt vorgemerkten Highscore atomar in die Datei."""
+        with self.write_lock:
+            with self.pending_lock:
+                value = self.pending_highscore
+                self.pending_highscore = None
+            if value is None:
+                return
+            
+            temp_file = self.highscore_file + ".tmp"
+            try:
+                with open(temp_file, "w") as file:
+                    json.dump({"highscore": value}, file)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(temp_file, self.highscore_file)
+                self.saves_written += 1
+            except Exception as e:
+                self.save_errors += 1
+                logger.error("❌ Highscore konnte nicht gespeichert werden: %s", e)
+                # Wert erneut vormerken, sofern inzwischen kein neuerer ansteht
+                with self.pending_lock:
+                    if self.pending_highscore is None:
+                        self.pending_highscore = value
+    
+    def flush(self):
+        """Lässt den Hintergrund-Thread den vorgemerkten Wert sofort schreiben, z.B. bei Pause oder Game Over."""
+        self.flush_event.set()
+    
+    def close(self):
+        """Beendet den Hintergrund-Thread und schreibt den letzten Stand."""
+        self.stop_event.set()
+        self.flush_event.set()
+        if self.writer_thread.is_alive() and self.writer_thread is not threading.current_thread():
+            self.writer_thread.join(timeout=1.0)
+        self.write_pending()
+    
+    def get_stats(self):
+        """
+        Liefert Statistiken zum Speichern.
+        
+        Returns:
+            dict: Angeforderte und geschriebene Speicherungen sowie Fehler
+        """
+        return {
+            'requested': self.saves_requested,
+            'written': self.saves_written,
+            'errors': self.save_errors,
+            'pending': self.pending_highscore is not None
+        }
     
     def update_highscore(self, new_score):
         """
@@ -47,7 +139,6 @@ class HighscoreManager:
             bool: True falls Highscore aktualisiert wurde, sonst False
         """
         if new_score > self.current_highscore:
-            self.current_highscore = new_score
             self.save_highscore(new_score)
             return True
         return False
\ No newline at end of file
@@ -0,0 +1,91 @@
+from collections import deque
+
+
+class InputBuffer:
+    """
+    Kleine, begrenzte Warteschlange für Bewegungstasten. Tasten, die während
+    des Bewegungs-Cooldowns gedrückt werden, gehen nicht verloren, sondern
+    werden ausgeführt, sobald der Cooldown es erlaubt. Zu alte Eingaben
+    verfallen, damit der Spieler nicht Bewegungen nachläuft, die er längst
+    nicht mehr will.
+    """
+
+    def __init__(self, settings):
+        self.max_depth = max(1, settings.get("input_buffer_depth", 3))
+        self.stale_timeout = settings.get("input_stale_timeout", 0.3)
+        # Einträge (Taste, Zeitpunkt des Tastendrucks)
+        self.pending_inputs = deque()
+
+        # Statistiken
+        self.dropped_inputs = 0
+        self.stale_inputs = 0
+        self.dispatched_inputs = 0
+        self.total_delay = 0.0
+        self.max_delay = 0.0
+
+    def push(self, key, pressed_at):
+        """
+        Nimmt eine Taste auf. Ist die Warteschlange voll, fällt die älteste Eingabe weg.
+
+        Args:
+            key (str): Die gedrückte Taste
+            pressed_at (float): Zeitpunkt des Tastendrucks
+        """
+        if len(self.pending_inputs) >= self.max_depth:
+            self.pending_inputs.popleft()
+            self.dropped_inputs += 1
+        self.pending_inputs.append((key, pressed_at))
+
+    def pop(self, now):
+        """
+        Liefert die älteste noch gültige Eingabe. Verfallene Eingaben werden verworfen.
+
+        Args:
+            now (float): Aktuelle Zeit
+
+        Returns:
+            tuple: (Taste, Zeitpunkt des Tastendrucks), None falls leer
+        """
+        while self.pending_inputs:
+            key, pressed_at = self.pending_inputs.popleft()
+            if now - pressed_at <= self.stale_timeout:
+                return key, pressed_at
+            self.stale_inputs += 1
+        return None
+
+    def record_dispatch(self, pressed_at, now):
+        """
+        Misst die Verzögerung zwischen Tastendruck und ausgeführter Bewegung.
+
+        Args:
+            pressed_at (float): Zeitpunkt des Tastendrucks
+            now (float): Zeitpunkt der Bewegung
+        """
+        delay = now - pressed_at
+        self.dispatched_inputs += 1
+        self.total_delay += delay
+        self.max_delay = max(self.max_delay, delay)
+
+    def clear(self):
+        """Verwirft alle wartenden Eingaben."""
+        self.pending_inputs.clear()
+
+    def get_stats(self):
+        """
+        Liefert Statistiken zu Eingaben und Verzögerung.
+
+        Returns:
+            dict: Ausgeführte, verworfene und verfallene Eingaben sowie Verzögerung in ms
+        """
+        average_delay = self.total_delay / self.dispatched_inputs if self.dispatched_inputs else 0.0
+        return {
+            'dispatched': self.dispatched_inputs,
+            'dropped': self.dropped_inputs,
+            'stale': self.stale_inputs,
+            'pending': len(self.pending_inputs),
+            'average_delay_ms': average_delay * 1000.0,
+            'max_delay_ms': self.max_delay * 1000.0
+        }
+
+    def __len__(self):
+        return len(self.pending_inputs)
@@ -0,0 +1,207 @@
+from ursina import *
+from array import array
+from panda3d.core import Texture as PandaTexture, GeomEnums, OmniBoundingVolume
+
+# Jede Instanz belegt zwei Texel im Buffer: (x, y, z, heading) und (sx, sy, sz, 0).
+# Die Werte liegen in Panda3D-Koordinaten (z zeigt nach oben).
+FLOATS_PER_INSTANCE = 8
+
+instancing_shader = Shader(
+    name='chickenroad_instancing_shader',
+    language=Shader.GLSL,
+    vertex='''
+#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform samplerBuffer instance_data;
+in vec4 p3d_Vertex;
+in vec4 p3d_Color;
+in vec2 p3d_MultiTexCoord0;
+out vec2 texcoords;
+out vec4 vertex_color;
+
+void main() {
+    vec4 placement = texelFetch(instance_data, gl_InstanceID * 2);
+    vec4 scale = texelFetch(instance_data, gl_InstanceID * 2 + 1);
+    float heading = radians(placement.w);
+    float c = cos(heading);
+    float s = sin(heading);
+    vec3 v = p3d_Vertex.xyz * scale.xyz;
+    vec3 rotated = vec3(v.x * c - v.y * s, v.x * s + v.y * c, v.z);
+    gl_Position = p3d_ModelViewProjectionMatrix * vec4(rotated + placement.xyz, 1.0);
+    texcoords = p3d_MultiTexCoord0;
+    vertex_color = p3d_Color;
+}
+''',
+    fragment='''
+#version 140
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+in vec2 texcoords;
+in vec4 vertex_color;
+out vec4 fragColor;
+
+void main() {
+    fragColor = texture(p3d_Texture0, texcoords) * vertex_color * p3d_ColorScale;
+}
+''',
+)
+
+
+class InstanceHandle:
+    """Verweis auf eine Instanz in einem InstancedBatch."""
+    __slots__ = ('slot',)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+
+class InstancedBatch(Entity):
+    """
+    Rendert beliebig viele Kopien eines Modells mit einem einzigen Draw Call.
+    Die Transformationen der Instanzen liegen in einem Buffer, Hinzufügen und
+    Entfernen ändert nur diesen Buffer und erzeugt keine Scene-Nodes.
+    """
+
+    def __init__(self, model, max_instances=4096, **kwargs):
+        """
+        Args:
+            model (str | NodePath): Modellpfad oder bereits geladenes Modell
+            max_instances (int): Kapazität des Instanz-Buffers
+        """
+        super().__init__(**kwargs)
+        self.max_instances = max_instances
+
+        template = load_model(model) if isinstance(model, str) else model
+        if template is None:
+            raise ValueError(f"Modell {model} nicht gefunden")
+        template.copy_to(self)
+        # Interne Transformationen des Modells in die Vertices übernehmen,
+        # damit der Shader nur noch die Instanz-Transformation anwenden muss
+        self.flatten_strong()
+
+        min_point, max_point = self.get_tight_bounds()
+        # Lokale Bounds in Ursina-Achsen (y zeigt nach oben)
+        self.local_center = Vec3(
+            (min_point.x + max_point.x) / 2,
+            (min_point.z + max_point.z) / 2,
+            (min_point.y + max_point.y) / 2
+        )
+        self.local_size = Vec3(
+            max_point.x - min_point.x,
+            max_point.z - min_point.z,
+            max_point.y - min_point.y
+        )
+
+        self.instance_data = array('f', [0.0]) * (max_instances * FLOATS_PER_INSTANCE)
+        self.buffer_texture = PandaTexture('instance_data')
+        self.buffer_texture.setup_buffer_texture(
+            max_instances * 2, PandaTexture.T_float, PandaTexture.F_rgba32, GeomEnums.UH_dynamic
+        )
+        self.shader = instancing_shader
+        self.set_shader_input('instance_data', self.buffer_texture)
+
+        # Instanzen liegen überall in der Welt, daher nicht anhand der Template-Bounds cullen
+        self.node().set_bounds(OmniBoundingVolume())
+        self.node().set_final(True)
+
+        self.handles = []
+        self.dirty = True
+        self.visible = False
+
+    @property
+    def instance_count(self):
+        return len(self.handles)
+
+    @property
+    def is_full(self):
+        """True, wenn keine weitere Instanz in den Buffer passt."""
+        return len(self.handles) >= self.max_instances
+
+    def add(self, position, rotation_y=0, scale=(1, 1, 1)):
+        """
+        Fügt eine Instanz hinzu.
+
+        Args:
+            position (tuple): Position in Ursina-Koordinaten
+            rotation_y (float): Drehung um die Hochachse wie bei Entity.rotation_y
+            scale (tuple): Skalierung in Ursina-Achsen
+
+        Returns:
+            InstanceHandle: Verweis auf die Instanz
+        """
+        if self.is_full:
+            raise RuntimeError(f"Instanz-Buffer voll ({self.max_instances})")
+
+        handle = InstanceHandle(len(self.handles))
+        self.handles.append(handle)
+
+        offset = handle.slot * FLOATS_PER_INSTANCE
+        self.instance_data[offset + 4] = scale[0]
+        self.instance_data[offset + 5] = scale[2]
+        self.instance_data[offset + 6] = scale[1]
+        self.instance_data[offset + 3] = -rotation_y
+        self.set_position_of(handle, position)
+        return handle
+
+    def set_position_of(self, handle, position):
+        """
+        Setzt die Position einer Instanz.
+
+        Args:
+            handle (InstanceHandle): Die Instanz
+            position (tuple): Neue Position in Ursina-Koordinaten
+        """
+        offset = handle.slot * FLOATS_PER_INSTANCE
+        self.instance_data[offset] = position[0]
+        self.instance_data[offset + 1] = position[2]
+        self.instance_data[offset + 2] = position[1]
+        self.dirty = True
+
+    def set_x_of(self, handle, x):
+        """
+        Setzt nur die X-Position einer Instanz.
+
+        Args:
+            handle (InstanceHandle): Die Instanz
+            x (float): Neue X-Position
+        """
+        self.instance_data[handle.slot * FLOATS_PER_INSTANCE] = x
+        self.dirty = True
+
+    def remove(self, handle):
+        """
+        Entfernt eine Instanz. Die letzte Instanz rückt in die frei gewordene Lücke.
+
+        Args:
+            handle (InstanceHandle): Die zu entfernende Instanz
+        """
+        last_handle = self.handles.pop()
+        if last_handle is not handle:
+            source = last_handle.slot * FLOATS_PER_INSTANCE
+            target = handle.slot * FLOATS_PER_INSTANCE
+            self.instance_data[target:target + FLOATS_PER_INSTANCE] = \
+                self.instance_data[source:source + FLOATS_PER_INSTANCE]
+            last_handle.slot = handle.slot
+            self.handles[handle.slot] = last_handle
+        handle.slot = -1
+        self.dirty = True
+
+    def clear(self):
+        """Entfernt alle Instanzen."""
+        for handle in self.handles:
+            handle.slot = -1
+        self.handles.clear()
+        self.dirty = True
+
+    def update(self):
+        """Lädt den Buffer höchstens einmal pro Frame hoch, falls er sich geändert hat."""
+        if not self.dirty:
+            return
+        self.dirty = False
+
+        count = len(self.handles)
+        # Instanzanzahl 0 würde Instancing abschalten und das Modell einmal zeichnen
+        self.visible = count > 0
+        if count:
+            self.buffer_texture.set_ram_image(self.instance_data.tobytes())
+            self.set_instance_count(count)
@@ -0,0 +1,254 @@
+import math
+import random
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional, ohne wird Lane für Lane erzeugt
+    np = None
+
+# Kompakter Datensatz einer Lane ohne jede Entity
+LaneLayout = namedtuple('LaneLayout', ['index', 'lane_type', 'direction', 'car_speed', 'tree_positions'])
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+# Unabhängige Zufallsströme pro Eigenschaft einer Lane
+STREAM_TYPE = 1
+STREAM_DIRECTION = 2
+STREAM_SPEED = 3
+STREAM_TREE_CHANCE = 4
+STREAM_TREE_COUNT = 5
+# Ab hier ein eigener Strom pro Baum-Slot
+STREAM_TREE_SLOTS = 64
+
+
+def mix64(value):
+    """SplitMix64-Finalizer: verteilt die Bits eines 64-Bit-Werts gleichmäßig."""
+    value = (value + 0x9E3779B97F4A7C15) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+def stream_key(seed, stream):
+    """Startwert eines Zufallsstroms für einen Seed."""
+    return mix64((seed ^ (stream * 0xD1B54A32D192ED03)) & MASK_64)
+
+
+def lane_hash(seed, index, stream):
+    """
+    Zählerbasierter Zufallswert: hängt nur von Seed, Lane-Index und Strom ab.
+
+    Returns:
+        int: 64-Bit-Hash
+    """
+    return mix64((stream_key(seed, stream) + (index & MASK_64)) & MASK_64)
+
+
+def lane_uniform(seed, index, stream):
+    """
+    Gleichverteilte Zahl in [0, 1) für eine Lane.
+
+    Returns:
+        float: Zufallswert
+    """
+    return (lane_hash(seed, index, stream) >> 11) * (1.0 / (1 << 53))
+
+
+def lane_uniform_batch(seed, indices, stream):
+    """
+    Vektorisierte Variante von lane_uniform, liefert bitgenau dieselben Werte.
+
+    Args:
+        seed (int): Welt-Seed
+        indices (np.ndarray): Lane-Indizes (int64)
+        stream (int): Zufallsstrom
+
+    Returns:
+        np.ndarray: Zufallswerte in [0, 1)
+    """
+    with np.errstate(over='ignore'):
+        values = indices.astype(np.int64).view(np.uint64) + np.uint64(stream_key(seed, stream))
+        values = values + np.uint64(0x9E3779B97F4A7C15)
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        values = values ^ (values >> np.uint64(31))
+    return (values >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+class LaneLayoutGenerator:
+    """
+    Erzeugt aus einem Seed und einem Lane-Index den Aufbau einer Lane:
+    Typ, Fahrtrichtung, Auto-Geschwindigkeit und Baum-Positionen.
+    Gleicher Seed und Index ergeben immer dieselbe Lane, unabhängig davon,
+    in welcher Reihenfolge oder Menge die Lanes erzeugt werden.
+    """
+
+    def __init__(self, settings, seed=None):
+        """
+        Args:
+            settings (dict): Spieleinstellungen
+            seed (int): Welt-Seed, None für einen zufälligen Seed
+        """
+        self.settings = settings
+        self.level_width = settings["level_width"]
+        self.seed = None
+        self.reseed(seed)
+        
+        # Bäume stehen auf ganzen Tile-Spalten im Bereich ±level_width.
+        # Zwei Bäume liegen mindestens slot_step Spalten auseinander.
+        self.tile_size = settings.get("tile_size", 1)
+        half_columns = int(self.level_width // self.tile_size)
+        self.first_tree_column = -half_columns
+        self.tree_column_count = 2 * half_columns + 1
+        self.tree_slot_step = max(1, math.ceil(settings["tree_spawn_distance"] / self.tile_size))
+        self.max_trees_per_lane = (self.tree_column_count - 1) // self.tree_slot_step + 1
+
+    def reseed(self, seed=None):
+        """
+        Setzt einen neuen Welt-Seed.
+
+        Args:
+            seed (int): Neuer Seed, None für einen zufälligen Seed
+        """
+        self.seed = random.getrandbits(63) if seed is None else int(seed) & MASK_64
+
+    def layout(self, index):
+        """
+        Erzeugt den Aufbau einer einzelnen Lane.
+
+        Args:
+            index (int): Index der Lane
+
+        Returns:
+            LaneLayout: Der Aufbau der Lane
+        """
+        is_road = lane_uniform(self.seed, index, STREAM_TYPE) < 0.5
+        if is_road:
+            direction = -1 if lane_uniform(self.seed, index, STREAM_DIRECTION) < 0.5 else 1
+            car_speed = self.car_speed_from(lane_uniform(self.seed, index, STREAM_SPEED))
+            return LaneLayout(index, 'road', direction, car_speed, ())
+
+        tree_count = self.tree_count_from(
+            lane_uniform(self.seed, index, STREAM_TREE_CHANCE),
+            lane_uniform(self.seed, index, STREAM_TREE_COUNT)
+        )
+        return LaneLayout(index, 'grass', 0, 0.0, self.tree_positions(index, tree_count))
+
+    def layouts(self, start_index, count):
+        """
+        Erzeugt den Aufbau mehrerer aufeinanderfolgender Lanes. Mit NumPy werden
+        Typ, Richtung, Geschwindigkeit und Baum-Positionen aller Lanes gemeinsam berechnet.
+
+        Args:
+            start_index (int): Index der ersten Lane
+            count (int): Anzahl der Lanes
+
+        Returns:
+            list: LaneLayout pro Lane, identisch zu einzelnen layout()-Aufrufen
+        """
+        if np is None:
+            return [self.layout(index) for index in range(start_index, start_index + count)]
+
+        indices = np.arange(start_index, start_index + count, dtype=np.int64)
+        is_road = lane_uniform_batch(self.seed, indices, STREAM_TYPE) < 0.5
+        directions = np.where(lane_uniform_batch(self.seed, indices, STREAM_DIRECTION) < 0.5, -1, 1)
+        speeds = self.car_speed_from(lane_uniform_batch(self.seed, indices, STREAM_SPEED))
+        tree_counts = self.tree_count_from(
+            lane_uniform_batch(self.seed, indices, STREAM_TREE_CHANCE),
+            lane_uniform_batch(self.seed, indices, STREAM_TREE_COUNT)
+        )
+        tree_positions = self.tree_positions_batch(indices, np.where(is_road, 0, tree_counts))
+
+        layouts = []
+        for offset, index in enumerate(range(start_index, start_index + count)):
+            if is_road[offset]:
+                layouts.append(LaneLayout(index, 'road', int(directions[offset]), float(speeds[offset]), ()))
+            else:
+                layouts.append(LaneLayout(index, 'grass', 0, 0.0, tree_positions[offset]))
+        return layouts
+
+    def car_speed_from(self, uniform_value):
+        """Bildet einen Zufallswert auf den Geschwindigkeitsbereich der Autos ab."""
+        min_speed = self.settings["min_car_speed"]
+        max_speed = self.settings["max_car_speed"]
+        return min_speed + uniform_value * (max_speed - min_speed)
+
+    def tree_count_from(self, chance_value, count_value):
+        """
+        Bildet zwei Zufallswerte auf die Baumanzahl einer Gras-Lane ab.
+        Funktioniert für einzelne Werte und für NumPy-Arrays.
+        """
+        min_trees = self.settings["min_trees_per_lane"]
+        max_trees = self.settings["max_trees_per_lane"]
+        counts = min_trees + count_value * (max_trees - min_trees + 1)
+        if np is not None and isinstance(counts, np.ndarray):
+            return np.where(chance_value < self.settings["tree_spawn_chance"], counts.astype(np.int64), 0)
+        return int(counts) if chance_value < self.settings["tree_spawn_chance"] else 0
+
+
+    def tree_positions(self, index, tree_count):
+        """
+        Wählt die X-Positionen der Bäume einer Lane aus festen Spalten-Slots.
+        Aus den Spalten werden zuerst (Anzahl - 1) * (slot_step - 1) Lücken-Spalten
+        herausgenommen, aus dem Rest werden die Bäume zufällig gezogen und danach
+        wieder auseinandergeschoben. So wird der Mindestabstand immer eingehalten,
+        die Laufzeit ist begrenzt und die gewünschte Anzahl wird immer platziert,
+        solange sie in die Lane passt.
+
+        Args:
+            index (int): Index der Lane
+            tree_count (int): Gewünschte Anzahl Bäume
+
+        Returns:
+            tuple: X-Positionen der Bäume, aufsteigend sortiert
+        """
+        tree_count = min(tree_count, self.max_trees_per_lane)
+        if tree_count <= 0:
+            return ()
+
+        free_slots = self.tree_column_count - (tree_count - 1) * (self.tree_slot_step - 1)
+        slot_keys = sorted(
+            (lane_uniform(self.seed, index, STREAM_TREE_SLOTS + slot), slot)
+            for slot in range(free_slots)
+        )
+        picked_slots = sorted(slot for _, slot in slot_keys[:tree_count])
+        return tuple(
+            float((self.first_tree_column + slot + order * (self.tree_slot_step - 1)) * self.tile_size)
+            for order, slot in enumerate(picked_slots)
+        )
+
+    def tree_positions_batch(self, indices, tree_counts):
+        """
+        Vektorisierte Variante von tree_positions für viele Lanes auf einmal.
+
+        Args:
+            indices (np.ndarray): Lane-Indizes
+            tree_counts (np.ndarray): Gewünschte Baumanzahl pro Lane
+
+        Returns:
+            list: Tupel mit X-Positionen pro Lane, identisch zu tree_positions
+        """
+        tree_counts = np.minimum(tree_counts, self.max_trees_per_lane)
+        free_slots = self.tree_column_count - (np.maximum(tree_counts, 1) - 1) * (self.tree_slot_step - 1)
+
+        # Zufallsschlüssel pro Lane und Slot; Slots außerhalb des freien Bereichs kommen nie dran
+        slot_range = np.arange(self.tree_column_count)
+        slot_keys = np.stack(
+            [lane_uniform_batch(self.seed, indices, STREAM_TREE_SLOTS + slot) for slot in range(self.tree_column_count)],
+            axis=1
+        )
+        slot_keys[slot_range[None, :] >= free_slots[:, None]] = np.inf
+
+        # Die tree_count kleinsten Schlüssel gewinnen, nicht gewählte Plätze landen beim Sortieren hinten
+        max_count = int(tree_counts.max()) if len(tree_counts) else 0
+        picked_slots = np.argsort(slot_keys, axis=1, kind='stable')[:, :max_count]
+        order = np.arange(max_count)[None, :]
+        picked_slots = np.sort(np.where(order < tree_counts[:, None], picked_slots, self.tree_column_count), axis=1)
+        columns = self.first_tree_column + picked_slots + order * (self.tree_slot_step - 1)
+        positions = columns * self.tile_size
+
+        return [
+            tuple(float(x) for x in positions[row, :tree_counts[row]])
+            for row in range(len(indices))
+        ]
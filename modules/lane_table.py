@@ -0,0 +1,126 @@
+from bisect import bisect_left
+from collections import deque
+
+
+class LaneRecord:
+    """Kompakter Datensatz einer Lane in der Welt."""
+    __slots__ = ('index', 'z', 'lane_type', 'direction', 'speed')
+
+    def __init__(self, index, z, lane_type, direction=0, speed=0.0):
+        self.index = index
+        self.z = z
+        self.lane_type = lane_type
+        self.direction = direction
+        self.speed = speed
+
+
+class LaneTable:
+    """
+    Alle Lanes, die gerade in der Welt sind, nach Index abrufbar.
+    Die Indizes werden aufsteigend gehalten, sodass der höchste Index und die
+    Lanes hinter dem Spieler ohne Durchsuchen bekannt sind. Die Indizes der
+    Straßen-Lanes werden als eigene Deque mitgeführt.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.lane_indices = deque()
+        self.road_lane_indices = deque()
+
+    @property
+    def max_index(self):
+        """Höchster Lane-Index, None falls keine Lane existiert."""
+        return self.lane_indices[-1] if self.lane_indices else None
+
+    def add(self, index, z_position, lane_type, direction=0, speed=0.0):
+        """
+        Nimmt eine neue Lane auf.
+
+        Args:
+            index (int): Index der Lane
+            z_position (float): Z-Position der Lane
+            lane_type (str): Typ der Lane ('road' oder 'grass')
+            direction (int): Fahrtrichtung der Autos
+            speed (float): Geschwindigkeit der Autos
+
+        Returns:
+            LaneRecord: Der Datensatz der Lane
+        """
+        if index in self.records:
+            self.remove(index)
+
+        record = LaneRecord(index, z_position, lane_type, direction, speed)
+        self.records[index] = record
+
+        if not self.lane_indices or self.lane_indices[-1] < index:
+            self.lane_indices.append(index)
+        else:
+            # Selten: Lane vor der letzten Lane, z.B. beim Neustart
+            self.lane_indices.insert(bisect_left(self.lane_indices, index), index)
+
+        if lane_type == 'road':
+            if not self.road_lane_indices or self.road_lane_indices[-1] < index:
+                self.road_lane_indices.append(index)
+            else:
+                self.road_lane_indices.insert(bisect_left(self.road_lane_indices, index), index)
+        return record
+
+    def get(self, index):
+        """
+        Liefert den Datensatz einer Lane.
+
+        Args:
+            index (int): Index der Lane
+
+        Returns:
+            LaneRecord: Datensatz, None falls die Lane nicht existiert
+        """
+        return self.records.get(index)
+
+    def remove(self, index):
+        """
+        Entfernt eine einzelne Lane.
+
+        Args:
+            index (int): Index der Lane
+        """
+        record = self.records.pop(index, None)
+        if record is None:
+            return
+        self.lane_indices.remove(index)
+        if record.lane_type == 'road':
+            self.road_lane_indices.remove(index)
+
+    def pop_behind(self, threshold):
+        """
+        Entfernt alle Lanes mit Z-Position kleiner als die Schwelle.
+
+        Args:
+            threshold (float): Z-Schwelle
+
+        Returns:
+            list: Die entfernten Datensätze
+        """
+        removed = []
+        while self.lane_indices and self.records[self.lane_indices[0]].z < threshold:
+            record = self.records.pop(self.lane_indices.popleft())
+            if record.lane_type == 'road':
+                self.road_lane_indices.popleft()
+            removed.append(record)
+        return removed
+
+    def clear(self):
+        """Entfernt alle Lanes."""
+        self.records.clear()
+        self.lane_indices.clear()
+        self.road_lane_indices.clear()
+
+    def __contains__(self, index):
+        return index in self.records
+
+    def __iter__(self):
+        for index in self.lane_indices:
+            yield self.records[index]
+
+    def __len__(self):
+        return len(self.records)
@@ -0,0 +1,162 @@
+from ursina import *
+import hashlib
+import json
+import os
+from modules.game_logging import get_logger
+
+logger = get_logger("model_metadata_cache")
+
+class ModelMetadataCache:
+    """
+    Speichert Abmessungen (Bounds) aller Modelle unter assets/models auf der
+    Festplatte. Jeder Eintrag ist an den Inhalts-Hash der Modelldatei gebunden,
+    sodass nach dem ersten Start kein Modell mehr nur zum Ausmessen geladen wird.
+    """
+
+    CACHE_VERSION = 1
+    MODEL_FILE_TYPES = ('.glb', '.gltf', '.obj', '.bam', '.egg')
+
+    def __init__(self, cache_file="assets/model_metadata.json", models_folder="assets/models"):
+        self.cache_file = cache_file
+        self.models_folder = models_folder
+        self.entries = {}
+        self.is_validated = False
+        self.load_cache()
+
+    def load_cache(self):
+        """Lädt die gespeicherten Metadaten, falls vorhanden."""
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, "r") as file:
+                data = json.load(file)
+            if data.get("version") == self.CACHE_VERSION:
+                self.entries = data.get("models", {})
+        except Exception as e:
+            logger.warning("⚠️ Modell-Metadaten konnten nicht geladen werden: %s", e)
+            self.entries = {}
+
+    def save_cache(self):
+        """Schreibt die Metadaten über eine temporäre Datei auf die Festplatte."""
+        temp_file = self.cache_file + ".tmp"
+        try:
+            with open(temp_file, "w") as file:
+                json.dump({"version": self.CACHE_VERSION, "models": self.entries}, file, indent=2)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            logger.warning("⚠️ Modell-Metadaten konnten nicht gespeichert werden: %s", e)
+
+    def ensure_built(self):
+        """
+        Prüft beim ersten Zugriff alle Modelle im Modellordner und misst
+        neue oder geänderte Modelle neu aus.
+        """
+        if self.is_validated:
+            return
+        self.is_validated = True
+
+        changed = False
+        for file_name in sorted(os.listdir(self.models_folder)):
+            if file_name.lower().endswith(self.MODEL_FILE_TYPES):
+                changed |= self.refresh_entry(os.path.join(self.models_folder, file_name))
+
+        if changed:
+            self.save_cache()
+
+    def refresh_entry(self, model_path):
+        """
+        Aktualisiert den Eintrag eines Modells, falls er fehlt oder veraltet ist.
+        Der Hash wird nur neu berechnet, wenn sich Größe oder Änderungszeit
+        der Datei geändert haben.
+
+        Args:
+            model_path (str): Pfad zur Modelldatei
+
+        Returns:
+            bool: True falls der Eintrag neu erstellt wurde
+        """
+        key = os.path.basename(model_path)
+        file_stat = os.stat(model_path)
+        entry = self.entries.get(key)
+
+        if entry and entry["size_bytes"] == file_stat.st_size and entry["mtime"] == file_stat.st_mtime:
+            return False
+
+        content_hash = self.hash_file(model_path)
+        if entry and entry["sha1"] == content_hash:
+            entry["size_bytes"] = file_stat.st_size
+            entry["mtime"] = file_stat.st_mtime
+            return True
+
+        logger.info("📐 Messe Modell aus: %s", key)
+        center, size = self.measure_model(model_path)
+        self.entries[key] = {
+            "sha1": content_hash,
+            "size_bytes": file_stat.st_size,
+            "mtime": file_stat.st_mtime,
+            "bounds_center": center,
+            "bounds_size": size
+        }
+        return True
+
+    def hash_file(self, model_path):
+        """
+        Berechnet den Inhalts-Hash einer Datei.
+
+        Args:
+            model_path (str): Pfad zur Datei
+
+        Returns:
+            str: SHA-1 als Hex-String
+        """
+        digest = hashlib.sha1()
+        with open(model_path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def measure_model(self, model_path):
+        """
+        Lädt ein Modell einmalig und ermittelt seine unskalierten Bounds.
+
+        Args:
+            model_path (str): Pfad zum Modell
+
+        Returns:
+            tuple: (center, size) als Listen [x, y, z]
+        """
+        temp_entity = Entity(model=model_path)
+        bounds = temp_entity.bounds
+        destroy(temp_entity)
+        return list(bounds.center), list(bounds.size)
+
+    def get_bounds(self, model_path):
+        """
+        Liefert die unskalierten Bounds eines Modells.
+
+        Args:
+            model_path (str): Pfad zum Modell
+
+        Returns:
+            tuple: (center, size) als Vec3
+        """
+        self.ensure_built()
+        key = os.path.basename(model_path)
+        if key not in self.entries and os.path.exists(model_path):
+            self.refresh_entry(model_path)
+            self.save_cache()
+
+        entry = self.entries[key]
+        return Vec3(*entry["bounds_center"]), Vec3(*entry["bounds_size"])
+
+    def get_size(self, model_path):
+        """
+        Liefert die unskalierte Größe eines Modells.
+
+        Args:
+            model_path (str): Pfad zum Modell
+
+        Returns:
+            Vec3: Breite, Höhe und Länge des Modells
+        """
+        return self.get_bounds(model_path)[1]
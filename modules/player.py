@@ -1,22 +1,32 @@
 from ursina import *
 import time
+from modules.game_logging import get_logger
+from modules.tween_scheduler import hop_arc
+from modules.collision_box import entity_world_box
+
+logger = get_logger("player")
 
 class Player(Entity):
     """
     Repräsentiert den Spieler-Charakter mit Bewegungslogik und Animationen.
     """
     
-    def __init__(self, start_position=(0, 1.0, 0)):
+    model_path = 'assets/models/crossy_road_style_yellow_chicken.glb'
+    
+    def __init__(self, start_position=(0, 1.0, 0), metadata_cache=None, tween_scheduler=None):
+        uses_model = True
+        
         # Verwende einen einfachen Würfel als Fallback, falls das Modell nicht geladen werden kann
         try:
             super().__init__(
-                model='assets/models/crossy_road_style_yellow_chicken.glb',
+                model=self.model_path,
                 position=start_position,
                 rotation=(0, 180, 0),
                 collider='box'
             )
         except Exception as e:
-            print(f"⚠️ Spieler-Modell konnte nicht geladen werden: {e}")
+            logger.warning("⚠️ Spieler-Modell konnte nicht geladen werden: %s", e)
+            uses_model = False
             super().__init__(
                 model='cube',
                 position=start_position,
@@ -24,7 +34,11 @@ class Player(Entity):
                 color=color.yellow,
                 collider='box'
             )
-            
+        
+        self.metadata_cache = metadata_cache
+        # Ohne Scheduler laufen die Animationen über Ursinas animate_*
+        self.tween_scheduler = tween_scheduler
+        self.uses_model = uses_model
         self.base_scale = 1
         self.base_y_position = 1
         self.last_move_time = 0
@@ -39,10 +53,13 @@ class Player(Entity):
         Passt die Spielergröße an die gewünschte Höhe an.
         """
         try:
-            bounds = self.bounds
-            model_height = bounds.size.y
+            # Höhe aus dem Metadaten-Cache, ohne das Modell auszumessen
+            if self.uses_model and self.metadata_cache is not None:
+                model_height = self.metadata_cache.get_size(self.model_path).y
+            else:
+                model_height = self.bounds.size.y
             if model_height <= 0:
-                print("⚠️ Warnung: Player-Modell hat ungültige Höhe!")
+                logger.warning("⚠️ Warnung: Player-Modell hat ungültige Höhe!")
                 return
             
             scale_factor = target_height / model_height
@@ -50,17 +67,27 @@ class Player(Entity):
             self.base_scale = scale_factor
             self.y = target_height / 2.0
         except Exception as e:
-            print(f"⚠️ Spieler-Höhe konnte nicht angepasst werden: {e}")
+            logger.warning("⚠️ Spieler-Höhe konnte nicht angepasst werden: %s", e)
             # Fallback
             self.scale = 0.5
             self.base_scale = 0.5
     
     def face_direction(self, target_angle):
         """Lässt den Spieler in eine Richtung schauen."""
+        if self.tween_scheduler is not None:
+            self.tween_scheduler.start(self, 'rotation_y', target_angle, 0.15, curve=curve.linear)
+            return
         self.animate_rotation_y(target_angle, duration=0.15, curve=curve.linear)
     
     def hop(self):
         """Lässt den Spieler einen kleinen Hopser machen."""
+        if self.tween_scheduler is not None:
+            # Ein Tween für Hoch und Runter, ein neuer Hopser ersetzt den laufenden
+            self.tween_scheduler.start(
+                self, 'y', self.base_y_position + 0.3, 0.24,
+                curve=hop_arc, start_value=self.base_y_position
+            )
+            return
         try:
             self.animate_y(
                 self.base_y_position + 0.3,
@@ -75,7 +102,31 @@ class Player(Entity):
                 curve=curve.in_quad
             )
         except Exception as e:
-            print(f"⚠️ Hop-Animation fehlgeschlagen: {e}")
+            logger.warning("⚠️ Hop-Animation fehlgeschlagen: %s", e)
+    
+    def flash_color(self, flash_color, duration=0.2):
+        """
+        Färbt den Spieler kurz ein und danach wieder weiß.
+        
+        Args:
+            flash_color (Color): Farbe während des Aufblitzens
+            duration (float): Dauer in Sekunden
+        """
+        self.color = flash_color
+        if self.tween_scheduler is not None:
+            self.tween_scheduler.set_later(self, 'color', color.white, duration)
+        else:
+            invoke(setattr, self, 'color', color.white, delay=duration)
+    
+    def get_footprint(self):
+        """
+        Liefert die Bodenfläche der Kollisions-Box relativ zur Spielerposition.
+        
+        Returns:
+            tuple: (min_dx, max_dx, min_dz, max_dz)
+        """
+        (min_x, _, min_z), (max_x, _, max_z) = entity_world_box(self)
+        return (min_x - self.x, max_x - self.x, min_z - self.z, max_z - self.z)
     
     def can_move(self):
         """Prüft, ob der Spieler sich bewegen darf (Cooldown)."""
@@ -0,0 +1,260 @@
+import atexit
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+
+from modules.game_logging import get_logger
+
+logger = get_logger("run_history")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    score REAL NOT NULL,
+    duration REAL NOT NULL,
+    seed INTEGER,
+    settings_hash TEXT NOT NULL,
+    death_cause TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_settings_score ON runs (settings_hash, score DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_finished_at ON runs (finished_at);
+"""
+
+INSERT_RUN = (
+    "INSERT INTO runs (finished_at, score, duration, seed, settings_hash, death_cause) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+RUN_COLUMNS = "id, finished_at, score, duration, seed, settings_hash, death_cause"
+
+
+def settings_hash(settings):
+    """
+    Bildet einen kurzen, stabilen Hash über die Spieleinstellungen.
+    Runden mit gleichem Hash wurden unter denselben Regeln gespielt.
+
+    Args:
+        settings (dict): Spieleinstellungen
+
+    Returns:
+        str: Hash als Hex-String (16 Zeichen)
+    """
+    encoded = json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def signed_seed(seed):
+    """Bringt einen 64-Bit-Seed in den Wertebereich von SQLite-INTEGER."""
+    if seed is None:
+        return None
+    seed = int(seed) & 0xFFFFFFFFFFFFFFFF
+    return seed - (1 << 64) if seed >= (1 << 63) else seed
+
+
+class RunHistory:
+    """
+    Lokale Bestenliste und Rundenverlauf in einer SQLite-Datenbank.
+    Der Spiel-Thread legt beendete Runden nur in eine Warteschlange, ein
+    Hintergrund-Thread schreibt sie gesammelt in einer Transaktion. Indizes
+    auf Score, Einstellungs-Hash und Zeitpunkt halten Bestenlisten- und
+    Zeitraum-Abfragen auch bei sehr vielen Runden schnell.
+    """
+
+    def __init__(self, db_path="assets/run_history.db", batch_size=256, flush_interval=1.0):
+        """
+        Args:
+            db_path (str): Pfad der Datenbank, ':memory:' ist nicht möglich (zwei Verbindungen)
+            batch_size (int): Ab dieser Anzahl wartender Runden wird sofort geschrieben
+            flush_interval (float): Sekunden zwischen zwei Schreibvorgängen
+        """
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.pending_runs = deque()
+
+        # Statistiken
+        self.runs_recorded = 0
+        self.runs_written = 0
+        self.write_errors = 0
+
+        # Eigene Verbindungen für Schreib-Thread und Abfragen, WAL erlaubt Lesen während des Schreibens
+        self.read_connection = self.connect()
+        self.read_connection.executescript(SCHEMA)
+        self.read_lock = threading.Lock()
+
+        self.write_lock = threading.Lock()
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.writer_thread = threading.Thread(target=self.run_writer, name="RunHistoryWriter", daemon=True)
+        self.writer_thread.start()
+        # Beim Beenden wartende Runden noch schreiben
+        atexit.register(self.close)
+
+    def connect(self):
+        """
+        Öffnet eine Verbindung zur Datenbank.
+
+        Returns:
+            sqlite3.Connection: Die Verbindung
+        """
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def record_run(self, score, duration, seed=None, settings_hash=None, death_cause=None, finished_at=None):
+        """
+        Merkt eine beendete Runde zum Speichern vor, ohne auf die Datenbank zuzugreifen.
+
+        Args:
+            score (float): Erreichte Distanz
+            duration (float): Dauer der Runde in Sekunden
+            seed (int): Welt-Seed der Runde
+            settings_hash (str): Hash der Einstellungen, siehe settings_hash()
+            death_cause (str): Grund für das Ende, z.B. 'car', 'restart', 'quit'
+            finished_at (float): Zeitpunkt des Endes, Standard ist jetzt
+        """
+        if finished_at is None:
+            finished_at = time.time()
+        self.pending_runs.append((
+            finished_at, float(score), float(duration), signed_seed(seed), settings_hash or "", death_cause
+        ))
+        self.runs_recorded += 1
+        if len(self.pending_runs) >= self.batch_size:
+            self.wake_event.set()
+
+    def run_writer(self):
+        """Schreibt wartende Runden in festen Abständen oder bei voller Warteschlange."""
+        connection = self.connect()
+        try:
+            while not self.stop_event.is_set():
+                self.wake_event.wait(self.flush_interval)
+                self.wake_event.clear()
+                self.write_pending(connection)
+            self.write_pending(connection)
+        finally:
+            connection.close()
+
+    def write_pending(self, connection):
+        """
+        Schreibt alle wartenden Runden in einer Transaktion.
+
+        Args:
+            connection (sqlite3.Connection): Verbindung des Schreibenden
+        """
+        with self.write_lock:
+            rows = []
+            while self.pending_runs:
+                rows.append(self.pending_runs.popleft())
+            if not rows:
+                return
+            try:
+                with connection:
+                    connection.executemany(INSERT_RUN, rows)
+                self.runs_written += len(rows)
+            except sqlite3.Error as e:
+                self.write_errors += 1
+                logger.error("❌ Runden konnten nicht gespeichert werden: %s", e)
+                self.pending_runs.extendleft(reversed(rows))
+
+    def flush(self):
+        """Lässt den Hintergrund-Thread wartende Runden sofort schreiben."""
+        self.wake_event.set()
+
+    def close(self):
+        """Beendet den Hintergrund-Thread und schreibt alle wartenden Runden."""
+        if self.stop_event.is_set():
+            return
+        self.stop_event.set()
+        self.wake_event.set()
+        if self.writer_thread.is_alive() and self.writer_thread is not threading.current_thread():
+            self.writer_thread.join(timeout=5.0)
+        if self.pending_runs:
+            # Thread hängt oder lief nicht: den Rest selbst schreiben
+            connection = self.connect()
+            self.write_pending(connection)
+            connection.close()
+        with self.read_lock:
+            self.read_connection.close()
+
+    def query(self, sql, parameters=()):
+        """Führt eine Abfrage auf der Lese-Verbindung aus und liefert die Zeilen als Dicts."""
+        with self.read_lock:
+            cursor = self.read_connection.execute(sql, parameters)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def top_runs(self, limit=10, settings_hash=None):
+        """
+        Liefert die besten Runden, optional nur unter bestimmten Einstellungen.
+
+        Args:
+            limit (int): Maximale Anzahl Runden
+            settings_hash (str): Nur Runden mit diesem Einstellungs-Hash
+
+        Returns:
+            list: Runden als Dicts, bester Score zuerst
+        """
+        if settings_hash is None:
+            return self.query(f"SELECT {RUN_COLUMNS} FROM runs ORDER BY score DESC LIMIT ?", (limit,))
+        return self.query(
+            f"SELECT {RUN_COLUMNS} FROM runs WHERE settings_hash = ? ORDER BY score DESC LIMIT ?",
+            (settings_hash, limit)
+        )
+
+    def runs_between(self, start_time, end_time, limit=1000):
+        """
+        Liefert die Runden, die in einem Zeitraum beendet wurden.
+
+        Args:
+            start_time (float): Beginn des Zeitraums (Unix-Zeit)
+            end_time (float): Ende des Zeitraums (Unix-Zeit)
+            limit (int): Maximale Anzahl Runden
+
+        Returns:
+            list: Runden als Dicts, älteste zuerst
+        """
+        return self.query(
+            f"SELECT {RUN_COLUMNS} FROM runs WHERE finished_at BETWEEN ? AND ? ORDER BY finished_at LIMIT ?",
+            (start_time, end_time, limit)
+        )
+
+    def best_score(self, settings_hash=None):
+        """
+        Liefert den besten Score, optional nur unter bestimmten Einstellungen.
+
+        Args:
+            settings_hash (str): Nur Runden mit diesem Einstellungs-Hash
+
+        Returns:
+            float: Bester Score, 0 falls keine Runde existiert
+        """
+        runs = self.top_runs(1, settings_hash)
+        return runs[0]['score'] if runs else 0
+
+    def run_count(self):
+        """
+        Liefert die Anzahl gespeicherter Runden.
+
+        Returns:
+            int: Anzahl Runden in der Datenbank
+        """
+        return self.query("SELECT COUNT(*) AS count FROM runs")[0]['count']
+
+    def get_stats(self):
+        """
+        Liefert Statistiken zum Schreiben.
+
+        Returns:
+            dict: Vorgemerkte, geschriebene und wartende Runden sowie Fehler
+        """
+        return {
+            'recorded': self.runs_recorded,
+            'written': self.runs_written,
+            'pending': len(self.pending_runs),
+            'errors': self.write_errors
+        }
@@ -0,0 +1,207 @@
+from array import array
+
+
+def linear(t):
+    """Lineare Kurve."""
+    return t
+
+
+def hop_arc(t):
+    """
+    Bogen hoch und wieder runter: entspricht out_quad bis zur Hälfte und
+    in_quad zurück, der Endwert ist wieder der Startwert.
+    """
+    return 4.0 * t * (1.0 - t)
+
+
+class TweenScheduler:
+    """
+    Zentrale Verwaltung aller laufenden Animationen. Die Tweens liegen in
+    vorab angelegten Arrays (Start, Ziel, Verzögerung, Dauer, vergangene Zeit)
+    und werden in einem einzigen Durchlauf pro Frame fortgeschrieben. Pro
+    Entity und Attribut läuft höchstens ein Tween, ein neuer ersetzt den
+    laufenden, statt sich darüber zu legen.
+    """
+
+    def __init__(self, settings):
+        self.capacity = 0
+        self.entities = []
+        self.attributes = []
+        self.start_values = []
+        self.end_values = []
+        self.curves = []
+        self.delays = array('d')
+        self.durations = array('d')
+        self.elapsed = array('d')
+        self.started = array('b')
+
+        # (id(Entity), Attribut) -> Slot
+        self.slot_by_key = {}
+        self.active_slots = []
+        self.free_slots = []
+
+        # Statistiken
+        self.tweens_started = 0
+        self.tweens_replaced = 0
+        self.grow(settings.get("tween_capacity", 32))
+
+    def grow(self, capacity):
+        """
+        Vergrößert alle Arrays auf die neue Kapazität.
+
+        Args:
+            capacity (int): Neue Anzahl Slots
+        """
+        extra = capacity - self.capacity
+        if extra <= 0:
+            return
+        for values in (self.entities, self.attributes, self.start_values, self.end_values, self.curves):
+            values.extend([None] * extra)
+        for values in (self.delays, self.durations, self.elapsed):
+            values.extend([0.0] * extra)
+        self.started.extend([0] * extra)
+        self.free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def start(self, entity, attribute, target, duration, delay=0.0, curve=linear, start_value=None):
+        """
+        Startet einen Tween, ein laufender Tween auf demselben Attribut wird ersetzt.
+
+        Args:
+            entity (Entity): Die animierte Entity
+            attribute (str): Name des Attributs, z.B. 'y'
+            target: Zielwert, bei duration=0 beliebiger Wert
+            duration (float): Dauer in Sekunden, 0 setzt den Wert nach der Verzögerung
+            delay (float): Wartezeit bis zum Start
+            curve (callable): Kurve über t in 0..1
+            start_value: Startwert, Standard ist der Wert beim Start des Tweens
+        """
+        key = (id(entity), attribute)
+        slot = self.slot_by_key.get(key)
+        if slot is not None:
+            self.tweens_replaced += 1
+        else:
+            if not self.free_slots:
+                self.grow(self.capacity * 2)
+            slot = self.free_slots.pop()
+            self.slot_by_key[key] = slot
+            self.active_slots.append(slot)
+
+        self.entities[slot] = entity
+        self.attributes[slot] = attribute
+        self.start_values[slot] = start_value
+        self.end_values[slot] = target
+        self.curves[slot] = curve
+        self.delays[slot] = delay
+        self.durations[slot] = duration
+        self.elapsed[slot] = 0.0
+        self.started[slot] = 0
+        self.tweens_started += 1
+
+    def set_later(self, entity, attribute, value, delay):
+        """
+        Setzt ein Attribut nach einer Verzögerung, Ersatz für invoke(setattr, ...).
+
+        Args:
+            entity (Entity): Die Entity
+            attribute (str): Name des Attributs
+            value: Zu setzender Wert
+            delay (float): Wartezeit in Sekunden
+        """
+        self.start(entity, attribute, value, 0.0, delay=delay)
+
+    def cancel(self, entity, attribute):
+        """
+        Bricht den Tween eines Attributs ab, der aktuelle Wert bleibt stehen.
+
+        Args:
+            entity (Entity): Die Entity
+            attribute (str): Name des Attributs
+        """
+        slot = self.slot_by_key.get((id(entity), attribute))
+        if slot is not None:
+            self.release(slot)
+            self.active_slots.remove(slot)
+
+    def cancel_entity(self, entity):
+        """
+        Bricht alle Tweens einer Entity ab.
+
+        Args:
+            entity (Entity): Die Entity
+        """
+        entity_id = id(entity)
+        for slot in [slot for (key_id, _), slot in self.slot_by_key.items() if key_id == entity_id]:
+            self.release(slot)
+            self.active_slots.remove(slot)
+
+    def release(self, slot):
+        """Gibt einen Slot frei, ohne die Liste der aktiven Slots anzufassen."""
+        del self.slot_by_key[(id(self.entities[slot]), self.attributes[slot])]
+        self.entities[slot] = None
+        self.start_values[slot] = None
+        self.end_values[slot] = None
+        self.curves[slot] = None
+        self.free_slots.append(slot)
+
+    def update(self, dt):
+        """
+        Schreibt alle laufenden Tweens in einem Durchlauf fort.
+
+        Args:
+            dt (float): Zeit seit dem letzten Frame
+        """
+        finished = 0
+        for slot in self.active_slots:
+            elapsed = self.elapsed[slot] + dt
+            self.elapsed[slot] = elapsed
+            delay = self.delays[slot]
+            if elapsed < delay:
+                continue
+
+            entity = self.entities[slot]
+            attribute = self.attributes[slot]
+            duration = self.durations[slot]
+            if duration <= 0.0:
+                setattr(entity, attribute, self.end_values[slot])
+                self.release(slot)
+                finished += 1
+                continue
+
+            if not self.started[slot]:
+                self.started[slot] = 1
+                if self.start_values[slot] is None:
+                    self.start_values[slot] = getattr(entity, attribute)
+
+            t = min(1.0, (elapsed - delay) / duration)
+            start_value = self.start_values[slot]
+            setattr(entity, attribute, start_value + (self.end_values[slot] - start_value) * self.curves[slot](t))
+            if t >= 1.0:
+                self.release(slot)
+                finished += 1
+
+        if finished:
+            self.active_slots[:] = [slot for slot in self.active_slots if self.entities[slot] is not None]
+
+    def clear(self):
+        """Bricht alle Tweens ab, die Kapazität bleibt erhalten."""
+        for slot in self.active_slots:
+            self.release(slot)
+        self.active_slots.clear()
+
+    def get_stats(self):
+        """
+        Liefert Statistiken zu den Tweens.
+
+        Returns:
+            dict: Aktive, gestartete und ersetzte Tweens sowie die Kapazität
+        """
+        return {
+            'active': len(self.active_slots),
+            'started': self.tweens_started,
+            'replaced': self.tweens_replaced,
+            'capacity': self.capacity
+        }
+
+    def __len__(self):
+        return len(self.active_slots)
@@ -83,6 +83,8 @@ class UIManager:
         """
         self.game_paused = True
         self.is_game_over = game_over
+        # Highscore bei Pause und Game Over sofort sichern
+        self.highscore_manager.flush()
         
         if game_over:
             self.pause_title.text = "GAME OVER"
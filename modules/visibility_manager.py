@@ -0,0 +1,117 @@
+from ursina import *
+from panda3d.core import Point2, Point3
+from modules.bucket_visibility import BucketVisibility, FootprintRows
+
+class VisibilityManager:
+    """
+    Blendet Welt-Entities aus, die außerhalb des Kamerabilds liegen, und
+    blendet sie wieder ein, sobald sie ins Bild kommen. Das Kamerabild wird
+    dafür in festen Abständen auf die Bodenebene projiziert (ein konvexes
+    Viereck). Jede Lane bzw. jeder Z-Bucket wird mit diesem Viereck
+    geschnitten, sichtbar ist nur der X-Abschnitt innerhalb des Bilds.
+    Dazwischen werden jeden Frame nur Kategorien abgeglichen, deren Quelle
+    sich verändert hat, sodass neue Entities aus dem Pool sofort stimmen.
+    """
+
+    # Bildschirmecken in Umlaufreihenfolge (Linse: -1..1)
+    SCREEN_CORNERS = ((-1, -1), (1, -1), (1, 1), (-1, 1))
+
+    def __init__(self, settings):
+        self.culling_enabled = settings.get("visibility_culling", True)
+        self.update_interval = settings.get("visibility_update_interval", 0.1)
+        # Zusätzlicher Rand um das Kamerabild, deckt hohe Objekte und die Zeit bis zur nächsten Prüfung ab
+        self.margin = settings.get("visibility_margin", 3.0)
+
+        # Kategorie -> (Quelle der Gruppen, halbe Objektgröße, Stand der Quelle, Zustand der Gruppen)
+        self.categories = {}
+        self.stats = {}
+        self.time_since_update = self.update_interval
+        self.footprint_rows = None
+
+    def register(self, category, source, extent=0.0, moving=False, version=None):
+        """
+        Meldet eine Kategorie von Entities an.
+
+        Args:
+            category (str): Name der Kategorie, z.B. 'tiles'
+            source (callable): Liefert die Entities der Kategorie als Paare (z, Entities)
+            extent (float): Halbe Ausdehnung eines Objekts auf dem Boden
+            moving (bool): True, wenn sich die Entities in X bewegen (Autos)
+            version (callable): Liefert einen Zähler, der sich bei jeder Änderung der Quelle
+                ändert. Ohne Zähler wird die Kategorie jeden Frame abgeglichen.
+        """
+        self.categories[category] = (source, extent, version, BucketVisibility(moving))
+        self.stats[category] = {'visible': 0, 'total': 0}
+
+    def get_ground_footprint(self, ground_height=0.0):
+        """
+        Projiziert die vier Bildecken der Kamera auf die Bodenebene.
+
+        Args:
+            ground_height (float): Höhe der Bodenebene
+
+        Returns:
+            list: Eckpunkte (x, z) des sichtbaren Bodenbereichs
+        """
+        footprint = []
+        for screen_x, screen_y in self.SCREEN_CORNERS:
+            near_point, far_point = Point3(), Point3()
+            camera.lens.extrude(Point2(screen_x, screen_y), near_point, far_point)
+            near_point = scene.get_relative_point(camera, near_point)
+            far_point = scene.get_relative_point(camera, far_point)
+
+            # Schnittpunkt des Sichtstrahls mit dem Boden, sonst Ende der Sichtweite
+            height_delta = near_point.y - far_point.y
+            if height_delta > 0 and near_point.y > ground_height >= far_point.y:
+                t = (near_point.y - ground_height) / height_delta
+                point = near_point + (far_point - near_point) * t
+            else:
+                point = far_point
+            footprint.append((point.x, point.z))
+        return footprint
+
+    def update(self):
+        """
+        Gleicht die Sichtbarkeit aller angemeldeten Entities ab. Das Kamerabild
+        wird nur in festen Abständen neu projiziert, unveränderte Kategorien
+        werden dazwischen übersprungen.
+        """
+        if not self.culling_enabled:
+            return
+        self.time_since_update += time.dt
+        footprint_changed = self.footprint_rows is None or self.time_since_update >= self.update_interval
+        if footprint_changed:
+            self.time_since_update = 0.0
+            self.footprint_rows = FootprintRows(self.get_ground_footprint())
+
+        footprint_rows = self.footprint_rows
+        for category, (source, extent, version, bucket_visibility) in self.categories.items():
+            source_version = version() if version else None
+            if not footprint_changed and source_version is not None \
+                    and source_version == bucket_visibility.source_version:
+                continue
+            bucket_visibility.source_version = source_version
+            margin = self.margin + extent
+            visible, total = bucket_visibility.update(
+                source(), lambda z: footprint_rows.span(z, margin)
+            )
+            self.stats[category] = {'visible': visible, 'total': total}
+
+    def show_all(self):
+        """Blendet alle angemeldeten Entities wieder ein."""
+        for source, _, _, bucket_visibility in self.categories.values():
+            bucket_visibility.show_all(source())
+
+    def reset(self):
+        """Vergisst den Zustand aller Gruppen, nach dem Zurücksetzen der Welt aufrufen."""
+        for _, _, _, bucket_visibility in self.categories.values():
+            bucket_visibility.reset()
+
+    def get_stats(self):
+        """
+        Liefert sichtbare und gesamte Anzahl pro Kategorie.
+
+        Returns:
+            dict: {'kategorie': {'visible': int, 'total': int}}
+        """
+        return {category: dict(counts) for category, counts in self.stats.items()}
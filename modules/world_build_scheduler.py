@@ -0,0 +1,95 @@
+import time
+from collections import deque
+
+class WorldBuildScheduler:
+    """
+    Verteilt den Aufbau neuer Lanes auf mehrere Frames. Pro Frame wird nur so
+    lange gebaut, wie das Zeitbudget erlaubt. Lanes direkt vor dem Spieler
+    werden notfalls sofort gebaut, damit er nie eine fehlende Lane erreicht.
+    """
+
+    def __init__(self, world_generator, settings):
+        self.world_generator = world_generator
+        self.frame_budget_ms = settings.get("world_build_budget_ms", 4.0)
+        self.lookahead_lanes = settings.get("world_lookahead_lanes", 20)
+        self.min_ready_lanes = settings.get("world_min_ready_lanes", 5)
+
+        self.pending_lanes = deque()
+        self.next_lane_index = 0
+        self.built_until_index = -1
+
+        # Statistiken
+        self.last_frame_build_ms = 0.0
+        self.last_frame_lanes_built = 0
+
+    @property
+    def queue_depth(self):
+        """Anzahl der noch nicht gebauten Lanes in der Warteschlange."""
+        return len(self.pending_lanes)
+
+    def start(self, start_z_position=0, backward_lanes=5):
+        """
+        Baut die Welt um die Startposition auf. Nur die Lanes hinter dem Start
+        und die Mindestreserve vor dem Spieler entstehen sofort, der Rest
+        wird in die Warteschlange gestellt.
+
+        Args:
+            start_z_position (float): Z-Position des Spielers beim Start
+            backward_lanes (int): Anzahl der Lanes hinter dem Startpunkt
+        """
+        self.pending_lanes.clear()
+        self.world_generator.create_backward_lanes(backward_lanes)
+
+        start_index = self.lane_index_at(start_z_position)
+        self.next_lane_index = start_index
+        self.built_until_index = start_index - 1
+        self.update(start_z_position)
+
+    def lane_index_at(self, z_position):
+        """
+        Ermittelt den Lane-Index zu einer Z-Position.
+
+        Args:
+            z_position (float): Z-Position
+
+        Returns:
+            int: Index der Lane
+        """
+        if self.world_generator.road_tile_length is None:
+            self.world_generator.initialize_model_bounds()
+        return round(z_position / self.world_generator.road_tile_length)
+
+    def update(self, player_z_position):
+        """
+        Plant fehlende Lanes ein und baut sie im Rahmen des Frame-Budgets.
+
+        Args:
+            player_z_position (float): Aktuelle Z-Position des Spielers
+        """
+        player_lane = self.lane_index_at(player_z_position)
+
+        target_index = player_lane + self.lookahead_lanes
+        if self.next_lane_index <= target_index:
+            # Layouts der neuen Lanes gesammelt vorab berechnen
+            new_lane_count = target_index - self.next_lane_index + 1
+            self.world_generator.prefetch_layouts(self.next_lane_index, new_lane_count)
+            self.pending_lanes.extend(range(self.next_lane_index, target_index + 1))
+            self.next_lane_index = target_index + 1
+
+        frame_start = time.perf_counter()
+        budget_seconds = self.frame_budget_ms / 1000.0
+        lanes_built = 0
+        required_index = player_lane + self.min_ready_lanes
+
+        while self.pending_lanes:
+            # Reserve vor dem Spieler wird unabhängig vom Budget gebaut
+            if (self.pending_lanes[0] > required_index
+                    and time.perf_counter() - frame_start >= budget_seconds):
+                break
+            lane_index = self.pending_lanes.popleft()
+            self.world_generator.create_lane(lane_index)
+            self.built_until_index = lane_index
+            lanes_built += 1
+
+        self.last_frame_lanes_built = lanes_built
+        self.last_frame_build_ms = (time.perf_counter() - frame_start) * 1000.0
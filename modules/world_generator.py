@@ -1,18 +1,76 @@
 from ursina import *
-import random
 import math
+import time
+from collections import OrderedDict
+from panda3d.core import NodePath
+from modules.entity_pool import EntityPool
+from modules.instanced_renderer import InstancedBatch
+from modules.z_ordered_buckets import ZOrderedBuckets
+from modules.lane_layout import LaneLayoutGenerator
+from modules.model_metadata_cache import ModelMetadataCache
+from modules.world_grid import WorldGrid
+from modules.lane_table import LaneTable
+from modules.collider_policy import ColliderPolicy
+from modules.game_logging import get_logger
+
+logger = get_logger("world_generator")
 
 class WorldGenerator:
     """
     Generiert und verwaltet die Spielwelt inklusive Straßen, Gras und Bäumen.
     """
     
-    def __init__(self, settings):
+    # Halbe Breite und Tiefe des Baum-Colliders
+    TREE_HALF_SIZE = 0.5
+    
+    # Bauteile eines Baums: (Farbe, Skalierung, Position relativ zum Stamm)
+    TREE_PARTS = (
+        (color.brown, (0.3, 1.2, 0.3), (0, 0.6, 0)),
+        (color.green, (1.2, 0.8, 1.2), (0, 1.6, 0)),
+        (color.lime, (0.9, 0.7, 0.9), (0, 2.2, 0)),
+        (color.olive, (0.6, 0.6, 0.6), (0, 2.7, 0)),
+    )
+    
+    def __init__(self, settings, metadata_cache=None):
         self.settings = settings
-        self.lanes = []
-        self.tiles = []
-        self.trees = []
-        self.occupied_tile_positions = set()
+        self.metadata_cache = metadata_cache or ModelMetadataCache()
+        # Nach Z sortiert, damit das Aufräumen nur die fälligen Objekte anfasst.
+        # Lanes müssen dafür in aufsteigender Reihenfolge erstellt werden.
+        self.lanes = LaneTable()
+        self.tiles = ZOrderedBuckets()
+        self.trees = ZOrderedBuckets()
+        
+        # Belegung der Welt als Raster aus Lane-Index × Spalte
+        self.world_grid = WorldGrid(settings.get("tile_size", 1))
+        
+        # Aufbau der Lanes als reine Daten (reproduzierbar über world_seed)
+        self.lane_layouts = LaneLayoutGenerator(settings, settings.get("world_seed"))
+        self.layout_cache = {}
+        
+        # Pool für Road- und Gras-Tiles (nach Modell getrennt)
+        self.tile_pool = EntityPool(settings.get("tile_pool_max_size", 512))
+        
+        # Statische Geometrie mehrerer Lanes zu einem Mesh pro Chunk zusammenfassen
+        self.merge_static_geometry = settings.get("merge_static_geometry", False)
+        self.lanes_per_chunk = max(1, settings.get("lanes_per_chunk", 4))
+        self.lane_chunks = OrderedDict()
+        self.static_model_templates = {}
+        self.placement_helper = Entity(enabled=False, eternal=True)
+        
+        # Hardware-Instancing für Bäume: ein Batch pro Baum-Variante
+        self.instanced_rendering = settings.get("instanced_rendering", False)
+        self.max_instances_per_batch = settings.get("max_instances_per_batch", 4096)
+        self.tree_batches = {}
+        
+        # Zusammengefasste Baum-Geometrie pro Variante (einmal gebaut, von allen Bäumen geteilt)
+        self.tree_prefabs = {}
+        
+        # Unsichtbare Kollisions-Entities für Bäume ohne eigene Geometrie
+        self.tree_proxy_pool = EntityPool(settings.get("tile_pool_max_size", 512))
+        
+        # Collider nur für abgefragte Entity-Klassen, Bäume erst bei Bedarf
+        self.collider_policy = ColliderPolicy(settings)
+        self.last_lane_setup_ms = 0.0
         
         # Model-Pfade und Skalierungen
         self.road_model_path = 'assets/models/simple_road.glb'
@@ -34,7 +92,7 @@ class WorldGenerator:
         if self.road_tile_width is not None:
             return  # Bereits initialisiert
             
-        print("📐 Initialisiere Modell-Abmessungen...")
+        logger.info("📐 Initialisiere Modell-Abmessungen...")
         try:
             self.road_tile_width, self.road_tile_length = self.get_model_bounds(
                 self.road_model_path, self.road_model_scale
@@ -42,16 +100,16 @@ class WorldGenerator:
             self.grass_tile_width, self.grass_tile_length = self.get_model_bounds(
                 self.grass_model_path, self.grass_model_scale
             )
-            print(f"✅ Modell-Abmessungen initialisiert: Road={self.road_tile_length}, Grass={self.grass_tile_length}")
+            logger.info("✅ Modell-Abmessungen initialisiert: Road=%s, Grass=%s", self.road_tile_length, self.grass_tile_length)
         except Exception as e:
-            print(f"⚠️ Fehler beim Initialisieren der Modell-Abmessungen: {e}")
+            logger.warning("⚠️ Fehler beim Initialisieren der Modell-Abmessungen: %s", e)
             # Fallback-Werte
             self.road_tile_width, self.road_tile_length = 1.0, 1.0
             self.grass_tile_width, self.grass_tile_length = 1.0, 1.0
     
     def get_model_bounds(self, model_path, scale):
         """
-        Ermittelt die Abmessungen eines Modells.
+        Ermittelt die Abmessungen eines Modells aus dem Metadaten-Cache.
         
         Args:
             model_path (str): Pfad zum Modell
@@ -61,28 +119,12 @@ class WorldGenerator:
             tuple: (width, length) des Modells
         """
         try:
-            temp_entity = Entity(model=model_path, scale=scale)
-            bounds = temp_entity.bounds
-            destroy(temp_entity)
-            return bounds.size.x, bounds.size.z
+            size = self.metadata_cache.get_size(model_path)
+            return size.x * scale, size.z * scale
         except Exception as e:
-            print(f"⚠️ Konnte Modell-Bounds nicht ermitteln: {e}")
+            logger.warning("⚠️ Konnte Modell-Bounds nicht ermitteln: %s", e)
             return 1.0, 1.0  # Fallback-Werte
     
-    def tile_key(self, x, z, precision=3):
-        """
-        Erzeugt einen eindeutigen Schlüssel für eine Tile-Position.
-        
-        Args:
-            x (float): X-Koordinate
-            z (float): Z-Koordinate
-            precision (int): Rundungsgenauigkeit
-            
-        Returns:
-            tuple: Gerundete Koordinaten als Schlüssel
-        """
-        return (round(x, precision), round(z, precision))
-    
     def create_play_area_border(self):
         """
         Erstellt einen dunklen Rand um das Spielfeld.
@@ -111,64 +153,293 @@ class WorldGenerator:
         
         return border, play_area
     
-    def create_crossy_tree(self, x, z):
+    def create_crossy_tree(self, x, z, chunk=None):
         """
         Erstellt einen Crossy-Road-Style Baum.
         
         Args:
             x (float): X-Position
             z (float): Z-Position
+            chunk (Entity): Lane-Chunk, in den die Baum-Geometrie übernommen wird (optional)
             
         Returns:
             Entity: Der erstellte Baum
         """
+        if self.instanced_rendering:
+            return self.create_instanced_tree(x, z)
+        if chunk is not None:
+            return self.create_merged_tree(x, z, chunk)
+        
+        # Ein Knoten pro Baum: die Geometrie wird mit allen Bäumen geteilt
         tree = Entity(position=(x, 0, z))
+        self.get_tree_prefab().instance_to(tree)
+        self.collider_policy.apply(tree, 'tree', self.add_tree_collider)
         
-        # Stamm
-        trunk = Entity(
-            model='cube',
-            parent=tree,
-            color=color.brown,
-            scale=(0.3, 1.2, 0.3),
-            position=(0, 0.6, 0),
-            collider='box',
-            texture='white_cube'
-        )
+        return tree
+    
+    def get_tree_prefab(self, variant='crossy'):
+        """
+        Liefert die Geometrie einer Baum-Variante als ein einziges,
+        vertex-gefärbtes Mesh. Sie wird beim ersten Zugriff gebaut und
+        danach von allen Bäumen gemeinsam verwendet.
         
-        # Baumkrone (mehrere Ebenen)
-        foliage_bottom = Entity(
-            model='cube', 
-            parent=tree,
-            color=color.green,
-            scale=(1.2, 0.8, 1.2),
-            position=(0, 1.6, 0),
-            texture='white_cube'
-        )
+        Args:
+            variant (str): Baum-Variante
+            
+        Returns:
+            NodePath: Die zusammengefasste Baum-Geometrie
+        """
+        prefab = self.tree_prefabs.get(variant)
+        if prefab is None:
+            prefab = NodePath(f'tree_{variant}')
+            for part_color, part_scale, part_offset in self.TREE_PARTS:
+                self.add_static_model(
+                    prefab, 'cube', part_offset, (0, 0, 0), part_scale,
+                    model_color=part_color, texture='white_cube'
+                )
+            # Farben in die Vertices übernehmen und die Würfel zu einem Mesh verschmelzen
+            prefab.flatten_strong()
+            self.tree_prefabs[variant] = prefab
+        return prefab
+    
+    def add_tree_collider(self, tree):
+        """
+        Gibt einem Baum seinen einzigen Collider.
         
-        foliage_middle = Entity(
-            model='cube',
-            parent=tree,
-            color=color.lime,
-            scale=(0.9, 0.7, 0.9),
-            position=(0, 2.2, 0),
-            texture='white_cube'
+        Args:
+            tree (Entity): Der Baum
+        """
+        tree.collider = BoxCollider(
+            tree, center=Vec3(0, 1.4, 0),
+            size=Vec3(2 * self.TREE_HALF_SIZE, 2.8, 2 * self.TREE_HALF_SIZE)
         )
+    
+    def create_merged_tree(self, x, z, chunk):
+        """
+        Übernimmt die Baum-Geometrie in einen Lane-Chunk. Zurück bleibt nur
+        eine unsichtbare Entity mit dem Collider des Baums.
         
-        foliage_top = Entity(
-            model='cube',
-            parent=tree,
-            color=color.olive,
-            scale=(0.6, 0.6, 0.6),
-            position=(0, 2.7, 0),
-            texture='white_cube'
-        )
+        Args:
+            x (float): X-Position
+            z (float): Z-Position
+            chunk (Entity): Lane-Chunk für die Geometrie
+            
+        Returns:
+            Entity: Die Kollisions-Entity des Baums
+        """
+        self.add_static_model(chunk, self.get_tree_prefab(), (x, 0, z), (0, 0, 0), (1, 1, 1))
+        return self.acquire_tree_proxy(x, z)
+    
+    def create_instanced_tree(self, x, z, variant='crossy'):
+        """
+        Fügt einen Baum als Instanz in den Batch seiner Variante ein.
         
-        # Collider für den gesamten Baum
-        tree.collider = 'box'
-        tree.collider.size = (1.0, 2.8, 1.0)
+        Args:
+            x (float): X-Position
+            z (float): Z-Position
+            variant (str): Baum-Variante
+            
+        Returns:
+            Entity: Die Kollisions-Entity des Baums
+        """
+        batch = self.get_tree_batch(variant)
+        if batch.is_full:
+            raise RuntimeError(f"Instanz-Buffer für Bäume voll ({batch.max_instances})")
+        tree = self.acquire_tree_proxy(x, z)
+        tree.instance_batch = batch
+        tree.instance_handle = batch.add((x, 0, z))
+        return tree
+    
+    def get_tree_batch(self, variant='crossy'):
+        """
+        Liefert den Instanz-Batch einer Baum-Variante und erstellt ihn beim ersten Zugriff.
+        
+        Args:
+            variant (str): Baum-Variante
+            
+        Returns:
+            InstancedBatch: Der Batch der Variante
+        """
+        batch = self.tree_batches.get(variant)
+        if batch is None:
+            batch = InstancedBatch(self.get_tree_prefab(variant), self.max_instances_per_batch, eternal=True)
+            self.tree_batches[variant] = batch
+        return batch
+    
+    def acquire_tree_proxy(self, x, z):
+        """
+        Holt eine unsichtbare Entity mit dem Collider eines Baums aus dem Pool.
         
+        Args:
+            x (float): X-Position
+            z (float): Z-Position
+            
+        Returns:
+            Entity: Die Kollisions-Entity
+        """
+        def create_tree_proxy():
+            tree = Entity()
+            self.collider_policy.apply(tree, 'tree', self.add_tree_collider)
+            return tree
+        
+        tree = self.tree_proxy_pool.acquire('tree_proxy', create_tree_proxy, (x, 0, z))
+        tree.instance_handle = None
         return tree
     
+    def is_position_blocked(self, x, z, footprint=(0.0, 0.0, 0.0, 0.0)):
+        """
+        Prüft über das Welt-Raster, ob eine Box an dieser Position einen Baum
+        überlappt. Geprüft werden nur die Lanes und Spalten, deren Baum-Collider
+        die Box überhaupt erreichen kann, die Kosten hängen also nicht von der
+        Anzahl der Bäume ab.
+        
+        Args:
+            x (float): X-Position
+            z (float): Z-Position
+            footprint (tuple): Ausdehnung der Box relativ zur Position (min_dx, max_dx, min_dz, max_dz)
+            
+        Returns:
+            bool: True falls die Box einen Baum überlappt
+        """
+        if self.road_tile_length is None:
+            return False
+        min_dx, max_dx, min_dz, max_dz = footprint
+        # Baum-Mittelpunkte, deren Collider die Box schneiden, liegen echt innerhalb dieser Grenzen
+        min_x = x + min_dx - self.TREE_HALF_SIZE
+        max_x = x + max_dx + self.TREE_HALF_SIZE
+        min_z = z + min_dz - self.TREE_HALF_SIZE
+        max_z = z + max_dz + self.TREE_HALF_SIZE
+        
+        tile_size = self.world_grid.tile_size
+        columns = [
+            column for column in range(math.floor(min_x / tile_size), math.ceil(max_x / tile_size) + 1)
+            if min_x < column * tile_size < max_x
+        ]
+        for lane_index in range(math.floor(min_z / self.road_tile_length), math.ceil(max_z / self.road_tile_length) + 1):
+            if not min_z < lane_index * self.road_tile_length < max_z:
+                continue
+            for column in columns:
+                if self.world_grid.is_blocked(lane_index, column):
+                    return True
+        return False
+    
+    def get_rendered_tree_buckets(self):
+        """
+        Liefert die Bäume, die als eigene Entity gezeichnet werden, gruppiert
+        nach Z-Position. Bei zusammengefasster oder instanzierter Geometrie
+        sind die Bäume nur unsichtbare Kollisions-Entities.
+        
+        Returns:
+            iterable: Paare (z, Bäume)
+        """
+        if self.instanced_rendering or self.merge_static_geometry:
+            return ()
+        return self.trees.buckets
+    
+    def remove_tree(self, tree):
+        """
+        Entfernt einen Baum aus der Welt.
+        
+        Args:
+            tree (Entity): Der zu entfernende Baum
+        """
+        if getattr(tree, 'pool_key', None) != 'tree_proxy':
+            destroy(tree)
+            return
+        if tree.instance_handle is not None:
+            tree.instance_batch.remove(tree.instance_handle)
+            tree.instance_handle = None
+        self.tree_proxy_pool.release(tree)
+    
+    def get_lane_chunk(self, index, z_position):
+        """
+        Liefert den Chunk, in dem die statische Geometrie einer Lane gesammelt wird.
+        
+        Args:
+            index (int): Index der Lane
+            z_position (float): Z-Position der Lane
+            
+        Returns:
+            Entity: Der Chunk der Lane
+        """
+        chunk_index = index // self.lanes_per_chunk
+        chunk = self.lane_chunks.get(chunk_index)
+        if chunk is None:
+            # Ältere Chunks bekommen keine Lanes mehr, unvollständige jetzt zusammenfassen
+            for previous_chunk in self.lane_chunks.values():
+                self.seal_lane_chunk(previous_chunk)
+            chunk = Entity()
+            chunk.max_z = z_position
+            chunk.lane_count = 0
+            chunk.is_sealed = False
+            self.lane_chunks[chunk_index] = chunk
+        chunk.max_z = max(chunk.max_z, z_position)
+        chunk.lane_count += 1
+        return chunk
+    
+    def add_static_model(self, chunk, model_path, position, rotation, scale, model_color=None, texture=None, double_sided=False):
+        """
+        Hängt eine Kopie eines Modells als statische Geometrie an einen Chunk.
+        Die Kopie ist keine Entity und wird beim Zusammenfassen des Chunks
+        mit der übrigen Geometrie verschmolzen.
+        
+        Args:
+            chunk (Entity): Ziel-Chunk
+            model_path (str | NodePath): Pfad oder Name des Modells, oder bereits geladene Geometrie
+            position (tuple): Position in Weltkoordinaten
+            rotation (tuple): Rotation wie bei einer Entity
+            scale (tuple): Skalierung wie bei einer Entity
+            model_color (Color): Farbe der Geometrie (optional)
+            texture (str): Name der Textur (optional)
+            double_sided (bool): Rückseiten ebenfalls rendern
+        """
+        if isinstance(model_path, NodePath):
+            template = model_path
+        else:
+            template = self.static_model_templates.get(model_path)
+        if template is None:
+            template = load_model(model_path)
+            if template is None:
+                raise ValueError(f"Modell {model_path} nicht gefunden")
+            self.static_model_templates[model_path] = template
+        
+        # Transform über eine Entity berechnen, damit Ursinas Achsen-Konventionen gelten
+        self.placement_helper.position = position
+        self.placement_helper.rotation = rotation
+        self.placement_helper.scale = scale
+        
+        node = template.copy_to(chunk)
+        node.set_transform(self.placement_helper.get_transform())
+        if model_color is not None:
+            node.set_color(model_color)
+        if texture is not None:
+            node.set_texture(load_texture(texture)._texture, 1)
+        if double_sided:
+            node.set_two_sided(True)
+    
+    def finalize_lane_chunk(self, chunk):
+        """
+        Schließt eine Lane im Chunk ab. Zusammengefasst wird erst, wenn der
+        Chunk voll ist, damit jeder Chunk nur einmal verschmolzen wird.
+        
+        Args:
+            chunk (Entity): Der Chunk
+        """
+        if chunk.lane_count >= self.lanes_per_chunk:
+            self.seal_lane_chunk(chunk)
+    
+    def seal_lane_chunk(self, chunk):
+        """
+        Fasst die gesammelte Geometrie eines Chunks einmalig zu möglichst wenigen Meshes zusammen.
+        
+        Args:
+            chunk (Entity): Der Chunk
+        """
+        if chunk.is_sealed:
+            return
+        chunk.flatten_strong()
+        chunk.is_sealed = True
+    
     def create_lane(self, index):
         """
         Erstellt eine neue Lane (Straße oder Gras) an der gegebenen Position.
@@ -182,47 +453,42 @@ class WorldGenerator:
             
         z_position = index * self.road_tile_length
         if math.isnan(z_position) or math.isinf(z_position):
-            print(f"⚠️ Ungültige Z-Position für Lane {index}")
+            logger.warning("⚠️ Ungültige Z-Position für Lane %d", index)
             return
         
-        # Bestimme Lane-Typ und Richtung
-        lane_type = random.choice(['road', 'grass'])
-        direction = random.choice([-1, 1]) if lane_type == 'road' else 0
-        
-        self.lanes.append({
-            'index': index, 
-            'z': z_position, 
-            'type': lane_type, 
-            'direction': direction
-        })
-        
-        # Unsichtbare Lane-Entity für Kollisionserkennung
-        collider_type = 'box' if lane_type in ('road', 'grass') else None
-        lane_entity = Entity(
-            position=(0, 0, z_position),
-            model='cube',
-            scale=(self.level_width, 1, 1),
-            collider=collider_type,
-            color=color.clear,
-            enabled=True
-        )
+        setup_start = time.perf_counter()
+        
+        # Lane-Typ, Richtung und Bäume kommen aus dem Layout
+        layout = self.layout_cache.pop(index, None) or self.lane_layouts.layout(index)
+        lane_type = layout.lane_type
+        
+        self.lanes.add(index, z_position, lane_type, layout.direction, layout.car_speed)
+        self.world_grid.add_lane(index, lane_type)
+        
+        chunk = self.get_lane_chunk(index, z_position) if self.merge_static_geometry else None
         
         # Erstelle die sichtbaren Tiles
-        self.create_lane_tiles(lane_type, z_position)
+        self.create_lane_tiles(index, lane_type, z_position, chunk)
         
         # Füge Bäume hinzu, falls es eine Gras-Lane ist
-        if lane_type == 'grass':
-            self.spawn_trees_in_lane(z_position)
+        if layout.tree_positions:
+            self.spawn_trees_in_lane(index, z_position, layout.tree_positions, chunk)
         
-        print(f"✅ Lane {index} erstellt ({lane_type}) bei Z={z_position}")
+        if chunk is not None:
+            self.finalize_lane_chunk(chunk)
+        
+        self.last_lane_setup_ms = (time.perf_counter() - setup_start) * 1000.0
+        logger.debug("✅ Lane %d erstellt (%s) bei Z=%s in %.2f ms", index, lane_type, z_position, self.last_lane_setup_ms)
     
-    def create_lane_tiles(self, lane_type, z_position):
+    def create_lane_tiles(self, index, lane_type, z_position, chunk=None):
         """
         Erstellt die sichtbaren Tiles für eine Lane.
         
         Args:
+            index (int): Index der Lane
             lane_type (str): Typ der Lane ('road' oder 'grass')
             z_position (float): Z-Position der Lane
+            chunk (Entity): Lane-Chunk, in den die Tiles übernommen werden (optional)
         """
         extra_left, extra_right = 10, 8
         epsilon = 0.0005
@@ -248,92 +514,131 @@ class WorldGenerator:
         tiles_created = 0
         for segment_index in range(num_segments):
             x_position = offset_start + segment_index * tile_width + segment_index * epsilon
-            current_tile_key = self.tile_key(x_position, z_position)
+            tile_color = color.gray if lane_type == 'road' else color.green
             
-            if current_tile_key in self.occupied_tile_positions:
+            if not self.world_grid.claim_tile_slot(index, segment_index):
                 continue
             
-            try:
-                tile_entity = Entity(
-                    model=model_path,
-                    position=(x_position, y_position, z_position),
-                    rotation=(0, 90, 0),
-                    scale=(model_scale,) * 3,
-                    double_sided=True,
-                    collider='box'
+            if chunk is not None:
+                self.add_static_tile(
+                    chunk, model_path, model_scale, (x_position, y_position, z_position),
+                    tile_width, tile_color
                 )
-                
-                self.tiles.append(tile_entity)
-                self.occupied_tile_positions.add(current_tile_key)
                 tiles_created += 1
-            except Exception as e:
-                print(f"⚠️ Konnte Tile nicht erstellen: {e}")
-                # Fallback: Einfache Box
-                tile_color = color.gray if lane_type == 'road' else color.green
-                tile_entity = Entity(
+                continue
+            
+            tile_entity = self.spawn_tile(
+                model_path, model_scale, (x_position, y_position, z_position),
+                tile_width, tile_color
+            )
+            
+            self.tiles.append(tile_entity, z_position)
+            tiles_created += 1
+        
+        logger.debug("   %d Tiles für %s-Lane bei Z=%s erstellt", tiles_created, lane_type, z_position)
+    
+    def spawn_tile(self, model_path, model_scale, position, tile_width, fallback_color):
+        """
+        Holt ein Tile aus dem Pool oder erstellt es neu.
+        
+        Args:
+            model_path (str): Pfad zum Tile-Modell
+            model_scale (float): Skalierung des Modells
+            position (tuple): Position des Tiles
+            tile_width (float): Breite des Tiles (für den Fallback-Würfel)
+            fallback_color (Color): Farbe des Fallback-Würfels
+            
+        Returns:
+            Entity: Das platzierte Tile
+        """
+        def create_model_tile():
+            tile = Entity(
+                model=model_path,
+                rotation=(0, 90, 0),
+                scale=(model_scale,) * 3,
+                double_sided=True
+            )
+            self.collider_policy.apply(tile, 'tile')
+            return tile
+        
+        try:
+            return self.tile_pool.acquire(model_path, create_model_tile, position)
+        except Exception as e:
+            logger.warning("⚠️ Konnte Tile nicht erstellen: %s", e)
+            # Fallback: Einfache Box
+            def create_fallback_tile():
+                tile = Entity(
                     model='cube',
-                    position=(x_position, y_position, z_position),
                     scale=(tile_width, 0.1, self.road_tile_length),
-                    color=tile_color,
-                    collider='box'
+                    color=fallback_color
                 )
-                self.tiles.append(tile_entity)
-                self.occupied_tile_positions.add(current_tile_key)
-                tiles_created += 1
+                self.collider_policy.apply(tile, 'tile')
+                return tile
+            
+            fallback_key = ('cube', tile_width, tuple(fallback_color))
+            return self.tile_pool.acquire(fallback_key, create_fallback_tile, position)
+    
+    def add_static_tile(self, chunk, model_path, model_scale, position, tile_width, fallback_color):
+        """
+        Übernimmt ein Tile als statische Geometrie in einen Lane-Chunk.
+        
+        Args:
+            chunk (Entity): Ziel-Chunk
+            model_path (str): Pfad zum Tile-Modell
+            model_scale (float): Skalierung des Modells
+            position (tuple): Position des Tiles
+            tile_width (float): Breite des Tiles (für den Fallback-Würfel)
+            fallback_color (Color): Farbe des Fallback-Würfels
+        """
+        try:
+            self.add_static_model(
+                chunk, model_path, position, (0, 90, 0), (model_scale,) * 3,
+                double_sided=True
+            )
+        except Exception as e:
+            logger.warning("⚠️ Konnte Tile nicht erstellen: %s", e)
+            # Fallback: Einfache Box
+            self.add_static_model(
+                chunk, 'cube', position, (0, 0, 0),
+                (tile_width, 0.1, self.road_tile_length),
+                model_color=fallback_color
+            )
+    
+    def release_tile(self, tile):
+        """
+        Gibt ein Tile an den Pool zurück.
         
-        print(f"   {tiles_created} Tiles für {lane_type}-Lane bei Z={z_position} erstellt")
+        Args:
+            tile (Entity): Das nicht mehr benötigte Tile
+        """
+        self.tile_pool.release(tile)
     
-    def spawn_trees_in_lane(self, z_position):
+    def spawn_trees_in_lane(self, index, z_position, tree_positions, chunk=None):
         """
-        Platziert Bäume in einer Gras-Lane.
+        Platziert Bäume in einer Gras-Lane und blockiert ihre Spalten im Raster.
         
         Args:
+            index (int): Index der Lane
             z_position (float): Z-Position der Lane
+            tree_positions (tuple): X-Positionen der Bäume aus dem Lane-Layout
+            chunk (Entity): Lane-Chunk für die Baum-Geometrie (optional)
         """
-        if random.random() < self.settings["tree_spawn_chance"]:
-            num_trees = random.randint(
-                self.settings["min_trees_per_lane"], 
-                self.settings["max_trees_per_lane"]
-            )
-            
-            trees_spawned = 0
-            attempts = 0
-            max_attempts = 40
-            
-            spawn_area_width = self.level_width * 2
-            min_tree_x = -spawn_area_width / 2
-            max_tree_x = spawn_area_width / 2
-            
-            tree_positions_in_lane = []
-            
-            while trees_spawned < num_trees and attempts < max_attempts:
-                attempts += 1
-                tree_x = random.uniform(min_tree_x, max_tree_x)
-                
-                tree_pos_key = self.tile_key(tree_x, z_position)
-                if tree_pos_key in self.occupied_tile_positions:
-                    continue
-                
-                min_distance = self.settings["tree_spawn_distance"]
-                too_close = any(
-                    abs(existing_x - tree_x) < min_distance 
-                    for existing_x in tree_positions_in_lane
-                )
-                
-                if too_close:
-                    continue
-                
-                try:
-                    tree = self.create_crossy_tree(tree_x, z_position)
-                    self.trees.append(tree)
-                    trees_spawned += 1
-                    tree_positions_in_lane.append(tree_x)
-                    self.occupied_tile_positions.add(tree_pos_key)
-                except Exception as e:
-                    print(f"⚠️ Konnte Baum nicht erstellen: {e}")
+        trees_spawned = 0
+        for tree_x in tree_positions:
+            if not self.world_grid.add_blocker(index, self.world_grid.column_at(tree_x)):
+                continue
             
-            if trees_spawned > 0:
-                print(f"   {trees_spawned} Bäume für Gras-Lane bei Z={z_position} erstellt")
+            try:
+                tree = self.create_crossy_tree(tree_x, z_position, chunk)
+                self.trees.append(tree, z_position)
+                trees_spawned += 1
+            except Exception as e:
+                # Ohne Baum darf die Spalte nicht blockiert bleiben
+                self.world_grid.remove_blocker(index, self.world_grid.column_at(tree_x))
+                logger.warning("⚠️ Konnte Baum nicht erstellen: %s", e)
+        
+        if trees_spawned > 0:
+            logger.debug("   %d Bäume für Gras-Lane bei Z=%s erstellt", trees_spawned, z_position)
     
     def create_backward_lanes(self, count=5):
         """
@@ -347,58 +652,60 @@ class WorldGenerator:
             self.initialize_model_bounds()
             
         epsilon = 0.002
-        for i in range(1, count + 1):
+        # Von hinten nach vorne, damit die Lanes in Z-Reihenfolge entstehen
+        for i in range(count, 0, -1):
             z_index = -i
             z_position = z_index * self.road_tile_length
             
-            self.lanes.append({
-                'index': z_index, 
-                'z': z_position, 
-                'type': 'grass', 
-                'direction': 0
-            })
+            self.lanes.add(z_index, z_position, 'grass')
+            self.world_grid.add_lane(z_index, 'grass')
             
             num_segments = math.ceil(
                 self.level_width / self.grass_tile_width
             ) + 6
             offset_start = -num_segments * self.grass_tile_width / 2 + self.grass_tile_width / 2
+            chunk = self.get_lane_chunk(z_index, z_position) if self.merge_static_geometry else None
             
             tiles_created = 0
             for segment_index in range(num_segments):
                 x_position = offset_start + segment_index * self.grass_tile_width + segment_index * epsilon
-                current_tile_key = self.tile_key(x_position, z_position)
                 
-                if current_tile_key in self.occupied_tile_positions:
+                if not self.world_grid.claim_tile_slot(z_index, segment_index):
                     continue
                 
-                try:
-                    grass_tile = Entity(
-                        model=self.grass_model_path,
-                        position=(x_position, -0.24, z_position),
-                        rotation=(0, 90, 0),
-                        scale=(self.grass_model_scale,) * 3,
-                        double_sided=True,
-                        collider='box'
-                    )
-                    
-                    self.tiles.append(grass_tile)
-                    self.occupied_tile_positions.add(current_tile_key)
-                    tiles_created += 1
-                except Exception as e:
-                    print(f"⚠️ Konnte Gras-Tile nicht erstellen: {e}")
-                    # Fallback
-                    grass_tile = Entity(
-                        model='cube',
-                        position=(x_position, -0.24, z_position),
-                        scale=(self.grass_tile_width, 0.1, self.road_tile_length),
-                        color=color.green,
-                        collider='box'
+                if chunk is not None:
+                    self.add_static_tile(
+                        chunk, self.grass_model_path, self.grass_model_scale,
+                        (x_position, -0.24, z_position),
+                        self.grass_tile_width, color.green
                     )
-                    self.tiles.append(grass_tile)
-                    self.occupied_tile_positions.add(current_tile_key)
                     tiles_created += 1
+                    continue
+                
+                grass_tile = self.spawn_tile(
+                    self.grass_model_path, self.grass_model_scale,
+                    (x_position, -0.24, z_position),
+                    self.grass_tile_width, color.green
+                )
+                
+                self.tiles.append(grass_tile, z_position)
+                tiles_created += 1
+            
+            if chunk is not None:
+                self.finalize_lane_chunk(chunk)
             
-            print(f"✅ Rückwärts-Lane {z_index} erstellt mit {tiles_created} Tiles")
+            logger.debug("✅ Rückwärts-Lane %d erstellt mit %d Tiles", z_index, tiles_created)
+    
+    def prefetch_layouts(self, start_index, count):
+        """
+        Berechnet die Layouts kommender Lanes vorab in einem Schritt.
+        
+        Args:
+            start_index (int): Index der ersten Lane
+            count (int): Anzahl der Lanes
+        """
+        for layout in self.lane_layouts.layouts(start_index, count):
+            self.layout_cache[layout.index] = layout
     
     def extend_level(self, count=5):
         """
@@ -407,12 +714,9 @@ class WorldGenerator:
         Args:
             count (int): Anzahl der neuen Lanes
         """
-        if not self.lanes:
-            max_index = 0
-        else:
-            max_index = max([lane['index'] for lane in self.lanes])
+        max_index = self.lanes.max_index or 0
         
-        print(f"🌍 Erweitere Level von {max_index} bis {max_index + count}")
+        logger.debug("🌍 Erweitere Level von %d bis %d", max_index, max_index + count)
         
         for i in range(1, count + 1):
             self.create_lane(max_index + i)
@@ -424,34 +728,52 @@ class WorldGenerator:
         Args:
             player_z_position (float): Aktuelle Z-Position des Spielers
         """
-        cleanup_distance = self.settings["cleanup_distance"]
-        removed_tiles = 0
-        removed_lanes = 0
-        removed_trees = 0
+        threshold = player_z_position - self.settings["cleanup_distance"]
         
         # Tiles aufräumen
-        for tile in self.tiles[:]:
-            if tile.z < player_z_position - cleanup_distance:
-                tile_key = self.tile_key(tile.x, tile.z)
-                self.occupied_tile_positions.discard(tile_key)
-                destroy(tile)
-                self.tiles.remove(tile)
-                removed_tiles += 1
+        removed_tiles = self.tiles.pop_behind(threshold)
+        for tile in removed_tiles:
+            self.release_tile(tile)
         
         # Lanes aufräumen
-        for lane in self.lanes[:]:
-            if lane['z'] < player_z_position - cleanup_distance:
-                self.lanes.remove(lane)
-                removed_lanes += 1
+        removed_lanes = self.lanes.pop_behind(threshold)
+        for lane in removed_lanes:
+            self.world_grid.remove_lane(lane.index)
+        
+        # Lane-Chunks aufräumen (erst wenn alle Lanes des Chunks zu weit hinten sind)
+        while self.lane_chunks:
+            chunk = next(iter(self.lane_chunks.values()))
+            if chunk.max_z >= threshold:
+                break
+            self.lane_chunks.popitem(last=False)
+            destroy(chunk)
         
         # Bäume aufräumen
-        for tree in self.trees[:]:
-            if tree.z < player_z_position - cleanup_distance:
-                tree_key = self.tile_key(tree.x, tree.z)
-                self.occupied_tile_positions.discard(tree_key)
-                destroy(tree)
-                self.trees.remove(tree)
-                removed_trees += 1
-        
-        if removed_tiles > 0 or removed_lanes > 0 or removed_trees > 0:
-            print(f"🧹 Aufgeräumt: {removed_tiles} Tiles, {removed_lanes} Lanes, {removed_trees} Bäume")
\ No newline at end of file
+        removed_trees = self.trees.pop_behind(threshold)
+        for tree in removed_trees:
+            self.remove_tree(tree)
+        
+        if removed_tiles or removed_lanes or removed_trees:
+            logger.debug("🧹 Aufgeräumt: %d Tiles, %d Lanes, %d Bäume", len(removed_tiles), len(removed_lanes), len(removed_trees))
+    
+    def reset(self):
+        """Entfernt die gesamte Welt. Tiles wandern dabei zurück in den Pool, Lane-Chunks werden zerstört."""
+        for tile in self.tiles:
+            self.tile_pool.release(tile)
+        self.tiles.clear()
+        
+        for tree in self.trees:
+            self.remove_tree(tree)
+        self.trees.clear()
+        
+        for chunk in self.lane_chunks.values():
+            destroy(chunk)
+        self.lane_chunks.clear()
+        
+        self.lanes.clear()
+        self.world_grid.clear()
+        
+        # Ohne festen Seed bekommt jede Runde eine neue Welt
+        self.layout_cache.clear()
+        if self.settings.get("world_seed") is None:
+            self.lane_layouts.reseed()
\ No newline at end of file
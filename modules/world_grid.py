@@ -0,0 +1,132 @@
+class GridLane:
+    """Belegung einer einzelnen Lane im Welt-Raster."""
+    __slots__ = ('lane_type', 'tile_slots', 'blocked_columns')
+
+    def __init__(self, lane_type):
+        self.lane_type = lane_type
+        self.tile_slots = set()
+        self.blocked_columns = set()
+
+
+class WorldGrid:
+    """
+    Ganzzahliges Raster der Spielwelt: Lane-Index × Spalte.
+    Pro Lane werden Typ, belegte Tile-Plätze und blockierte Spalten (Bäume)
+    gespeichert. Es existieren nur Einträge für Lanes, die gerade in der Welt
+    sind, der Speicherbedarf wächst daher nicht mit der Spieldauer.
+    """
+
+    def __init__(self, tile_size=1):
+        self.tile_size = tile_size
+        self.lanes = {}
+
+    def column_at(self, x_position):
+        """
+        Ermittelt die Spalte zu einer X-Position.
+
+        Args:
+            x_position (float): X-Position
+
+        Returns:
+            int: Spalte im Raster
+        """
+        return round(x_position / self.tile_size)
+
+    def add_lane(self, lane_index, lane_type):
+        """
+        Legt eine Lane im Raster an.
+
+        Args:
+            lane_index (int): Index der Lane
+            lane_type (str): Typ der Lane ('road' oder 'grass')
+        """
+        self.lanes[lane_index] = GridLane(lane_type)
+
+    def remove_lane(self, lane_index):
+        """
+        Entfernt eine Lane samt Belegung aus dem Raster.
+
+        Args:
+            lane_index (int): Index der Lane
+        """
+        self.lanes.pop(lane_index, None)
+
+    def lane_type(self, lane_index):
+        """
+        Liefert den Typ einer Lane.
+
+        Args:
+            lane_index (int): Index der Lane
+
+        Returns:
+            str: Typ der Lane, None falls sie nicht existiert
+        """
+        lane = self.lanes.get(lane_index)
+        return lane.lane_type if lane else None
+
+    def claim_tile_slot(self, lane_index, slot):
+        """
+        Belegt einen Tile-Platz einer Lane.
+
+        Args:
+            lane_index (int): Index der Lane
+            slot (int): Nummer des Tile-Segments
+
+        Returns:
+            bool: False falls der Platz bereits belegt war
+        """
+        tile_slots = self.lanes[lane_index].tile_slots
+        if slot in tile_slots:
+            return False
+        tile_slots.add(slot)
+        return True
+
+    def add_blocker(self, lane_index, column):
+        """
+        Markiert eine Spalte einer Lane als blockiert.
+
+        Args:
+            lane_index (int): Index der Lane
+            column (int): Spalte
+
+        Returns:
+            bool: False falls die Spalte bereits blockiert war
+        """
+        blocked_columns = self.lanes[lane_index].blocked_columns
+        if column in blocked_columns:
+            return False
+        blocked_columns.add(column)
+        return True
+
+    def remove_blocker(self, lane_index, column):
+        """
+        Gibt eine blockierte Spalte einer Lane wieder frei.
+
+        Args:
+            lane_index (int): Index der Lane
+            column (int): Spalte
+        """
+        lane = self.lanes.get(lane_index)
+        if lane is not None:
+            lane.blocked_columns.discard(column)
+
+    def is_blocked(self, lane_index, column):
+        """
+        Prüft, ob eine Spalte einer Lane blockiert ist.
+
+        Args:
+            lane_index (int): Index der Lane
+            column (int): Spalte
+
+        Returns:
+            bool: True falls blockiert
+        """
+        lane = self.lanes.get(lane_index)
+        return lane is not None and column in lane.blocked_columns
+
+    def clear(self):
+        """Entfernt alle Lanes aus dem Raster."""
+        self.lanes.clear()
+
+    def __len__(self):
+        return len(self.lanes)
@@ -0,0 +1,83 @@
+from bisect import bisect_right
+from collections import deque
+
+class ZOrderedBuckets:
+    """
+    Sammelt Objekte in Buckets, die nach ihrer Z-Position sortiert sind.
+    Alles, was hinter eine Schwelle gefallen ist, liegt am Anfang und kann
+    ohne Durchsuchen der übrigen Objekte entfernt werden.
+    """
+
+    def __init__(self):
+        # Jeder Bucket ist ein Paar [z, items]
+        self.buckets = deque()
+        self.item_count = 0
+        # Zählt jede Änderung, damit Beobachter unveränderte Buckets überspringen können
+        self.version = 0
+
+    def append(self, item, z_position):
+        """
+        Fügt ein Objekt an seiner Z-Position ein.
+
+        Args:
+            item: Das Objekt
+            z_position (float): Z-Position des Objekts
+        """
+        self.item_count += 1
+        self.version += 1
+        if self.buckets:
+            last_bucket = self.buckets[-1]
+            if last_bucket[0] == z_position:
+                last_bucket[1].append(item)
+                return
+            if last_bucket[0] > z_position:
+                self.insert_out_of_order(item, z_position)
+                return
+        self.buckets.append([z_position, [item]])
+
+    def insert_out_of_order(self, item, z_position):
+        """
+        Fügt ein Objekt ein, das vor dem letzten Bucket liegt (selten, O(n)).
+
+        Args:
+            item: Das Objekt
+            z_position (float): Z-Position des Objekts
+        """
+        bucket_positions = [bucket[0] for bucket in self.buckets]
+        index = bisect_right(bucket_positions, z_position)
+        if index > 0 and bucket_positions[index - 1] == z_position:
+            self.buckets[index - 1][1].append(item)
+        else:
+            self.buckets.insert(index, [z_position, [item]])
+
+    def pop_behind(self, threshold):
+        """
+        Entfernt alle Objekte mit Z-Position kleiner als die Schwelle.
+        Kostet O(1), wenn nichts fällig ist, sonst O(Anzahl entfernter Objekte).
+
+        Args:
+            threshold (float): Z-Schwelle
+
+        Returns:
+            list: Die entfernten Objekte
+        """
+        removed = []
+        while self.buckets and self.buckets[0][0] < threshold:
+            removed.extend(self.buckets.popleft()[1])
+        if removed:
+            self.item_count -= len(removed)
+            self.version += 1
+        return removed
+
+    def clear(self):
+        """Entfernt alle Objekte."""
+        self.buckets.clear()
+        self.item_count = 0
+        self.version += 1
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            yield from bucket[1]
+
+    def __len__(self):
+        return self.item_count
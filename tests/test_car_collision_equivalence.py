@@ -0,0 +1,100 @@
+"""
+Gleichwertigkeitsprüfung für die Intervall-Kollision der Autos.
+
+Stellt Spieler und Autos zufällig um die Lane des Spielers herum auf und
+vergleicht für jede Stellung das Ergebnis von player.intersects(car) mit
+CarManager.check_lane_collision. Der Lane-Abstand kommt aus
+WorldGenerator.road_tile_length, also aus dem mitgelieferten Straßenmodell.
+Benötigt Ursina, läuft ohne sichtbares Fenster.
+"""
+import random
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+ursina = pytest.importorskip("ursina")
+
+TRIALS = 2000
+# Abstand zu den Intervallgrenzen, unterhalb dessen Rundungsunterschiede erlaubt sind
+EDGE_TOLERANCE = 1e-3
+
+
+@pytest.fixture(scope="module")
+def game():
+    # Modelle relativ zum Projektverzeichnis laden, nicht relativ zu pytest
+    ursina.application.asset_folder = Path(__file__).resolve().parent.parent
+    app = ursina.Ursina(window_type='none')
+
+    from modules.game_settings import GameSettings
+    from modules.car_manager import CarManager
+    from modules.model_metadata_cache import ModelMetadataCache
+    from modules.player import Player
+    from modules.world_generator import WorldGenerator
+
+    settings_manager = GameSettings()
+    metadata_cache = ModelMetadataCache()
+    world_generator = WorldGenerator(settings_manager.game_settings, metadata_cache)
+    world_generator.initialize_model_bounds()
+    car_manager = CarManager(settings_manager.game_settings, settings_manager.car_settings, metadata_cache)
+    player = Player(start_position=(0, 1.0, 0), metadata_cache=metadata_cache)
+    yield car_manager, player, world_generator.road_tile_length
+    car_manager.cleanup()
+    app.destroy()
+
+
+def place_car(car_manager, car, model_path, lane_index, lane_length, x, direction):
+    car.position = (x, 0.9, lane_index * lane_length)
+    car.rotation = (0, -90, 0) if direction == 1 else (0, 90, 0)
+    car.y -= car.scale_y * 0.25
+    car.lane_index = lane_index
+    car.sim_slot = car_manager.simulation.add(car, x, car.z, direction, 0.0) if car_manager.simulation else None
+    car_manager.assign_collision_box(car, model_path)
+    car_manager.lane_cars.setdefault(lane_index, deque()).append(car)
+
+
+def distance_to_edge(player, car):
+    """Kleinster Abstand zwischen den Intervallgrenzen, um Grenzfälle zu erkennen."""
+    from modules.collision_box import entity_world_box
+
+    (min_x, min_y, min_z), (max_x, max_y, max_z) = entity_world_box(player)
+    offset_x, half_x, car_min_y, car_max_y, car_min_z, car_max_z = car.collision_box
+    car_min_x = car.x + offset_x - half_x
+    car_max_x = car.x + offset_x + half_x
+    return min(
+        abs(car_min_x - max_x), abs(car_max_x - min_x),
+        abs(car_min_y - max_y), abs(car_max_y - min_y),
+        abs(car_min_z - max_z), abs(car_max_z - min_z)
+    )
+
+
+def test_lane_collision_matches_intersects(game):
+    car_manager, player, lane_length = game
+    random.seed(7)
+
+    mismatches = []
+    hits = 0
+    for trial in range(TRIALS):
+        car_manager.cleanup()
+        lane_index = random.randint(-2, 2)
+        player.position = (random.uniform(-6, 6), 1.0, lane_index * lane_length)
+        player.rotation_y = random.choice((0, 90, 180, -90))
+
+        cars = []
+        for offset in (-1, 0, 1):
+            model_path = random.choice(car_manager.car_models_small)
+            car = car_manager.car_pool.acquire(model_path, lambda: car_manager.create_car(model_path))
+            car.instance_handle = None
+            place_car(car_manager, car, model_path, lane_index + offset, lane_length,
+                      player.x + random.uniform(-4, 4), random.choice((-1, 1)))
+            car_manager.collider_policy.ensure_collider(car)
+            cars.append(car)
+
+        expected = any(player.intersects(car).hit for car in cars)
+        result = car_manager.check_lane_collision(player, lane_index)
+        hits += expected
+        if expected != result and min(distance_to_edge(player, car) for car in cars) >= EDGE_TOLERANCE:
+            mismatches.append((trial, expected, result))
+
+    assert 0 < hits < TRIALS
+    assert mismatches == []